@@ -0,0 +1,237 @@
+"""
+Behavior score cube for People Analytics.
+
+EvaluationAnalyzer answers its comparison queries (average score, score per
+criterion, year-over-year evolution) from the behavior scores of each
+evaluation. BehaviorScoreCube holds the scores of every evaluation at once as
+a sparse cube over (pessoa, ano, direcionador, comportamento, avaliador): one
+row per scored avaliador, with integer label codes and the collaborator and
+group scores in flat arrays.
+
+The rows of an evaluation are contiguous and follow the order of
+get_behavior_scores. Aggregates add them in that order (np.bincount sums
+sequentially), so they equal the results of walking the nested dicts.
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Label levels of the cube below pessoa and ano
+LEVELS = ("direcionador", "comportamento", "avaliador")
+
+
+def _mean(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Divide sums by counts, with 0.0 where there is nothing to average."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(counts > 0, sums / counts, 0.0)
+
+
+class BehaviorScoreCube:
+    """Collaborator and group scores indexed by evaluation and labels."""
+
+    def __init__(self):
+        """Initialize an empty cube (see from_behavior_scores)."""
+        self.evaluations: List[Tuple[str, str]] = []
+        self.labels: Dict[str, List[Any]] = {level: [] for level in LEVELS}
+        self._positions: Dict[Tuple[str, str], int] = {}
+        self._label_codes: Dict[str, Dict[Any, int]] = {level: {} for level in LEVELS}
+        self.offsets = np.zeros(1, dtype=np.int64)
+        self.evaluation = np.zeros(0, dtype=np.int32)
+        self.codes = {level: np.zeros(0, dtype=np.int32) for level in LEVELS}
+        self.score_colaborador = np.zeros(0, dtype=np.float64)
+        self.score_grupo = np.zeros(0, dtype=np.float64)
+        self._totals = None
+        self._criterion_totals = None
+
+    @classmethod
+    def from_behavior_scores(
+        cls, behavior_scores: Iterable[Tuple[str, str, Dict[str, Any]]]
+    ) -> "BehaviorScoreCube":
+        """Build a cube from the behavior scores of many evaluations.
+
+        Args:
+            behavior_scores: (pessoa, ano, scores) tuples, where scores has
+                the structure returned by get_behavior_scores
+
+        Returns:
+            The cube
+        """
+        cube = cls()
+        offsets = array("q", [0])
+        evaluation = array("i")
+        codes = {level: array("i") for level in LEVELS}
+        score_colaborador = array("d")
+        score_grupo = array("d")
+
+        for person, year, scores in behavior_scores:
+            position = len(cube.evaluations)
+            cube.evaluations.append((person, year))
+            cube._positions[(person, year)] = position
+            for dir_name, comportamentos in scores.items():
+                dir_code = cube._code("direcionador", dir_name)
+                for comp_name, data in comportamentos.items():
+                    comp_code = cube._code("comportamento", comp_name)
+                    for avaliador, scores_data in data["scores"].items():
+                        evaluation.append(position)
+                        codes["direcionador"].append(dir_code)
+                        codes["comportamento"].append(comp_code)
+                        codes["avaliador"].append(cube._code("avaliador", avaliador))
+                        score_colaborador.append(scores_data["score_colaborador"])
+                        score_grupo.append(scores_data["score_grupo"])
+            offsets.append(len(evaluation))
+
+        cube.offsets = np.frombuffer(offsets, dtype=np.int64)
+        cube.evaluation = np.frombuffer(evaluation, dtype=np.int32)
+        cube.codes = {
+            level: np.frombuffer(values, dtype=np.int32)
+            for level, values in codes.items()
+        }
+        cube.score_colaborador = np.frombuffer(score_colaborador, dtype=np.float64)
+        cube.score_grupo = np.frombuffer(score_grupo, dtype=np.float64)
+        return cube
+
+    def _code(self, level: str, label: Any) -> int:
+        """Return the code of a label, adding it to the level if needed."""
+        codes = self._label_codes[level]
+        code = codes.get(label)
+        if code is None:
+            code = len(self.labels[level])
+            self.labels[level].append(label)
+            codes[label] = code
+        return code
+
+    def __len__(self) -> int:
+        return len(self.score_colaborador)
+
+    def __contains__(self, evaluation: object) -> bool:
+        return evaluation in self._positions
+
+    def rows(self, person: str, year: str) -> slice:
+        """Return the rows of an evaluation (empty if it has no scores)."""
+        position = self._positions.get((person, year))
+        if position is None:
+            return slice(0, 0)
+        return slice(int(self.offsets[position]), int(self.offsets[position + 1]))
+
+    def _evaluation_totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum and count of the collaborator scores of each evaluation.
+
+        A trailing zero entry stands for unknown evaluations (position -1).
+        """
+        if self._totals is None:
+            size = len(self.evaluations) + 1
+            self._totals = (
+                np.bincount(
+                    self.evaluation, weights=self.score_colaborador, minlength=size
+                ),
+                np.bincount(self.evaluation, minlength=size),
+            )
+        return self._totals
+
+    def _direcionador_totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sum and count of the collaborator scores per evaluation and direcionador.
+
+        A trailing zero row and column stand for unknown evaluations and
+        direcionadores (position -1).
+        """
+        if self._criterion_totals is None:
+            shape = (len(self.evaluations) + 1, len(self.labels["direcionador"]) + 1)
+            cells = (
+                self.evaluation.astype(np.int64) * shape[1] + self.codes["direcionador"]
+            )
+            size = shape[0] * shape[1]
+            self._criterion_totals = (
+                np.bincount(
+                    cells, weights=self.score_colaborador, minlength=size
+                ).reshape(shape),
+                np.bincount(cells, minlength=size).reshape(shape),
+            )
+        return self._criterion_totals
+
+    def _positions_of(self, evaluations: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """Positions of evaluations in the cube, -1 for unknown ones."""
+        return np.array(
+            [self._positions.get(tuple(evaluation), -1) for evaluation in evaluations],
+            dtype=np.int64,
+        )
+
+    def average_scores(self, evaluations: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """Mean collaborator score of each evaluation.
+
+        Args:
+            evaluations: (pessoa, ano) pairs
+
+        Returns:
+            One mean per pair, 0.0 for pairs without scores
+        """
+        sums, counts = self._evaluation_totals()
+        positions = self._positions_of(evaluations)
+        return _mean(sums[positions], counts[positions])
+
+    def criterion_scores(
+        self, evaluations: Sequence[Tuple[str, str]], criteria: Sequence[Any]
+    ) -> np.ndarray:
+        """Mean collaborator score of each evaluation for each direcionador.
+
+        Args:
+            evaluations: (pessoa, ano) pairs
+            criteria: Direcionador names
+
+        Returns:
+            Array of shape (len(evaluations), len(criteria)), 0.0 where an
+            evaluation has no scores for a direcionador
+        """
+        sums, counts = self._direcionador_totals()
+        positions = self._positions_of(evaluations)[:, None]
+        columns = np.array(
+            [self._label_codes["direcionador"].get(name, -1) for name in criteria],
+            dtype=np.int64,
+        )[None, :]
+        return _mean(sums[positions, columns], counts[positions, columns])
+
+    def behavior_scores(self, person: str, year: str) -> Dict[Any, Dict[Any, List]]:
+        """Collaborator scores of an evaluation by direcionador and comportamento.
+
+        Returns:
+            Nested dict with the scores of each behavior in avaliador order;
+            behaviors without scores are left out
+        """
+        rows = self.rows(person, year)
+        result = {}
+        for dir_code, comp_code, score in zip(
+            self.codes["direcionador"][rows].tolist(),
+            self.codes["comportamento"][rows].tolist(),
+            self.score_colaborador[rows].tolist(),
+        ):
+            comportamentos = result.setdefault(
+                self.labels["direcionador"][dir_code], {}
+            )
+            comportamentos.setdefault(
+                self.labels["comportamento"][comp_code], []
+            ).append(score)
+        return result
+
+    def frame(self) -> pd.DataFrame:
+        """Return the cube as a DataFrame indexed by evaluation and labels."""
+        people, years = zip(*self.evaluations) if self.evaluations else ((), ())
+        index = pd.MultiIndex.from_arrays(
+            [
+                np.asarray(people, dtype=object)[self.evaluation],
+                np.asarray(years, dtype=object)[self.evaluation],
+            ]
+            + [
+                np.asarray(self.labels[level], dtype=object)[self.codes[level]]
+                for level in LEVELS
+            ],
+            names=["pessoa", "ano", *LEVELS],
+        )
+        return pd.DataFrame(
+            {
+                "score_colaborador": self.score_colaborador,
+                "score_grupo": self.score_grupo,
+            },
+            index=index,
+        )
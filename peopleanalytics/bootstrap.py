@@ -0,0 +1,214 @@
+"""
+Bootstrap confidence intervals for People Analytics.
+
+Ratings are ordinal counts over six buckets (n/a, referência, sempre, quase
+sempre, poucas vezes, raramente), so the parametric t interval of
+StatisticalAnalyzer.calculate_confidence_intervals does not describe the
+uncertainty of a score well. BootstrapEngine resamples each frequency vector
+as a multinomial draw with the vector's own proportions, scores every resample
+with a scoring_engine model and takes percentile intervals.
+
+All vectors are resampled at once: the rows are split into fixed-size chunks,
+each chunk drawing every resample in a single NumPy call, optionally in a
+process pool. Each chunk seeds its own generator from the engine seed and the
+chunk position, so results are reproducible and do not depend on the number
+of workers.
+"""
+
+import concurrent.futures
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .scoring_engine import SCORE_MODELS
+
+# Confidence interval methods understood by the report generators
+CI_METHODS = ("fixed", "bootstrap")
+
+# Resamples drawn per frequency vector
+DEFAULT_RESAMPLES = 2000
+
+# Frequency vectors resampled together by one chunk
+DEFAULT_CHUNK_ROWS = 256
+
+
+def _resample_chunk(
+    matrices: Sequence[np.ndarray],
+    sample_sizes: Sequence[np.ndarray],
+    n_resamples: int,
+    model: str,
+    seed: np.random.SeedSequence,
+) -> List[np.ndarray]:
+    """Score the bootstrap resamples of a chunk of rows.
+
+    Module-level so that process pool workers can run it.
+
+    Args:
+        matrices: (n, 6) frequency matrices, resampled in order with the
+            same generator
+        sample_sizes: Number of ratings drawn for each row of each matrix
+        n_resamples: Resamples drawn per row
+        model: Name from scoring_engine.SCORE_MODELS
+        seed: Seed of the chunk generator
+
+    Returns:
+        One (n, n_resamples) score array per matrix
+    """
+    rng = np.random.default_rng(seed)
+    scores = []
+    for frequencies, sizes in zip(matrices, sample_sizes):
+        totals = frequencies.sum(axis=1, keepdims=True)
+        rated = (totals > 0) & (sizes[:, None] > 0)
+        # Rows without ratings draw nothing; any valid proportions will do
+        pvals = np.where(rated, frequencies / np.where(rated, totals, 1.0), 1 / 6)
+        draws = rng.multinomial(
+            np.where(rated[:, 0], sizes, 0), pvals, size=(n_resamples, len(sizes))
+        )
+        values = SCORE_MODELS[model](draws.reshape(-1, 6).astype(np.float64))
+        scores.append(values.reshape(n_resamples, len(sizes)).T)
+    return scores
+
+
+class BootstrapEngine:
+    """Multinomial bootstrap of frequency vector scores."""
+
+    def __init__(
+        self,
+        n_resamples: int = DEFAULT_RESAMPLES,
+        confidence: float = 0.95,
+        seed: int = 0,
+        workers: int = 0,
+        chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    ):
+        """Initialize the engine.
+
+        Args:
+            n_resamples: Resamples drawn per frequency vector
+            confidence: Confidence level of the intervals
+            seed: Seed of the random generators
+            workers: Process pool size; 0 or 1 resamples in this process
+            chunk_rows: Frequency vectors resampled together by one chunk
+        """
+        self.n_resamples = n_resamples
+        self.confidence = confidence
+        self.seed = seed
+        self.workers = workers
+        self.chunk_rows = chunk_rows
+
+    def resample_scores(
+        self,
+        matrices: Sequence[np.ndarray],
+        model: str = "normalized",
+        sample_sizes: Optional[Sequence[np.ndarray]] = None,
+    ) -> List[np.ndarray]:
+        """Score the bootstrap resamples of aligned frequency matrices.
+
+        Args:
+            matrices: (N, 6) frequency matrices with the same number of rows
+            model: Name from scoring_engine.SCORE_MODELS
+            sample_sizes: Ratings drawn for each row of each matrix; by
+                default each row's total, rounded (frequencies that are
+                averages or percentages should pass their real counts)
+
+        Returns:
+            One (N, n_resamples) score array per matrix
+
+        Raises:
+            ValueError: If a matrix is not (N, 6) or the model is unknown
+        """
+        if model not in SCORE_MODELS:
+            raise ValueError(f"Unknown scoring model: {model}")
+        matrices = [np.asarray(matrix, dtype=np.float64) for matrix in matrices]
+        rows = len(matrices[0]) if matrices else 0
+        for matrix in matrices:
+            if matrix.ndim != 2 or matrix.shape != (rows, 6):
+                raise ValueError(
+                    f"Frequency matrices must be ({rows}, 6), got {matrix.shape}"
+                )
+        if sample_sizes is None:
+            sample_sizes = [np.rint(matrix.sum(axis=1)) for matrix in matrices]
+        sample_sizes = [np.asarray(sizes, dtype=np.int64) for sizes in sample_sizes]
+
+        starts = range(0, rows, self.chunk_rows)
+        seeds = np.random.SeedSequence(self.seed).spawn(len(starts))
+        chunks = [
+            (
+                [matrix[start : start + self.chunk_rows] for matrix in matrices],
+                [sizes[start : start + self.chunk_rows] for sizes in sample_sizes],
+                self.n_resamples,
+                model,
+                seed,
+            )
+            for start, seed in zip(starts, seeds)
+        ]
+
+        if self.workers > 1 and len(chunks) > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(self.workers, len(chunks))
+            ) as executor:
+                results = list(executor.map(_resample_chunk, *zip(*chunks)))
+        else:
+            results = [_resample_chunk(*chunk) for chunk in chunks]
+
+        if not results:
+            return [np.zeros((0, self.n_resamples)) for _ in matrices]
+        return [
+            np.concatenate([result[i] for result in results])
+            for i in range(len(matrices))
+        ]
+
+    def percentile_intervals(self, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Percentile interval of each row of resampled scores."""
+        alpha = (1 - self.confidence) / 2
+        if len(scores) == 0:
+            return np.zeros(0), np.zeros(0)
+        lower, upper = np.quantile(scores, [alpha, 1 - alpha], axis=1)
+        return lower, upper
+
+    def score_intervals(
+        self,
+        frequencies: np.ndarray,
+        model: str = "normalized",
+        sample_sizes: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Confidence interval of the score of each frequency vector.
+
+        Args:
+            frequencies: (N, 6) frequency matrix
+            model: Name from scoring_engine.SCORE_MODELS
+            sample_sizes: Ratings behind each row (see resample_scores)
+
+        Returns:
+            Tuple with the (lower, upper) bound arrays
+        """
+        (scores,) = self.resample_scores(
+            [frequencies],
+            model,
+            None if sample_sizes is None else [sample_sizes],
+        )
+        return self.percentile_intervals(scores)
+
+    def gap_intervals(
+        self,
+        individual: np.ndarray,
+        group: np.ndarray,
+        model: str = "normalized",
+        sample_sizes: Optional[Sequence[np.ndarray]] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Confidence interval of the individual minus group score of each pair.
+
+        The individual and group vectors are resampled independently.
+
+        Args:
+            individual: (N, 6) individual frequency matrix
+            group: (N, 6) group frequency matrix
+            model: Name from scoring_engine.SCORE_MODELS
+            sample_sizes: Individual and group ratings behind each row
+
+        Returns:
+            Tuple with the (lower, upper) bound arrays
+        """
+        individual_scores, group_scores = self.resample_scores(
+            [individual, group], model, sample_sizes
+        )
+        return self.percentile_intervals(individual_scores - group_scores)
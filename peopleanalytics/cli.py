@@ -18,6 +18,11 @@ from peopleanalytics.cli_commands.skills_commands import (
     SkillsRadarCommand,
 )
 from peopleanalytics.cli_commands.sync_commands import SyncCommand
+from peopleanalytics.parse_cache import (
+    DEFAULT_PARSE_CACHE_DIR,
+    DEFAULT_PARSE_CACHE_MAX_BYTES,
+    configure,
+)
 
 
 def main():
@@ -96,6 +101,12 @@ class CLI:
             show_skills_analyzer_help()
             return 0
 
+        # Share parsed resultado files between commands and runs
+        configure(
+            None if parsed_args.no_parse_cache else parsed_args.parse_cache,
+            parsed_args.parse_cache_max_mb * 1024 * 1024,
+        )
+
         # Get the command object
         command = self._commands.get(parsed_args.command)
         if not command:
@@ -138,6 +149,26 @@ class CLI:
         parser.add_argument(
             "--version", action="store_true", help="Print version and exit"
         )
+        parser.add_argument(
+            "--parse-cache",
+            type=str,
+            default=str(DEFAULT_PARSE_CACHE_DIR),
+            help="Directory of the shared cache of parsed resultado files",
+        )
+        parser.add_argument(
+            "--parse-cache-max-mb",
+            type=int,
+            default=DEFAULT_PARSE_CACHE_MAX_BYTES // (1024 * 1024),
+            help=(
+                "Size bound of the parse cache in MB; the least recently used "
+                "entries are deleted beyond it"
+            ),
+        )
+        parser.add_argument(
+            "--no-parse-cache",
+            action="store_true",
+            help="Parse every file again instead of using the parse cache",
+        )
 
         # Add subcommands
         subparsers = parser.add_subparsers(dest="command", help="Command to run")
@@ -5,7 +5,6 @@ This module contains commands for data synchronization and documentation generat
 """
 
 import argparse
-import json
 import logging
 import os
 import random
@@ -15,9 +14,29 @@ from pathlib import Path
 
 # Configure matplotlib to use non-interactive backend
 import matplotlib
+import pandas as pd
 
 matplotlib.use("Agg")  # Set backend to Agg (non-interactive)
 
+from peopleanalytics import tabular_stream
+from peopleanalytics.parse_cache import load_json_cached, loads_cached
+from peopleanalytics.sync_discovery import DEFAULT_INCLUDE_PATTERNS, discover_work_items
+from peopleanalytics.sync_io import AsyncDirectoryLoader
+from peopleanalytics.sync_manifest import SyncManifest
+from peopleanalytics.sync_shard import (
+    find_artifact_counts,
+    merge_artifacts,
+    parse_shard,
+    shard_of,
+    write_artifact,
+)
+from peopleanalytics.sync_summary import summarize_output
+from peopleanalytics.sync_watch import (
+    DEFAULT_DEBOUNCE,
+    DEFAULT_POLL_INTERVAL,
+    SyncWatcher,
+)
+
 # Import the EvaluationScore class
 
 
@@ -93,6 +112,23 @@ class SyncCommand:
             action="store_true",
             help="Ignore errors and continue processing",
         )
+        parser.add_argument(
+            "--include",
+            action="append",
+            metavar="PATTERN",
+            help="Glob of result files to process (repeatable, default: resultado.*)",
+        )
+        parser.add_argument(
+            "--exclude",
+            action="append",
+            metavar="PATTERN",
+            help="Glob of result files to skip (repeatable)",
+        )
+        parser.add_argument(
+            "--no-incremental",
+            action="store_true",
+            help="Disable the sync manifest and reprocess every directory",
+        )
 
         # Output format settings
         parser.add_argument(
@@ -231,7 +267,56 @@ class SyncCommand:
             "--batch-size",
             type=int,
             default=0,
-            help="Batch size for parallel processing (0 = all)",
+            help="Directories per batch; each batch is flushed to disk and only compact summaries are kept in memory (0 = all at once)",
+        )
+        parser.add_argument(
+            "--executor",
+            choices=["thread", "process"],
+            default="thread",
+            help="Pool used for parallel processing (process parses files in worker processes)",
+        )
+        parser.add_argument(
+            "--io-concurrency",
+            type=int,
+            default=0,
+            help="Read result files asynchronously with up to N reads in flight, decoding them in the --workers pool (0 = disabled)",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep running and resync pessoa/ano directories as their files change",
+        )
+        parser.add_argument(
+            "--watch-interval",
+            type=float,
+            default=DEFAULT_POLL_INTERVAL,
+            help="Seconds between polls of the data directory in watch mode",
+        )
+        parser.add_argument(
+            "--debounce",
+            type=float,
+            default=DEFAULT_DEBOUNCE,
+            help="Seconds without changes before a burst of writes is resynced",
+        )
+        parser.add_argument(
+            "--shard",
+            type=str,
+            metavar="I/N",
+            help="Process only the pessoas of shard I of N and write a shard artifact for --merge",
+        )
+        parser.add_argument(
+            "--merge",
+            nargs="?",
+            type=int,
+            const=0,
+            metavar="N",
+            help="Combine the shard artifacts (of N shards) and run the cross-person analytics",
+        )
+        parser.add_argument(
+            "--chunk-rows",
+            type=int,
+            default=0,
+            help="Rows read at a time from CSV and Excel result files (0 = default)",
         )
 
         # Output control
@@ -281,6 +366,12 @@ class SyncCommand:
         self.logger.info("Starting sync command")
         self.logger.info(f"Arguments: {args}")
 
+        shard = args.shard
+        merge = args.merge
+        watch = args.watch
+        if sum([shard is not None, merge is not None, watch]) > 1:
+            raise ValueError("--shard, --merge and --watch cannot be combined")
+
         data_sync = DataSync(
             data_dir=args.data_dir,
             output_dir=args.output_dir,
@@ -296,10 +387,17 @@ class SyncCommand:
             generate_career_sim=not args.no_career_sim,
             generate_network=not args.no_network,
             force=args.force,
+            incremental=not args.no_incremental,
+            include=args.include,
+            exclude=args.exclude,
             ignore_errors=args.ignore_errors,
             use_parallel=not args.no_parallel,
             workers=args.workers,
             batch_size=args.batch_size,
+            executor=args.executor,
+            io_concurrency=args.io_concurrency,
+            chunk_rows=args.chunk_rows,
+            shard=shard,
             report_output_dir=args.report_output_dir,
             analysis_output_dir=args.analysis_output_dir,
             talent_report_dir=args.talent_report_dir,
@@ -312,7 +410,12 @@ class SyncCommand:
             generate_sentiment_analysis=args.sentiment_analysis,
         )
 
-        data_sync.sync()
+        if watch:
+            data_sync.watch(interval=args.watch_interval, debounce=args.debounce)
+        elif merge is not None:
+            data_sync.merge_shards(merge or None)
+        else:
+            data_sync.sync()
 
         end_time = time.time()
         elapsed_time = end_time - start_time
@@ -334,6 +437,9 @@ class DataSync:
         self.output_dir = Path(kwargs.get("output_dir", "output"))
         self.workers = kwargs.get("workers")
         self.batch_size = kwargs.get("batch_size")
+        self.executor = kwargs.get("executor", "thread")
+        self.io_concurrency = kwargs.get("io_concurrency") or 0
+        self.chunk_rows = kwargs.get("chunk_rows") or tabular_stream.DEFAULT_CHUNK_ROWS
         self.skip_viz = not kwargs.get("generate_visualizations", True)
         self.formats = []
         self.ignore_errors = kwargs.get("ignore_errors", False)
@@ -345,6 +451,7 @@ class DataSync:
         self.generate_json = kwargs.get("generate_json", False)
         self.verbose = kwargs.get("verbose", False)
         self.processed_directories = []
+        self.processed_data = {}
         self.errors = []
         self.logger = kwargs.get("logger", logging.getLogger("sync"))
         self.total_progress = 0
@@ -393,6 +500,20 @@ class DataSync:
         self.force = kwargs.get("force", False)
         self.reprocess = self.force  # For backward compatibility
 
+        # Result file patterns, matched against file names or pessoa/ano/file
+        self.include_patterns = kwargs.get("include") or list(DEFAULT_INCLUDE_PATTERNS)
+        self.exclude_patterns = kwargs.get("exclude") or []
+
+        # Incremental sync: skip directories unchanged since the last run
+        self.incremental = kwargs.get("incremental", True)
+        self.manifest = None
+        self.skipped_directories = []
+        self.work_items = ()
+
+        # Sharded sync: (index, count) of the pessoas processed by this run
+        shard = kwargs.get("shard")
+        self.shard = parse_shard(shard) if isinstance(shard, str) else shard
+
         # File format mapping
         self.valid_formats = {
             "json": [".json"],
@@ -466,62 +587,44 @@ class DataSync:
             # Ensure directories exist
             self._ensure_directories()
 
-            # Process the pessoa/ano structure
-            valid_directories = self._process_pessoa_ano_structure()
+            # Discover the pessoa/ano directories to sync in a single walk
+            work_items = self._discover_work_items()
+            if self.shard is not None:
+                work_items = self._select_shard(work_items)
+            self.work_items = work_items
 
-            if not valid_directories:
+            if not work_items:
                 message = "No valid directories found for processing"
                 results.append(message)
                 self.logger.warning(message)
+                if self.shard is not None:
+                    # An empty shard still completes the set for --merge
+                    self._write_shard_artifact(results)
                 return results
 
             # Print summary of what will be processed
-            self._print_processing_summary(valid_directories)
+            self._print_processing_summary(work_items)
 
             # Initialize progress tracking
-            self.total_progress = len(valid_directories)
+            self.total_progress = len(work_items)
             self.current_progress = 0
 
             # Track processed data for aggregated reports
             self.processed_data = {}
 
-            # Convert Path objects to dictionary format for processing
-            formatted_directories = []
-            for dir_path in valid_directories:
-                pessoa_dir = dir_path.parent
-                ano_dir = dir_path
-                result_files = list(ano_dir.glob("resultado.*"))
-
-                formatted_directories.append(
-                    {
-                        "pessoa": pessoa_dir.name,
-                        "ano": ano_dir.name,
-                        "files": result_files,
-                        "path": str(ano_dir),
-                    }
+            # Reuse cached outputs of directories unchanged since the last sync
+            pending_items = self._filter_unchanged_directories(work_items)
+            if self.skipped_directories:
+                results.append(
+                    f"Skipped {len(self.skipped_directories)} unchanged directories"
                 )
 
-            # Process directories (sequential or parallel)
+            # Process directories and record them in the manifest
             success = True
-            if not self.no_parallel:
-                # Convert Path objects to dictionary format for _process_directories_parallel
-                formatted_directories = []
-                for dir_path in valid_directories:
-                    pessoa_dir = dir_path.parent
-                    ano_dir = dir_path
-                    result_files = list(ano_dir.glob("resultado.*"))
-
-                    formatted_directories.append(
-                        {
-                            "pessoa": pessoa_dir.name,
-                            "ano": ano_dir.name,
-                            "files": result_files,
-                            "path": str(ano_dir),
-                        }
-                    )
-                success = self._process_directories_parallel(formatted_directories)
+            if not pending_items:
+                self.logger.info("All directories are up to date")
             else:
-                success = self._process_directories_sequential(valid_directories)
+                success = self._process_work_items(pending_items)
 
             # Complete processing
             if success:
@@ -541,116 +644,12 @@ class DataSync:
                     for error in self.errors:
                         results.append(f"  - {error}")
 
-            # Collect all people data for reports
-            all_people_data = self._collect_all_people_data()
-
-            # Generate advanced analytics if enabled
-            if self.time_series_forecast:
-                try:
-                    results.append("Generating time series forecasting...")
-                    if self._generate_time_series_forecast(all_people_data):
-                        results.append("Time series forecasting generated successfully")
-                    else:
-                        results.append("Error generating time series forecasting")
-                except Exception as e:
-                    error_msg = f"Error generating time series forecasting: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            if self.competency_gap_analysis:
-                try:
-                    results.append("Generating enhanced competency gap analysis...")
-                    if self._generate_competency_gap_analysis(all_people_data):
-                        results.append("Competency gap analysis generated successfully")
-                    else:
-                        results.append("Error generating competency gap analysis")
-                except Exception as e:
-                    error_msg = f"Error generating competency gap analysis: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            if self.advanced_network_metrics:
-                try:
-                    results.append("Generating advanced network metrics...")
-                    if self._generate_advanced_network_metrics(all_people_data):
-                        results.append(
-                            "Advanced network metrics generated successfully"
-                        )
-                    else:
-                        results.append("Error generating advanced network metrics")
-                except Exception as e:
-                    error_msg = f"Error generating advanced network metrics: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            if self.ml_insights:
-                try:
-                    results.append("Generating machine learning insights...")
-                    if self._generate_ml_insights(all_people_data):
-                        results.append(
-                            "Machine learning insights generated successfully"
-                        )
-                    else:
-                        results.append("Error generating machine learning insights")
-                except Exception as e:
-                    error_msg = f"Error generating machine learning insights: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            if self.sentiment_analysis:
-                try:
-                    results.append("Generating sentiment analysis...")
-                    if self._generate_sentiment_analysis(all_people_data):
-                        results.append("Sentiment analysis generated successfully")
-                    else:
-                        results.append("Error generating sentiment analysis")
-                except Exception as e:
-                    error_msg = f"Error generating sentiment analysis: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            if self.advanced_visualizations:
-                try:
-                    results.append("Generating advanced visualizations...")
-                    if self._generate_advanced_visualizations(all_people_data):
-                        results.append("Advanced visualizations generated successfully")
-                    else:
-                        results.append("Error generating advanced visualizations")
-                except Exception as e:
-                    error_msg = f"Error generating advanced visualizations: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    if not self.ignore_errors:
-                        raise
-
-            # Generate talent development reports if any are enabled
-            if self.use_9box or self.use_career_sim or self.use_network:
-                try:
-                    results.append("Generating talent development reports...")
-                    if self._generate_talent_development_reports(all_people_data):
-                        results.append(
-                            "Talent development reports generated successfully"
-                        )
-                    else:
-                        results.append("Error generating talent development reports")
-                except Exception as e:
-                    error_msg = f"Error generating talent development reports: {str(e)}"
-                    results.append(error_msg)
-                    self.logger.error(error_msg, exc_info=True)
-                    self.errors.append(error_msg)
-                    success = False
-                    if not self.ignore_errors:
-                        raise
+            # Generate the aggregate reports over all people data; shards
+            # leave them to the merge step
+            if self.shard is not None:
+                self._write_shard_artifact(results)
+            elif not self._run_aggregate_stages(results):
+                success = False
 
             # Update progress
             self.current_progress += 1
@@ -666,67 +665,688 @@ class DataSync:
 
         return success
 
+    def watch(
+        self,
+        interval=DEFAULT_POLL_INTERVAL,
+        debounce=DEFAULT_DEBOUNCE,
+        max_cycles=None,
+    ):
+        """
+        Sync once, then keep watching the data directory and resync changes.
+
+        The DataSync instance stays warm between changes: processed_data,
+        the manifest and the imported report modules are reused, and only the
+        modified pessoa/ano directories are reprocessed before the aggregate
+        reports are regenerated.
+
+        Args:
+            interval: Seconds between polls of the data directory
+            debounce: Seconds the data must stay unchanged before resyncing
+            max_cycles: Stop after this many polls (runs until interrupted
+                when None)
+        """
+        self.sync()
+
+        watcher = SyncWatcher(
+            self._discover_work_items,
+            self.sync_changes,
+            interval=interval,
+            debounce=debounce,
+            data_dir=self.data_dir,
+            logger=self.logger,
+        )
+        self.logger.info(
+            f"Watching {self.data_dir} for changes (every {interval}s, "
+            f"debounce {debounce}s)"
+        )
+        try:
+            watcher.run(baseline=self.work_items, max_cycles=max_cycles)
+        except KeyboardInterrupt:
+            self.logger.info("Watch stopped")
+
+    def sync_changes(self, work_items, changed, removed):
+        """
+        Resync the directories that changed since the last sync.
+
+        Directories whose files were only touched (same content hash in the
+        manifest) are left alone; if nothing really changed, the aggregate
+        reports are not regenerated.
+
+        Args:
+            work_items: All work items currently in the data directory
+            changed: Work items of new or modified directories
+            removed: (pessoa, ano) keys of removed directories
+
+        Returns:
+            List of result messages
+        """
+        results = []
+        self.work_items = work_items
+        self.processed_directories = []
+        self.errors = []
+
+        for pessoa, ano in removed:
+            outputs = self.processed_data.get(pessoa, {})
+            outputs.pop(ano, None)
+            if pessoa in self.processed_data and not outputs:
+                del self.processed_data[pessoa]
+        if removed and self.manifest is not None:
+            self.manifest.forget_missing(
+                SyncManifest.directory_key(d.pessoa, d.ano) for d in work_items
+            )
+            self.manifest.save()
+
+        pending = []
+        for directory in changed:
+            try:
+                unchanged = (
+                    self.manifest is not None
+                    and not self.force
+                    and directory.ano in self.processed_data.get(directory.pessoa, {})
+                    and self.manifest.is_unchanged(
+                        directory.pessoa, directory.ano, directory.tracked_files
+                    )
+                )
+            except OSError:
+                unchanged = False
+            if not unchanged:
+                pending.append(directory)
+
+        if not (pending or removed):
+            return results
+
+        self.total_progress = len(pending)
+        self.current_progress = 0
+        message = (
+            f"Resyncing {len(pending)} changed and {len(removed)} removed directories"
+        )
+        results.append(message)
+        self.logger.info(message)
+
+        try:
+            if pending and not self._process_work_items(pending):
+                results.append(
+                    f"Process completed with errors in {len(self.errors)} directories"
+                )
+            self._run_aggregate_stages(results)
+        except Exception as e:
+            # Keep watching; the next change retries the failed directories
+            error_msg = f"Error resyncing changes: {e}"
+            results.append(error_msg)
+            self.logger.error(error_msg, exc_info=True)
+
+        return results
+
+    def merge_shards(self, count=None):
+        """
+        Combine the artifacts of a sharded sync and run the aggregate stages.
+
+        Args:
+            count: Number of shards (inferred from the artifacts when None)
+
+        Returns:
+            bool: True if the merge and the aggregate stages succeeded
+
+        Raises:
+            FileNotFoundError: If there are no artifacts or one is missing
+            ValueError: If the shard count is ambiguous or an artifact is
+                incompatible
+        """
+        results = []
+        shards_dir = self._shards_dir()
+        if count is None:
+            counts = find_artifact_counts(shards_dir)
+            if not counts:
+                raise FileNotFoundError(f"No shard artifacts found in {shards_dir}")
+            if len(counts) > 1:
+                raise ValueError(
+                    f"Shard artifacts for several shard counts {counts} in "
+                    f"{shards_dir}; pass the count to --merge"
+                )
+            count = counts[0]
+
+        merged = merge_artifacts(shards_dir, count)
+        self._ensure_directories()
+        self.processed_data = merged["processed_data"]
+        self.processed_directories = merged["processed_directories"]
+        self.errors = merged["errors"]
+
+        message = (
+            f"Merged {count} shards: {len(self.processed_data)} pessoas, "
+            f"{len(self.processed_directories)} processed directories"
+        )
+        results.append(message)
+        self.logger.info(message)
+        for error in self.errors:
+            self.logger.warning(f"Shard error: {error}")
+
+        success = not self.errors
+        if not self._run_aggregate_stages(results):
+            success = False
+        return success
+
+    def _select_shard(self, work_items):
+        """
+        Keep the work items of the pessoas assigned to this run's shard.
+
+        Args:
+            work_items: All discovered work items
+
+        Returns:
+            tuple: Work items of the shard
+        """
+        index, count = self.shard
+        selected = tuple(
+            item for item in work_items if shard_of(item.pessoa, count) == index
+        )
+        self.logger.info(
+            f"Shard {index}/{count}: {len(selected)} of {len(work_items)} directories"
+        )
+        return selected
+
+    def _manifest_dir(self):
+        """Return the sync manifest directory; each shard keeps its own."""
+        manifest_dir = Path(self.output_dir) / ".sync"
+        if self.shard is not None:
+            index, count = self.shard
+            manifest_dir = manifest_dir / f"shard-{index}-of-{count}"
+        return manifest_dir
+
+    def _shards_dir(self):
+        """Return the directory holding the shard artifacts."""
+        return Path(self.output_dir) / ".sync" / "shards"
+
+    def _write_shard_artifact(self, results):
+        """
+        Write this run's outputs as a shard artifact for the merge step.
+
+        Args:
+            results: List of result messages to append to
+        """
+        index, count = self.shard
+        path = write_artifact(
+            self._shards_dir(),
+            index,
+            count,
+            self.processed_data,
+            self.processed_directories,
+            self.errors,
+        )
+        message = f"Wrote shard {index}/{count} artifact to {path}"
+        results.append(message)
+        self.logger.info(message)
+
+    def _process_work_items(self, work_items):
+        """
+        Process work items and record them in the sync manifest.
+
+        Args:
+            work_items: Work items to process
+
+        Returns:
+            bool: True if every directory was processed successfully
+        """
+        if self.io_concurrency > 0:
+            success = self._process_directories_async(work_items)
+        elif not self.no_parallel:
+            success = self._process_directories_parallel(work_items)
+        else:
+            success = self._process_directories_sequential(work_items)
+
+        # Persist fingerprints and outputs of the processed directories
+        # (batched runs already flushed them batch by batch)
+        if not self.batched:
+            self._update_manifest(work_items)
+
+        return success
+
+    def _run_aggregate_stages(self, results):
+        """
+        Generate the enabled aggregate reports over all processed people data.
+
+        Args:
+            results: List of result messages to append to
+
+        Returns:
+            bool: False if a stage that marks the sync as failed went wrong
+        """
+        success = True
+
+        # Collect all people data for reports
+        all_people_data = self._collect_all_people_data()
+
+        # Generate advanced analytics if enabled
+        if self.time_series_forecast:
+            try:
+                results.append("Generating time series forecasting...")
+                if self._generate_time_series_forecast(all_people_data):
+                    results.append("Time series forecasting generated successfully")
+                else:
+                    results.append("Error generating time series forecasting")
+            except Exception as e:
+                error_msg = f"Error generating time series forecasting: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        if self.competency_gap_analysis:
+            try:
+                results.append("Generating enhanced competency gap analysis...")
+                if self._generate_competency_gap_analysis(all_people_data):
+                    results.append("Competency gap analysis generated successfully")
+                else:
+                    results.append("Error generating competency gap analysis")
+            except Exception as e:
+                error_msg = f"Error generating competency gap analysis: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        if self.advanced_network_metrics:
+            try:
+                results.append("Generating advanced network metrics...")
+                if self._generate_advanced_network_metrics(all_people_data):
+                    results.append("Advanced network metrics generated successfully")
+                else:
+                    results.append("Error generating advanced network metrics")
+            except Exception as e:
+                error_msg = f"Error generating advanced network metrics: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        if self.ml_insights:
+            try:
+                results.append("Generating machine learning insights...")
+                if self._generate_ml_insights(all_people_data):
+                    results.append("Machine learning insights generated successfully")
+                else:
+                    results.append("Error generating machine learning insights")
+            except Exception as e:
+                error_msg = f"Error generating machine learning insights: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        if self.sentiment_analysis:
+            try:
+                results.append("Generating sentiment analysis...")
+                if self._generate_sentiment_analysis(all_people_data):
+                    results.append("Sentiment analysis generated successfully")
+                else:
+                    results.append("Error generating sentiment analysis")
+            except Exception as e:
+                error_msg = f"Error generating sentiment analysis: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        if self.advanced_visualizations:
+            try:
+                results.append("Generating advanced visualizations...")
+                if self._generate_advanced_visualizations(all_people_data):
+                    results.append("Advanced visualizations generated successfully")
+                else:
+                    results.append("Error generating advanced visualizations")
+            except Exception as e:
+                error_msg = f"Error generating advanced visualizations: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                if not self.ignore_errors:
+                    raise
+
+        # Generate talent development reports if any are enabled
+        if self.use_9box or self.use_career_sim or self.use_network:
+            try:
+                results.append("Generating talent development reports...")
+                if self._generate_talent_development_reports(all_people_data):
+                    results.append("Talent development reports generated successfully")
+                else:
+                    results.append("Error generating talent development reports")
+            except Exception as e:
+                error_msg = f"Error generating talent development reports: {str(e)}"
+                results.append(error_msg)
+                self.logger.error(error_msg, exc_info=True)
+                self.errors.append(error_msg)
+                success = False
+                if not self.ignore_errors:
+                    raise
+
+        return success
+
+    def _filter_unchanged_directories(self, directories):
+        """
+        Drop directories whose inputs are unchanged since the last sync.
+
+        Cached outputs of the skipped directories are loaded into
+        processed_data so aggregate stages still see the whole dataset; in
+        batched runs only their compact summaries are loaded.
+
+        Args:
+            directories: Work items discovered for this run
+
+        Returns:
+            list: Work items that need processing
+        """
+        self.skipped_directories = []
+        if not self.incremental:
+            return list(directories)
+
+        self.manifest = SyncManifest(self._manifest_dir())
+
+        # Only a full run knows which directories were removed
+        if not (self.pessoa_filter or self.ano_filter):
+            self.manifest.forget_missing(
+                SyncManifest.directory_key(d.pessoa, d.ano) for d in directories
+            )
+
+        if self.force:
+            return list(directories)
+
+        pending = []
+        for directory in directories:
+            pessoa = directory.pessoa
+            ano = directory.ano
+            try:
+                unchanged = self.manifest.is_unchanged(
+                    pessoa, ano, directory.tracked_files
+                )
+            except OSError as e:
+                self.logger.warning(f"Could not check {directory.path}: {e}")
+                unchanged = False
+
+            cached = None
+            if unchanged and self.batched:
+                cached = self.manifest.load_summary(pessoa, ano)
+            if unchanged and cached is None:
+                cached = self.manifest.load_output(pessoa, ano)
+                if cached is not None and self.batched:
+                    cached = summarize_output(cached)
+            if cached is None:
+                pending.append(directory)
+                continue
+
+            if pessoa not in self.processed_data:
+                self.processed_data[pessoa] = {}
+            self.processed_data[pessoa][ano] = cached
+            self.skipped_directories.append(directory.path)
+
+        if self.verbose and self.skipped_directories:
+            self.logger.info(
+                f"Skipping {len(self.skipped_directories)} unchanged directories"
+            )
+
+        return pending
+
+    def _update_manifest(self, directories, summaries=None):
+        """
+        Record processed directories in the sync manifest and save it.
+
+        Args:
+            directories: Work items that were processed
+            summaries: Precomputed summaries keyed by (pessoa, ano)
+        """
+        if self.manifest is None:
+            return
+
+        processed = set(self.processed_directories)
+        try:
+            for directory in directories:
+                pessoa = directory.pessoa
+                ano = directory.ano
+                if directory.path not in processed:
+                    continue
+                if ano not in self.processed_data.get(pessoa, {}):
+                    continue
+
+                output = self.processed_data[pessoa][ano]
+                summary = (summaries or {}).get((pessoa, ano))
+                self.manifest.record(
+                    pessoa,
+                    ano,
+                    directory.path,
+                    directory.tracked_files,
+                    output,
+                    summary if summary is not None else summarize_output(output),
+                )
+
+            self.manifest.save()
+        except Exception as e:
+            # The manifest only speeds up later runs; never fail the sync on it
+            self.logger.warning(f"Could not update sync manifest: {e}")
+
+    @property
+    def batched(self):
+        """Whether directories are processed in memory-bounded batches."""
+        return bool(self.batch_size) and self.batch_size > 0
+
+    def _flush_batch(self, batch):
+        """
+        Write the outputs of a processed batch to disk and keep only summaries.
+
+        The combined output of each directory goes to the sync manifest's
+        output cache and is replaced in processed_data by its compact summary,
+        so memory stays bounded by one batch of raw payloads.
+
+        Args:
+            batch: Work items of the batch
+        """
+        if self.manifest is None:
+            self.manifest = SyncManifest(self._manifest_dir())
+
+        summaries = {}
+        for directory in batch:
+            outputs = self.processed_data.get(directory.pessoa, {})
+            if directory.ano in outputs:
+                summaries[(directory.pessoa, directory.ano)] = summarize_output(
+                    outputs[directory.ano]
+                )
+
+        self._update_manifest(batch, summaries)
+        for (pessoa, ano), summary in summaries.items():
+            self.processed_data[pessoa][ano] = summary
+
+        if self.verbose:
+            self.logger.info(
+                f"Flushed {len(summaries)} directories to {self.manifest.outputs_dir}"
+            )
+
     def _process_directories_parallel(self, valid_directories):
-        """Process directories in parallel using ThreadPoolExecutor"""
+        """
+        Process directories in parallel using a thread or process pool.
+
+        With the process executor, files are parsed and combined in worker
+        processes; only the combined data is sent back and merged into
+        processed_data here. Tasks are submitted in chunks of batch_size,
+        and each chunk is flushed to disk before the next one starts.
+
+        Args:
+            valid_directories: Work items to process
+
+        Returns:
+            bool: True if all directories were processed successfully
+        """
         import concurrent.futures
 
         # Determine number of workers
-        max_workers = self.workers if self.workers > 0 else (os.cpu_count() or 4)
+        workers = self.workers or 0
+        max_workers = workers if workers > 0 else (os.cpu_count() or 4)
         max_workers = min(max_workers, len(valid_directories))
 
         # Determine batch size
-        batch_size = self.batch_size if self.batch_size > 0 else len(valid_directories)
+        batch_size = self.batch_size or 0
+        if batch_size <= 0:
+            batch_size = len(valid_directories)
+
+        use_processes = self.executor == "process"
+        if use_processes:
+            executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_parse_worker,
+                initargs=(self.ignore_errors, self.verbose, self.chunk_rows),
+            )
+        else:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
         if self.verbose:
-            print(f"Processing in parallel with {max_workers} workers")
+            print(f"Processing in parallel with {max_workers} {self.executor} workers")
 
         success = True
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit tasks
-            future_to_dir = {}
-            for directory in valid_directories:
-                pessoa_dir = directory["pessoa"]
-                ano_dir = directory["ano"]
-                result_files = directory["files"]
-                path = directory["path"]
-
-                future = executor.submit(
-                    self._process_directory_safe,
-                    pessoa_dir,
-                    ano_dir,
-                    result_files,
-                    path,
-                )
-                future_to_dir[future] = path
-
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_dir):
-                path = future_to_dir[future]
-                try:
-                    result = future.result()
-                    if result:
-                        # Add to processed directories
-                        if path not in self.processed_directories:
-                            self.processed_directories.append(path)
+        with executor:
+            for start in range(0, len(valid_directories), batch_size):
+                batch = valid_directories[start : start + batch_size]
+
+                # Submit tasks
+                future_to_dir = {}
+                for directory in batch:
+                    pessoa_dir = directory.pessoa
+                    ano_dir = directory.ano
+                    result_files = directory.result_paths
+                    path = directory.path
+
+                    if use_processes:
+                        future = executor.submit(
+                            _parse_directory_in_worker,
+                            pessoa_dir,
+                            ano_dir,
+                            result_files,
+                        )
                     else:
-                        self.errors.append(f"Failed to process {path}")
+                        future = executor.submit(
+                            self._process_directory_safe,
+                            pessoa_dir,
+                            ano_dir,
+                            result_files,
+                            path,
+                        )
+                    future_to_dir[future] = directory
+
+                # Process results as they complete
+                for future in concurrent.futures.as_completed(future_to_dir):
+                    directory = future_to_dir[future]
+                    path = directory.path
+                    try:
+                        result = future.result()
+                        if use_processes:
+                            # Merge the worker's combined data in the parent
+                            result = self._store_directory_data(
+                                directory.pessoa, directory.ano, result
+                            )
+                        if result:
+                            # Add to processed directories
+                            if path not in self.processed_directories:
+                                self.processed_directories.append(path)
+                        else:
+                            self.errors.append(f"Failed to process {path}")
+                            success = False
+                    except Exception as e:
+                        error_msg = f"Error processing {path}: {str(e)}"
+                        self.logger.error(error_msg, exc_info=True)
+                        self.errors.append(error_msg)
                         success = False
-                except Exception as e:
-                    error_msg = f"Error processing {path}: {str(e)}"
-                    self.logger.error(error_msg, exc_info=True)
+                        if not self.ignore_errors:
+                            # Cancel remaining tasks
+                            for f in future_to_dir:
+                                f.cancel()
+                            return False
+
+                    # Update progress
+                    self.current_progress += 1
+                    if self.verbose:
+                        print(
+                            f"Progress: {self.current_progress}/{self.total_progress}"
+                        )
+
+                if self.batched:
+                    self._flush_batch(batch)
+
+        return success
+
+    def _process_directories_async(self, valid_directories):
+        """
+        Process directories with the asynchronous loader.
+
+        Up to io_concurrency files are read at a time while the directories
+        already read are decoded and combined in a pool of worker threads or
+        processes (see executor). Results are stored here as they arrive, and
+        each batch is flushed to disk before the next one starts.
+
+        Args:
+            valid_directories: Work items to process
+
+        Returns:
+            bool: True if all directories were processed successfully
+        """
+        import concurrent.futures
+
+        workers = self.workers or 0
+        max_workers = workers if workers > 0 else (os.cpu_count() or 4)
+        max_workers = max(1, min(max_workers, len(valid_directories)))
+
+        batch_size = self.batch_size if self.batched else len(valid_directories)
+
+        if self.executor == "process":
+            decode_executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_parse_worker,
+                initargs=(self.ignore_errors, self.verbose, self.chunk_rows),
+            )
+            decode = _parse_directory_in_worker
+        else:
+            decode_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            )
+            decode = self._parse_directory
+
+        if self.verbose:
+            print(
+                f"Loading with {self.io_concurrency} concurrent reads and "
+                f"{max_workers} {self.executor} decode workers"
+            )
+
+        success = True
+
+        def on_result(directory, combined_data, error):
+            nonlocal success
+            path = directory.path
+            if error is None and self._store_directory_data(
+                directory.pessoa, directory.ano, combined_data
+            ):
+                if path not in self.processed_directories:
+                    self.processed_directories.append(path)
+            else:
+                if error is None:
+                    self.errors.append(f"Failed to process {path}")
+                else:
+                    error_msg = f"Error processing {path}: {str(error)}"
+                    self.logger.error(error_msg, exc_info=error)
                     self.errors.append(error_msg)
-                    success = False
-                    if not self.ignore_errors:
-                        # Cancel remaining tasks
-                        for f in future_to_dir:
-                            f.cancel()
-                        return False
+                success = False
+                if not self.ignore_errors:
+                    return False
 
-                # Update progress
-                self.current_progress += 1
-                if self.verbose:
-                    print(f"Progress: {self.current_progress}/{self.total_progress}")
+            # Update progress
+            self.current_progress += 1
+            if self.verbose:
+                print(f"Progress: {self.current_progress}/{self.total_progress}")
+            return True
+
+        loader = AsyncDirectoryLoader(
+            decode, io_concurrency=self.io_concurrency, decode_executor=decode_executor
+        )
+        with decode_executor:
+            for start in range(0, len(valid_directories), batch_size):
+                batch = valid_directories[start : start + batch_size]
+                if not loader.run(batch, on_result):
+                    return False
+                if self.batched:
+                    self._flush_batch(batch)
 
         return success
 
@@ -765,6 +1385,25 @@ class DataSync:
         Returns:
             bool: True if processing was successful, False otherwise
         """
+        combined_data = self._parse_directory(pessoa, ano, result_files)
+        return self._store_directory_data(pessoa, ano, combined_data)
+
+    def _parse_directory(self, pessoa, ano, result_files, contents=None):
+        """
+        Parse and combine the result files of a directory.
+
+        This does not touch processed_data, so it can run in a worker process.
+
+        Args:
+            pessoa: Name of the pessoa
+            ano: Year
+            result_files: List of result files
+            contents: Contents of the result files keyed by path, when they
+                were already read (files missing here are read from disk)
+
+        Returns:
+            dict: The combined data of the directory
+        """
         if self.verbose:
             self.logger.info(f"Processing {pessoa}/{ano}")
 
@@ -772,21 +1411,34 @@ class DataSync:
         processed_data = {}
         for file_path in result_files:
             file_ext = file_path.suffix.lower()
+            content = (contents or {}).get(file_path)
 
             # Determine file type and process accordingly
             if file_ext in self.valid_formats.get("json", []):
-                processed_data["json"] = self._process_json_file(file_path)
+                processed_data["json"] = self._process_json_file(file_path, content)
             elif file_ext in self.valid_formats.get("yaml", []):
-                processed_data["yaml"] = self._process_yaml_file(file_path)
+                processed_data["yaml"] = self._process_yaml_file(file_path, content)
             elif file_ext in self.valid_formats.get("csv", []):
-                processed_data["csv"] = self._process_csv_file(file_path)
+                processed_data["csv"] = self._process_csv_file(file_path, content)
             elif file_ext in self.valid_formats.get("excel", []):
-                processed_data["excel"] = self._process_excel_file(file_path)
+                processed_data["excel"] = self._process_excel_file(file_path, content)
 
         # Combine data from different formats
-        combined_data = self._combine_data(processed_data)
+        return self._combine_data(processed_data)
+
+    def _store_directory_data(self, pessoa, ano, combined_data):
+        """
+        Store the combined data of a directory in processed_data.
+
+        Args:
+            pessoa: Name of the pessoa
+            ano: Year
+            combined_data: The combined data of the directory
 
-        if not combined_data:
+        Returns:
+            bool: True if there was data to store, False otherwise
+        """
+        if combined_data is None or len(combined_data) == 0:
             self.logger.warning(f"No data processed for {pessoa}/{ano}")
             return False
 
@@ -851,19 +1503,20 @@ class DataSync:
                 raise
             return False
 
-    def _process_json_file(self, file_path):
+    def _process_json_file(self, file_path, content=None):
         """Process a JSON file
 
         Args:
             file_path: Path to the JSON file
+            content: Contents of the file, when it was already read
 
         Returns:
             dict: The processed data
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data
+            if content is not None:
+                return loads_cached(content)
+            return load_json_cached(file_path)
         except Exception as e:
             error_msg = f"Error reading JSON file {file_path}: {e}"
             self.logger.error(error_msg)
@@ -871,11 +1524,13 @@ class DataSync:
                 raise
             return None
 
-    def _process_yaml_file(self, file_path):
+    def _process_yaml_file(self, file_path, content=None):
         """Process a YAML file"""
         try:
             import yaml
 
+            if content is not None:
+                return yaml.safe_load(content.decode("utf-8"))
             with open(file_path, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f)
             return data
@@ -886,13 +1541,21 @@ class DataSync:
                 raise
             return None
 
-    def _process_csv_file(self, file_path):
-        """Process a CSV file"""
-        try:
-            import pandas as pd
+    def _process_csv_file(self, file_path, content=None):
+        """Process a CSV file
 
-            df = pd.read_csv(file_path)
-            return df.to_dict(orient="records")
+        The file is read in chunks of chunk_rows rows with compact column
+        types, so large exports never exist as a whole raw table.
+
+        Args:
+            file_path: Path to the CSV file
+            content: Contents of the file, when it was already read
+
+        Returns:
+            pd.DataFrame: The rows of the file
+        """
+        try:
+            return tabular_stream.read_csv(file_path, self.chunk_rows, content)
         except Exception as e:
             error_msg = f"Error reading CSV file {file_path}: {e}"
             self.logger.error(error_msg)
@@ -900,20 +1563,21 @@ class DataSync:
                 raise
             return None
 
-    def _process_excel_file(self, file_path):
-        """Process an Excel file"""
-        try:
-            import pandas as pd
+    def _process_excel_file(self, file_path, content=None):
+        """Process an Excel file
 
-            # Read all sheets
-            sheets = pd.read_excel(file_path, sheet_name=None)
+        Worksheets are streamed with openpyxl in read-only mode, chunk_rows
+        rows at a time, into frames with compact column types.
 
-            # Convert to dict
-            result = {}
-            for sheet_name, df in sheets.items():
-                result[sheet_name] = df.to_dict(orient="records")
+        Args:
+            file_path: Path to the Excel file
+            content: Contents of the file, when it was already read
 
-            return result
+        Returns:
+            dict: The rows of each sheet as a pd.DataFrame, keyed by sheet name
+        """
+        try:
+            return tabular_stream.read_excel(file_path, self.chunk_rows, content)
         except Exception as e:
             error_msg = f"Error reading Excel file {file_path}: {e}"
             self.logger.error(error_msg)
@@ -940,7 +1604,10 @@ class DataSync:
 
         # Add any additional data from other formats
         for fmt, data in processed_data.items():
-            if fmt not in ["json"] and isinstance(data, dict):  # Skip the base format
+            # Skip the base format; tables without a dict base are not merged
+            if data is combined or not isinstance(combined, dict):
+                continue
+            if fmt not in ["json"] and isinstance(data, dict):
                 # Merge dictionaries
                 for key, value in data.items():
                     if key not in combined:
@@ -948,6 +1615,13 @@ class DataSync:
                     elif isinstance(value, list) and isinstance(combined[key], list):
                         # Extend lists
                         combined[key].extend(value)
+                    elif isinstance(value, pd.DataFrame) and isinstance(
+                        combined[key], pd.DataFrame
+                    ):
+                        # Append rows of tables with the same name
+                        combined[key] = tabular_stream.concat_frames(
+                            [combined[key], value]
+                        )
                     elif isinstance(value, dict) and isinstance(combined[key], dict):
                         # Recursive merge for nested dicts
                         self._merge_dicts(combined[key], value)
@@ -967,6 +1641,22 @@ class DataSync:
                 dict1[key] = dict2[key]
         return dict1
 
+    def _discover_work_items(self):
+        """
+        Walk the data directory once and build the sync work list.
+
+        Returns:
+            tuple: Immutable WorkItem entries with the paths, sizes and mtimes
+                of the files of each pessoa/ano directory
+        """
+        return discover_work_items(
+            self.data_dir,
+            pessoa=self.pessoa_filter,
+            ano=self.ano_filter,
+            include=self.include_patterns,
+            exclude=self.exclude_patterns,
+        )
+
     def _process_pessoa_ano_structure(self):
         """
         Process the pessoa/ano directory structure and return valid directories.
@@ -974,59 +1664,29 @@ class DataSync:
         Returns:
             list: List of Path objects representing valid pessoa/ano directories
         """
-        valid_dirs = []
-        data_dir = Path(self.data_dir)
-
-        # Iterate through pessoa directories
-        for pessoa_dir in data_dir.iterdir():
-            if not pessoa_dir.is_dir():
-                continue
-
-            # Skip if pessoa filter is set and doesn't match
-            if self.pessoa_filter and pessoa_dir.name != self.pessoa_filter:
-                continue
-
-            # Iterate through ano directories
-            for ano_dir in pessoa_dir.iterdir():
-                if not ano_dir.is_dir():
-                    continue
-
-                # Skip if ano filter is set and doesn't match
-                if self.ano_filter and ano_dir.name != self.ano_filter:
-                    continue
+        return [Path(item.path) for item in self._discover_work_items()]
 
-                # Check if directory contains resultado files
-                if any(ano_dir.glob("resultado.*")):
-                    valid_dirs.append(ano_dir)
-
-        return valid_dirs
-
-    def _print_processing_summary(self, valid_directories):
+    def _print_processing_summary(self, work_items):
         """
         Print a summary of the directories that will be processed.
 
         Args:
-            valid_directories: List of Path objects representing valid directories
+            work_items: Work items discovered for this run
         """
-        if not valid_directories:
+        if not work_items:
             self.logger.warning("No valid directories found for processing")
             return
 
-        self.logger.info(
-            f"Found {len(valid_directories)} valid directories to process:"
-        )
+        self.logger.info(f"Found {len(work_items)} valid directories to process:")
         pessoas = set()
         anos = set()
 
-        for directory in valid_directories:
-            # Directory structure is expected to be pessoa/ano
-            pessoa = directory.parent.name
-            ano = directory.name
-            pessoas.add(pessoa)
-            anos.add(ano)
+        for item in work_items:
+            pessoas.add(item.pessoa)
+            anos.add(item.ano)
 
             if self.verbose:
-                self.logger.info(f"  - {pessoa}/{ano}")
+                self.logger.info(f"  - {item.pessoa}/{item.ano}")
 
         self.logger.info(f"Number of pessoas: {len(pessoas)}")
         self.logger.info(f"Number of anos: {len(anos)}")
@@ -1051,47 +1711,46 @@ class DataSync:
         Process directories sequentially.
 
         Args:
-            valid_directories: List of directories to process
+            valid_directories: Work items to process
 
         Returns:
             bool: True if successful, False otherwise
         """
         success = True
 
-        for directory in valid_directories:
-            if isinstance(directory, Path):
-                # Handle Path objects
-                pessoa_dir = directory.parent.name
-                ano_dir = directory.name
-                result_files = list(directory.glob("resultado.*"))
-                path = str(directory)
-            else:
-                # Handle dictionary format
-                pessoa_dir = directory["pessoa"]
-                ano_dir = directory["ano"]
-                result_files = directory["files"]
-                path = directory["path"]
+        batch_size = self.batch_size if self.batched else len(valid_directories)
+        for start in range(0, len(valid_directories), batch_size):
+            batch = valid_directories[start : start + batch_size]
 
-            try:
-                if self._process_directory(pessoa_dir, ano_dir, result_files, path):
-                    self.processed_directories.append(path)
-                else:
-                    self.errors.append(f"Failed to process {path}")
+            for directory in batch:
+                pessoa_dir = directory.pessoa
+                ano_dir = directory.ano
+                result_files = directory.result_paths
+                path = directory.path
+
+                try:
+                    if self._process_directory(pessoa_dir, ano_dir, result_files, path):
+                        self.processed_directories.append(path)
+                    else:
+                        self.errors.append(f"Failed to process {path}")
+                        success = False
+                        if not self.ignore_errors:
+                            return False
+                except Exception as e:
+                    error_msg = f"Error processing {path}: {str(e)}"
+                    self.logger.error(error_msg, exc_info=True)
+                    self.errors.append(error_msg)
                     success = False
                     if not self.ignore_errors:
-                        return False
-            except Exception as e:
-                error_msg = f"Error processing {path}: {str(e)}"
-                self.logger.error(error_msg, exc_info=True)
-                self.errors.append(error_msg)
-                success = False
-                if not self.ignore_errors:
-                    raise
+                        raise
 
-            # Update progress
-            self.current_progress += 1
-            if self.verbose:
-                print(f"Progress: {self.current_progress}/{self.total_progress}")
+                # Update progress
+                self.current_progress += 1
+                if self.verbose:
+                    print(f"Progress: {self.current_progress}/{self.total_progress}")
+
+            if self.batched:
+                self._flush_batch(batch)
 
         return success
 
@@ -2170,3 +2829,20 @@ class DataSync:
                         )
 
         return network_data
+
+
+# DataSync used by the worker processes of the process executor
+_worker_sync = None
+
+
+def _init_parse_worker(ignore_errors, verbose, chunk_rows=None):
+    """Create the DataSync used to parse directories in a worker process."""
+    global _worker_sync
+    _worker_sync = DataSync(
+        ignore_errors=ignore_errors, verbose=verbose, chunk_rows=chunk_rows
+    )
+
+
+def _parse_directory_in_worker(pessoa, ano, result_files, contents=None):
+    """Parse and combine a directory in a worker process."""
+    return _worker_sync._parse_directory(pessoa, ano, result_files, contents)
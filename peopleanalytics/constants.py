@@ -3,7 +3,9 @@ Constants for People Analytics.
 
 This module provides constants used throughout the package.
 """
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+import numpy as np
 
 # Frequency labels for evaluation distributions
 FREQUENCY_LABELS = ["n/a", "referencia", "sempre", "quase sempre", "poucas vezes", "raramente"]
@@ -110,6 +112,110 @@ def calculate_score(frequencies: List[int], use_nps_model: bool = True, normaliz
         
         return weighted_sum / total if total > 0 else 0.0
 
+# Models calculate_scores implements; scoring_engine.SCORE_MODELS is the
+# registry of every scoring model, built on top of them
+VECTOR_SCORE_MODELS = ("nps", "traditional")
+
+def calculate_scores(frequencies: np.ndarray, model: str = "nps", normalize: bool = False) -> np.ndarray:
+    """Calculate the scores of many frequency distribution vectors at once.
+    
+    Batch version of calculate_score: every row is scored in one NumPy pass,
+    with the same operations in the same order, so each result is identical to
+    calculate_score on that row.
+    
+    Args:
+        frequencies: Array of shape (N, 6), one frequency distribution per row
+            (see stack_frequencies to build it from lists)
+        model: "nps" for the NPS-like model or "traditional" for weighted averages
+        normalize: Whether to normalize NPS scores to a 0-100 scale
+            
+    Returns:
+        Float array with the N scores
+        
+    Raises:
+        ValueError: If the array is not (N, 6) or the model is unknown
+    """
+    if model not in VECTOR_SCORE_MODELS:
+        raise ValueError(f"Unknown scoring model '{model}', expected one of {VECTOR_SCORE_MODELS}")
+    
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    if frequencies.ndim != 2 or frequencies.shape[1] != 6:
+        raise ValueError(f"Frequency matrix must have shape (N, 6), got {frequencies.shape}")
+    
+    columns = [frequencies[:, i] for i in range(6)]
+    
+    # Count applicable ratings (exclude n/a), summed left to right like sum()
+    total = columns[1] + columns[2] + columns[3] + columns[4] + columns[5]
+    applicable = total > 0
+    safe_total = np.where(applicable, total, 1.0)
+    
+    if model == "nps":
+        weights = FREQUENCY_WEIGHTS_NPS
+        positive_sum = columns[1] * weights[1] + columns[2] * weights[2] + columns[3] * weights[3]
+        negative_sum = columns[4] * weights[4] + columns[5] * weights[5]
+        raw_score = (positive_sum + negative_sum) / safe_total
+        
+        if normalize:
+            # -10 → 0, 0 → 50, 10 → 100; middle of the scale without ratings
+            return np.where(applicable, 50 + (raw_score * 5), 50.0)
+        return np.where(applicable, raw_score, 0.0)
+    
+    weights = FREQUENCY_WEIGHTS
+    weighted_sum = columns[0] * weights[0]
+    for i in range(1, 6):
+        weighted_sum = weighted_sum + columns[i] * weights[i]
+    return np.where(applicable, weighted_sum / safe_total, 0.0)
+
+def stack_frequencies(vectors: Sequence) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack frequency vectors into a matrix for calculate_scores.
+    
+    Vectors calculate_score would reject (wrong length, non-numeric values)
+    are left as zero rows and flagged as invalid, so callers can handle them
+    one by one.
+    
+    Args:
+        vectors: Frequency vectors, e.g. lists from resultado.json
+            
+    Returns:
+        Tuple of the (N, 6) float matrix and the boolean mask of valid rows
+    """
+    count = len(vectors)
+    if count:
+        try:
+            matrix = np.asarray(vectors)
+        except ValueError:
+            # Vectors of different lengths
+            matrix = None
+        if matrix is not None and matrix.shape == (count, 6) and matrix.dtype.kind in "biuf":
+            return matrix.astype(np.float64), np.ones(count, dtype=bool)
+    
+    matrix = np.zeros((count, 6), dtype=np.float64)
+    valid = np.zeros(count, dtype=bool)
+    for i, vector in enumerate(vectors):
+        if (
+            isinstance(vector, (list, tuple))
+            and len(vector) == 6
+            and all(isinstance(value, (int, float)) for value in vector)
+        ):
+            try:
+                matrix[i] = vector
+            except OverflowError:
+                continue
+            valid[i] = True
+    return matrix, valid
+
+
+def row_sums(frequencies: np.ndarray) -> np.ndarray:
+    """Sum the columns of a matrix left to right, like sum() on each row.
+    
+    Unlike frequencies.sum(axis=1), the additions happen in the same order as
+    in the per-vector code, so the results are identical.
+    """
+    total = frequencies[:, 0]
+    for i in range(1, frequencies.shape[1]):
+        total = total + frequencies[:, i]
+    return total
+
 # Chart colors for concepts
 CONCEPT_CHART_COLORS = {
     "Excelente": "#27AE60",  # Green
@@ -13,6 +13,9 @@ import json
 import os
 from pathlib import Path
 
+from .json_loader import load_json
+from .parse_cache import load_json_cached
+
 
 class RecordStatus(Enum):
     """Status of a data record."""
@@ -567,15 +570,13 @@ class PersonData:
         profile_path = dir_path / "perfil.json"
         
         # Load data file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_cached(file_path)
             
         # Load profile if it exists
         profile_data = None
         if profile_path.exists():
             try:
-                with open(profile_path, 'r', encoding='utf-8') as f:
-                    profile_data = json.load(f)
+                profile_data = load_json(profile_path)
             except:
                 pass
                 
@@ -664,16 +665,14 @@ class PersonData:
             raise FileNotFoundError(f"Required file not found: {results_file}")
         
         # Load results data
-        with open(results_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_cached(results_file)
         
         # Create person data from Portuguese format
         person_data = cls.from_dict_pt(data)
         
         # Load profile if it exists
         if os.path.exists(profile_file):
-            with open(profile_file, "r", encoding="utf-8") as f:
-                profile_data = json.load(f)
+            profile_data = load_json(profile_file)
             person_data.profile = ProfileData.from_dict(profile_data)
             
         return person_data
@@ -3,22 +3,209 @@ Data pipeline for People Analytics.
 
 This module provides the core data pipeline functionality for data processing,
 transformation, and analysis in the People Analytics platform.
+
+Evaluation files (``<pessoa>/<ano>/resultado.json`` plus ``perfil.json``) are
+flattened into a columnar DuckDB store so reports can query them instead of
+reparsing the raw JSON tree.
 """
 
+import os
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Optional, Union
+
+import pandas as pd
+
+from .json_loader import load_json
+from .schema_validator import get_validator
+
+# Number of buckets in each frequency vector
+# [n/a, referencia, sempre, quase sempre, poucas vezes, raramente]
+FREQUENCY_BUCKETS = 6
+
+FREQ_COLABORADOR_COLUMNS = [f"freq_colaborador_{i}" for i in range(FREQUENCY_BUCKETS)]
+FREQ_GRUPO_COLUMNS = [f"freq_grupo_{i}" for i in range(FREQUENCY_BUCKETS)]
+
+# Columns of the flattened evaluation table, one row per avaliacao
+EVALUATION_STORE_COLUMNS = (
+    [
+        "source_path",
+        "ordinal",
+        "pessoa",
+        "ano",
+        "cargo",
+        "nivel",
+        "department",
+        "conceito",
+        "direcionador",
+        "direcionador_pergunta_final",
+        "comportamento",
+        "comportamento_pergunta_final",
+        "avaliador",
+    ]
+    + FREQ_COLABORADOR_COLUMNS
+    + FREQ_GRUPO_COLUMNS
+)
 
 
 class DataPipeline:
     """Core data pipeline for the People Analytics platform."""
 
-    def __init__(self, data_path: Union[str, Path]):
+    def __init__(
+        self,
+        data_path: Union[str, Path],
+        store_path: Optional[Union[str, Path]] = None,
+    ):
         """Initialize the data pipeline.
 
         Args:
             data_path: Path to the data directory
+            store_path: Path to the DuckDB evaluation store
+                (defaults to '.store/evaluations.duckdb' inside data_path)
         """
         self.data_path = Path(data_path).resolve()
+        self.store_path = (
+            Path(store_path).resolve()
+            if store_path
+            else self.data_path / ".store" / "evaluations.duckdb"
+        )
+        self._connection = None
+
+    def _connect(self):
+        """Open the evaluation store, creating its tables on first use.
+
+        Returns:
+            DuckDB connection to the evaluation store
+        """
+        if self._connection is not None:
+            return self._connection
+
+        import duckdb
+
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = duckdb.connect(str(self.store_path))
+
+        freq_columns = ", ".join(
+            f"{column} INTEGER"
+            for column in FREQ_COLABORADOR_COLUMNS + FREQ_GRUPO_COLUMNS
+        )
+        connection.execute(f"""
+            CREATE TABLE IF NOT EXISTS evaluations (
+                source_path VARCHAR,
+                ordinal INTEGER,
+                pessoa VARCHAR,
+                ano VARCHAR,
+                cargo VARCHAR,
+                nivel VARCHAR,
+                department VARCHAR,
+                conceito VARCHAR,
+                direcionador VARCHAR,
+                direcionador_pergunta_final VARCHAR,
+                comportamento VARCHAR,
+                comportamento_pergunta_final VARCHAR,
+                avaliador VARCHAR,
+                {freq_columns}
+            )
+            """)
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS ingested_files (
+                source_path VARCHAR PRIMARY KEY,
+                pessoa VARCHAR,
+                ano VARCHAR,
+                size BIGINT,
+                mtime DOUBLE,
+                rows INTEGER,
+                perfil_size BIGINT,
+                perfil_mtime DOUBLE
+            )
+            """)
+        # Stores created before perfil.json was fingerprinted
+        for column, column_type in (
+            ("perfil_size", "BIGINT"),
+            ("perfil_mtime", "DOUBLE"),
+        ):
+            connection.execute(
+                f"ALTER TABLE ingested_files ADD COLUMN IF NOT EXISTS {column} {column_type}"
+            )
+
+        self._connection = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the connection to the evaluation store."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def flatten_evaluation(
+        data: Dict[str, Any],
+        perfil: Dict[str, Any],
+        person: str,
+        year: str,
+        source_path: str = "",
+    ) -> List[tuple]:
+        """Flatten a resultado.json payload into evaluation store rows.
+
+        Args:
+            data: Parsed resultado.json content
+            perfil: Parsed perfil.json content
+            person: Person identifier
+            year: Year identifier
+            source_path: Path of the file the rows come from
+
+        Returns:
+            List of row tuples ordered as EVALUATION_STORE_COLUMNS
+
+        Raises:
+            ValueError: If a frequency vector is malformed or empty
+        """
+        rows = []
+        cargo = perfil["cargo"]
+        nivel = perfil["nivel_cargo"]
+        department = perfil.get("department", "Unknown")
+        conceito = data["data"]["conceito_ciclo_filho_descricao"]
+
+        for direcionador in data["data"]["direcionadores"]:
+            for comportamento in direcionador["comportamentos"]:
+                for avaliacao in comportamento["avaliacoes_grupo"]:
+                    freq_colaborador = list(avaliacao["frequencia_colaborador"])
+                    freq_grupo = list(avaliacao["frequencia_grupo"])
+
+                    for freq in (freq_colaborador, freq_grupo):
+                        if len(freq) > FREQUENCY_BUCKETS:
+                            raise ValueError(
+                                f"Frequency vector must have at most "
+                                f"{FREQUENCY_BUCKETS} positions, got {len(freq)}"
+                            )
+                        if sum(freq) == 0:
+                            raise ValueError(
+                                f"Empty frequency vector for "
+                                f"{comportamento['comportamento']} / "
+                                f"{avaliacao['avaliador']}"
+                            )
+                        freq.extend([0] * (FREQUENCY_BUCKETS - len(freq)))
+
+                    rows.append(
+                        (
+                            source_path,
+                            len(rows),
+                            person,
+                            year,
+                            cargo,
+                            nivel,
+                            department,
+                            conceito,
+                            direcionador["direcionador"],
+                            str(direcionador["pergunta_final"]),
+                            comportamento["comportamento"],
+                            str(comportamento["pergunta_final"]),
+                            avaliacao["avaliador"],
+                            *freq_colaborador,
+                            *freq_grupo,
+                        )
+                    )
+
+        return rows
 
     def ingest_file(
         self,
@@ -29,6 +216,13 @@ class DataPipeline:
     ) -> Dict[str, Any]:
         """Ingest a data file into the pipeline.
 
+        The resultado.json file and its sibling perfil.json are flattened
+        into the evaluation store. Files whose resultado.json and perfil.json
+        sizes and modification times match the stored entry are skipped
+        unless overwrite is set. If a changed file can no longer be ingested,
+        its previously stored rows are dropped. Violations of the resultado
+        schema are reported in the ``schema_errors`` entry of the result.
+
         Args:
             file_path: Path to the file to ingest
             year: Year identifier for the data
@@ -38,14 +232,197 @@ class DataPipeline:
         Returns:
             Dict with ingestion result information
         """
+        schema_errors = []
+        existing = None
         try:
-            # Simple placeholder implementation
+            file_path = Path(file_path).resolve()
+            person = person or file_path.parts[-3]
+            year = year or file_path.parts[-2]
+            source_path = str(file_path)
+
+            stat = file_path.stat()
+            perfil_path = file_path.parent / "perfil.json"
+            perfil_stat = perfil_path.stat() if perfil_path.exists() else None
+            fingerprint = (
+                stat.st_size,
+                stat.st_mtime,
+                perfil_stat.st_size if perfil_stat else None,
+                perfil_stat.st_mtime if perfil_stat else None,
+            )
+            connection = self._connect()
+
+            existing = connection.execute(
+                "SELECT size, mtime, perfil_size, perfil_mtime FROM ingested_files "
+                "WHERE source_path = ?",
+                [source_path],
+            ).fetchone()
+            if existing and not overwrite and tuple(existing) == fingerprint:
+                return {
+                    "success": False,
+                    "error": f"File {file_path} already ingested",
+                    "error_type": "exists",
+                }
+
+            data = load_json(file_path)
+            schema_errors = [str(error) for error in get_validator().validate(data)]
+            perfil = load_json(perfil_path)
+
+            rows = self.flatten_evaluation(data, perfil, person, year, source_path)
+
+            connection.execute("BEGIN TRANSACTION")
+            try:
+                self._delete_source(connection, source_path)
+                if rows:
+                    placeholders = ", ".join("?" * len(EVALUATION_STORE_COLUMNS))
+                    connection.executemany(
+                        f"INSERT INTO evaluations VALUES ({placeholders})", rows
+                    )
+                connection.execute(
+                    "INSERT INTO ingested_files (source_path, pessoa, ano, size, "
+                    "mtime, rows, perfil_size, perfil_mtime) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        source_path,
+                        person,
+                        year,
+                        stat.st_size,
+                        stat.st_mtime,
+                        len(rows),
+                        fingerprint[2],
+                        fingerprint[3],
+                    ],
+                )
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
             return {
                 "success": True,
                 "message": f"File {file_path} ingested successfully",
+                "rows": len(rows),
+                "schema_errors": schema_errors,
             }
         except Exception as e:
-            return {"success": False, "error": str(e), "error_type": "processing"}
+            # Rows of the previous version of a changed file are stale now
+            if existing:
+                self.remove_source(file_path)
+            return {
+                "success": False,
+                "error": str(e),
+                "error_type": "processing",
+                "schema_errors": schema_errors,
+            }
+
+    def remove_source(self, file_path: Union[str, Path]) -> bool:
+        """Drop the stored rows of a source file.
+
+        Args:
+            file_path: Path to the resultado.json file
+
+        Returns:
+            True if the file had been ingested
+        """
+        source_path = str(Path(file_path).resolve())
+        connection = self._connect()
+        stored = connection.execute(
+            "SELECT 1 FROM ingested_files WHERE source_path = ?", [source_path]
+        ).fetchone()
+        if stored:
+            self._delete_source(connection, source_path)
+        return bool(stored)
+
+    def _delete_source(self, connection, source_path: str) -> None:
+        """Remove every stored row that came from a source file."""
+        connection.execute(
+            "DELETE FROM evaluations WHERE source_path = ?", [source_path]
+        )
+        connection.execute(
+            "DELETE FROM ingested_files WHERE source_path = ?", [source_path]
+        )
+
+    def prune_missing(self, directory: Optional[Union[str, Path]] = None) -> int:
+        """Drop stored data whose source file no longer exists.
+
+        Args:
+            directory: Only consider sources under this directory
+                (defaults to the whole store)
+
+        Returns:
+            Number of source files removed from the store
+        """
+        connection = self._connect()
+        sources = [
+            row[0]
+            for row in connection.execute(
+                "SELECT source_path FROM ingested_files"
+            ).fetchall()
+        ]
+
+        prefix = os.path.join(str(Path(directory).resolve()), "") if directory else None
+        removed = 0
+        for source_path in sources:
+            if prefix and not source_path.startswith(prefix):
+                continue
+            if not Path(source_path).exists():
+                self._delete_source(connection, source_path)
+                removed += 1
+
+        return removed
+
+    def load_evaluations(
+        self,
+        person: Optional[str] = None,
+        year: Optional[str] = None,
+        directory: Optional[Union[str, Path]] = None,
+    ) -> pd.DataFrame:
+        """Load flattened evaluation rows from the store.
+
+        The frequencia_colaborador and frequencia_grupo columns hold the
+        index-weighted mean of each frequency vector; the raw vectors are
+        returned in the freq_colaborador_* and freq_grupo_* columns.
+
+        Args:
+            person: Optional person filter
+            year: Optional year filter
+            directory: Only return rows ingested from files under this directory
+
+        Returns:
+            DataFrame with one row per avaliacao, in file order
+        """
+        connection = self._connect()
+
+        def weighted_mean(columns: List[str]) -> str:
+            numerator = " + ".join(f"{i} * {c}" for i, c in enumerate(columns))
+            denominator = " + ".join(columns)
+            return f"CAST({numerator} AS DOUBLE) / ({denominator})"
+
+        conditions = []
+        params = []
+        if person is not None:
+            conditions.append("pessoa = ?")
+            params.append(person)
+        if year is not None:
+            conditions.append("ano = ?")
+            params.append(year)
+        if directory is not None:
+            conditions.append("starts_with(source_path, ?)")
+            params.append(os.path.join(str(Path(directory).resolve()), ""))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        query = f"""
+            SELECT
+                pessoa, ano, cargo, nivel, department, conceito,
+                direcionador, direcionador_pergunta_final,
+                comportamento, comportamento_pergunta_final, avaliador,
+                {weighted_mean(FREQ_COLABORADOR_COLUMNS)} AS frequencia_colaborador,
+                {weighted_mean(FREQ_GRUPO_COLUMNS)} AS frequencia_grupo,
+                {", ".join(FREQ_COLABORADOR_COLUMNS + FREQ_GRUPO_COLUMNS)}
+            FROM evaluations
+            {where}
+            ORDER BY source_path, ordinal
+        """
+        return connection.execute(query, params).df()
 
     def load_performance_evaluations(self, person_id: str) -> Dict[str, float]:
         """Load performance evaluation data for a person.
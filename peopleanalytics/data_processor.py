@@ -5,15 +5,31 @@ This module provides functionality for processing people evaluation data,
 focusing on importing and validating resultado.json files.
 """
 
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pandas as pd
 
-from .data_pipeline import DataPipeline
+from .data_pipeline import FREQ_COLABORADOR_COLUMNS, FREQ_GRUPO_COLUMNS, DataPipeline
+from .evaluation_corpus import EvaluationCorpus
+from .schema_validator import get_validator, validate_directory
+from .scoring_engine import get_scoring_engine
+
+# Columns shared by the flattened evaluation frames used in reports
+EVALUATION_COLUMNS = [
+    "pessoa",
+    "ano",
+    "cargo",
+    "nivel",
+    "conceito",
+    "direcionador",
+    "comportamento",
+    "avaliador",
+    "frequencia_colaborador",
+    "frequencia_grupo",
+]
 
 
 class DataProcessor:
@@ -41,8 +57,15 @@ class DataProcessor:
         # Setup logging
         self._setup_logging()
 
-        # Initialize the data pipeline for core operations
-        self.pipeline = DataPipeline(str(self.data_path))
+        # Initialize the data pipeline for core operations, backed by a
+        # columnar evaluation store kept alongside the generated output
+        self.pipeline = DataPipeline(
+            str(self.data_path),
+            store_path=self.output_path / "store" / "evaluations.duckdb",
+        )
+
+        # Flattened rows shared by all report generators, loaded on first use
+        self.corpus = EvaluationCorpus(self.pipeline, self.data_path)
 
     def _setup_logging(self):
         """Set up logging for the data processor."""
@@ -68,6 +91,12 @@ class DataProcessor:
     ) -> Dict[str, Any]:
         """Import all resultado.json files from a directory.
 
+        Each file is flattened into the pipeline's evaluation store; files that
+        are unchanged since the last import are skipped, and stored data for
+        files that were removed from the directory is pruned. Schema
+        violations of imported files are logged and returned by file in
+        ``schema_errors``.
+
         Args:
             directory: Directory to import from
             recursive: Whether to search recursively
@@ -86,6 +115,10 @@ class DataProcessor:
         else:
             files = list(directory.glob("*/resultado.json"))
 
+        # Drop stored rows for files that no longer exist
+        if self.pipeline.prune_missing(directory):
+            self.corpus.invalidate()
+
         if not files:
             self.logger.info(f"No files found in {directory}")
             return {"success": True, "imported": 0, "message": "No files found"}
@@ -98,6 +131,7 @@ class DataProcessor:
             "failed": 0,
             "skipped": 0,
             "errors": [],
+            "schema_errors": {},
         }
 
         for file_path in files:
@@ -106,6 +140,8 @@ class DataProcessor:
                 if file_path.stat().st_size == 0:
                     self.logger.warning(f"Skipping empty file: {file_path}")
                     results["skipped"] += 1
+                    if self.pipeline.remove_source(file_path):
+                        self.corpus.invalidate()
                     continue
 
                 # Extract person and year from path
@@ -121,13 +157,24 @@ class DataProcessor:
                     str(file_path), year=year, person=person, overwrite=False
                 )
 
+                schema_errors = ingest_result.get("schema_errors")
+                if schema_errors:
+                    self.logger.warning(
+                        f"{file_path} does not match the resultado schema: "
+                        + "; ".join(schema_errors)
+                    )
+                    results["schema_errors"][str(file_path)] = schema_errors
+
                 if ingest_result.get("success", False):
                     results["imported"] += 1
+                    self.corpus.invalidate()
                 else:
                     error_type = ingest_result.get("error_type", "unknown")
                     if error_type == "exists":
                         results["skipped"] += 1
                     else:
+                        # Rows of a file that no longer ingests may have been dropped
+                        self.corpus.invalidate()
                         results["failed"] += 1
                         results["errors"].append(
                             {
@@ -142,84 +189,80 @@ class DataProcessor:
 
         return results
 
-    def _validate_schema(self, data: Dict) -> bool:
-        """Validate the data against the required schema.
+    def _load_evaluation_frame(
+        self,
+        stakeholder_type: bool = False,
+        department: bool = False,
+        raw: bool = False,
+    ) -> pd.DataFrame:
+        """Load the flattened evaluation rows for the data directory.
+
+        The data directory is imported into the evaluation store and read
+        into the shared corpus once per processor; later calls only select
+        columns from the in-memory corpus.
 
         Args:
-            data: Data to validate
+            stakeholder_type: Include the stakeholder_type column
+                (manager, self or peer) derived from the avaliador
+            department: Include the department column from perfil.json
+            raw: Return every store column, including the raw
+                frequency vectors and the pergunta_final texts
 
         Returns:
-            True if valid, False otherwise
+            DataFrame with one row per avaliacao
         """
-        try:
-            # Check basic structure
-            if not isinstance(data, dict):
-                return False
-
-            # Check success fields
-            if "success" not in data or "status_code" not in data or "data" not in data:
-                return False
+        if not self.corpus.loaded:
+            import_result = self.import_directory(self.data_path)
+            for error in import_result.get("errors", []):
+                self.logger.error(f"Error processing {error['file']}: {error['error']}")
 
-            # Check data structure
-            if not isinstance(data["data"], dict):
-                return False
+        df = self.corpus.frame
+        if raw:
+            return df.drop(columns="stakeholder_type")
 
-            # Check required fields in data
-            if (
-                "conceito_ciclo_filho_descricao" not in data["data"]
-                or "direcionadores" not in data["data"]
-            ):
-                return False
+        columns = list(EVALUATION_COLUMNS)
+        if department:
+            columns.insert(columns.index("nivel") + 1, "department")
+        if stakeholder_type:
+            columns.insert(columns.index("avaliador") + 1, "stakeholder_type")
 
-            # Validate direcionadores
-            for direcionador in data["data"]["direcionadores"]:
-                if not isinstance(direcionador, dict):
-                    return False
+        # Column selection copies, so generators may add columns freely
+        return df[columns]
 
-                # Check required fields in direcionador
-                if (
-                    "direcionador" not in direcionador
-                    or "pergunta_final" not in direcionador
-                    or "comportamentos" not in direcionador
-                ):
-                    return False
+    def _validate_schema(self, data: Dict) -> bool:
+        """Validate the data against the resultado schema.
 
-                # Validate comportamentos
-                for comportamento in direcionador["comportamentos"]:
-                    if not isinstance(comportamento, dict):
-                        return False
+        Args:
+            data: Data to validate
 
-                    # Check required fields in comportamento
-                    if (
-                        "comportamento" not in comportamento
-                        or "pergunta_final" not in comportamento
-                        or "avaliacoes_grupo" not in comportamento
-                    ):
-                        return False
-
-                    # Validate avaliacoes_grupo
-                    for avaliacao in comportamento["avaliacoes_grupo"]:
-                        if not isinstance(avaliacao, dict):
-                            return False
-
-                        # Check required fields in avaliacao
-                        if (
-                            "avaliador" not in avaliacao
-                            or "frequencia_colaborador" not in avaliacao
-                            or "frequencia_grupo" not in avaliacao
-                        ):
-                            return False
+        Returns:
+            True if valid, False otherwise
+        """
+        return get_validator("resultado").is_valid(data)
 
-                        # Check frequencia arrays
-                        if not isinstance(
-                            avaliacao["frequencia_colaborador"], list
-                        ) or not isinstance(avaliacao["frequencia_grupo"], list):
-                            return False
+    def validate_directory(
+        self,
+        directory: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
+        executor: str = "thread",
+    ) -> Dict[str, List[str]]:
+        """Validate every resultado.json of a directory against the schema.
 
-            return True
+        Args:
+            directory: Directory to validate (defaults to the data path)
+            workers: Number of parallel workers
+            executor: "thread" or "process"
 
-        except Exception:
-            return False
+        Returns:
+            Dict mapping the path of each invalid file to its violations,
+            formatted as "<json path>: <message>"
+        """
+        invalid = validate_directory(
+            directory or self.data_path, workers=workers, executor=executor
+        )
+        return {
+            path: [str(error) for error in errors] for path, errors in invalid.items()
+        }
 
     def generate_report(self) -> str:
         """Generate a report of all evaluation data.
@@ -227,77 +270,13 @@ class DataProcessor:
         Returns:
             Path to the generated report file
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate report")
-            return None
-
-        # Collect all data
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate report")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -309,7 +288,9 @@ class DataProcessor:
         with pd.ExcelWriter(report_file) as writer:
             # Overall summary
             summary = (
-                df.groupby(["pessoa", "ano", "cargo", "nivel", "conceito"])
+                df.groupby(
+                    ["pessoa", "ano", "cargo", "nivel", "conceito"], observed=True
+                )
                 .agg({"frequencia_colaborador": "mean", "frequencia_grupo": "mean"})
                 .reset_index()
             )
@@ -337,77 +318,13 @@ class DataProcessor:
         Returns:
             Path to the generated summary file
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate summary")
-            return None
-
-        # Collect all data
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate summary")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -511,77 +428,13 @@ class DataProcessor:
         Returns:
             Path to the generated mermaid file
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate mermaid chart")
-            return None
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        # Collect all data
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate mermaid chart")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -631,7 +484,7 @@ class DataProcessor:
             content.append("pie")
             content.append(f"    title Assessment Distribution for {person}")
 
-            conceitos = person_data.groupby("conceito").size()
+            conceitos = person_data.groupby("conceito", observed=True).size()
             for conceito, count in conceitos.items():
                 content.append(f'    "{conceito}" : {count}')
 
@@ -688,94 +541,57 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to prompt file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate AI prompts")
-            return None
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(raw=True)
 
-        # Collect all data by person
+        # Rebuild the direcionador -> comportamento -> avaliacao hierarchy.
+        # Rows come back in file order, so each level is a run of equal keys.
         person_data = {}
+        freq_colaborador = df[FREQ_COLABORADOR_COLUMNS].to_numpy().tolist()
+        freq_grupo = df[FREQ_GRUPO_COLUMNS].to_numpy().tolist()
+
+        for index, row in enumerate(df.itertuples(index=False)):
+            years_data = person_data.setdefault(row.pessoa, [])
+            if not years_data or years_data[-1]["year"] != row.ano:
+                years_data.append(
+                    {
+                        "year": row.ano,
+                        "job_title": row.cargo,
+                        "job_level": row.nivel,
+                        "overall_assessment": row.conceito,
+                        "competencies": [],
+                    }
+                )
 
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                if person not in person_data:
-                    person_data[person] = []
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Add year data
-                year_data = {
-                    "year": year,
-                    "job_title": perfil["cargo"],
-                    "job_level": perfil["nivel_cargo"],
-                    "overall_assessment": data["data"][
-                        "conceito_ciclo_filho_descricao"
-                    ],
-                    "competencies": [],
-                }
-
-                # Process competencies
-                for direcionador in data["data"]["direcionadores"]:
-                    competency = {
-                        "name": direcionador["direcionador"],
-                        "final_question": direcionador["pergunta_final"],
+            competencies = years_data[-1]["competencies"]
+            if not competencies or competencies[-1]["name"] != row.direcionador:
+                competencies.append(
+                    {
+                        "name": row.direcionador,
+                        "final_question": row.direcionador_pergunta_final,
                         "behaviors": [],
                     }
+                )
 
-                    for comportamento in direcionador["comportamentos"]:
-                        behavior = {
-                            "name": comportamento["comportamento"],
-                            "final_question": comportamento["pergunta_final"],
-                            "evaluations": [],
-                        }
-
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            evaluation = {
-                                "evaluator": avaliacao["avaliador"],
-                                "individual_freq": avaliacao["frequencia_colaborador"],
-                                "group_freq": avaliacao["frequencia_grupo"],
-                                "individual_score": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "group_score": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            behavior["evaluations"].append(evaluation)
-
-                        competency["behaviors"].append(behavior)
-
-                    year_data["competencies"].append(competency)
-
-                person_data[person].append(year_data)
+            behaviors = competencies[-1]["behaviors"]
+            if not behaviors or behaviors[-1]["name"] != row.comportamento:
+                behaviors.append(
+                    {
+                        "name": row.comportamento,
+                        "final_question": row.comportamento_pergunta_final,
+                        "evaluations": [],
+                    }
+                )
 
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+            behaviors[-1]["evaluations"].append(
+                {
+                    "evaluator": row.avaliador,
+                    "individual_freq": freq_colaborador[index],
+                    "group_freq": freq_grupo[index],
+                    "individual_score": row.frequencia_colaborador,
+                    "group_score": row.frequencia_grupo,
+                }
+            )
 
         if not person_data:
             self.logger.warning("No valid data found to generate AI prompts")
@@ -1035,88 +851,19 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate stakeholder comparison")
-            return None
-
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            # Determine the stakeholder type - assuming 'avaliador' field contains this info
-                            stakeholder = avaliacao["avaliador"].lower()
-                            if "gestor" in stakeholder or "manager" in stakeholder:
-                                stakeholder_type = "manager"
-                            elif "auto" in stakeholder or "self" in stakeholder:
-                                stakeholder_type = "self"
-                            else:
-                                stakeholder_type = "peer"
-
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "stakeholder_type": stakeholder_type,
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(stakeholder_type=True)
 
-        if not all_data:
+        if df.empty:
             self.logger.warning(
                 "No valid data found to generate stakeholder comparison"
             )
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
+        # Scores of the shared scoring engine, computed once per corpus
+        scores = get_scoring_engine().corpus_scores(self.corpus)
+        df["frequencia_colaborador"] = scores["index_mean_colaborador"]
+        df["frequencia_grupo"] = scores["index_mean_grupo"]
 
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -1157,10 +904,10 @@ class DataProcessor:
                 "|------------|--------------|-------------------|-----------|"
             )
 
-            stakeholder_avgs = latest_data.groupby("stakeholder_type")[
+            stakeholder_avgs = latest_data.groupby("stakeholder_type", observed=True)[
                 "frequencia_colaborador"
             ].mean()
-            group_avgs = latest_data.groupby("stakeholder_type")[
+            group_avgs = latest_data.groupby("stakeholder_type", observed=True)[
                 "frequencia_grupo"
             ].mean()
 
@@ -1233,9 +980,9 @@ class DataProcessor:
             content.append("")
 
             # High performance areas
-            high_perf = latest_data.groupby(["direcionador", "comportamento"])[
-                "frequencia_colaborador"
-            ].mean()
+            high_perf = latest_data.groupby(
+                ["direcionador", "comportamento"], observed=True
+            )["frequencia_colaborador"].mean()
             high_perf = high_perf.sort_values(ascending=False).head(3)
 
             content.append("### Strongest Areas")
@@ -1249,9 +996,9 @@ class DataProcessor:
             content.append("")
 
             # Low performance areas
-            low_perf = latest_data.groupby(["direcionador", "comportamento"])[
-                "frequencia_colaborador"
-            ].mean()
+            low_perf = latest_data.groupby(
+                ["direcionador", "comportamento"], observed=True
+            )["frequencia_colaborador"].mean()
             low_perf = low_perf.sort_values().head(3)
 
             content.append("### Development Areas")
@@ -1284,9 +1031,9 @@ class DataProcessor:
                         & (latest_data["comportamento"] == comportamento)
                     ]
 
-                    stakeholder_scores = comp_data.groupby("stakeholder_type")[
-                        "frequencia_colaborador"
-                    ].mean()
+                    stakeholder_scores = comp_data.groupby(
+                        "stakeholder_type", observed=True
+                    )["frequencia_colaborador"].mean()
                     if (
                         len(stakeholder_scores) > 1
                     ):  # Need at least 2 stakeholders to compare
@@ -1355,77 +1102,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate time series analysis")
-            return None
-
-        # Collect all data by person and year
-        all_data = []
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate time series analysis")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -1687,87 +1370,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate radar chart")
-            return None
-
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            # Determine the stakeholder type
-                            stakeholder = avaliacao["avaliador"].lower()
-                            if "gestor" in stakeholder or "manager" in stakeholder:
-                                stakeholder_type = "manager"
-                            elif "auto" in stakeholder or "self" in stakeholder:
-                                stakeholder_type = "self"
-                            else:
-                                stakeholder_type = "peer"
-
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "stakeholder_type": stakeholder_type,
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(stakeholder_type=True)
 
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate radar chart")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -1800,7 +1409,9 @@ class DataProcessor:
 
             # Create chart data by competency area
             competency_data = (
-                latest_data.groupby("direcionador")["frequencia_colaborador"]
+                latest_data.groupby("direcionador", observed=True)[
+                    "frequencia_colaborador"
+                ]
                 .mean()
                 .reset_index()
             )
@@ -1814,7 +1425,7 @@ class DataProcessor:
                 ]
                 if not stakeholder_latest.empty:
                     temp_data = (
-                        stakeholder_latest.groupby("direcionador")[
+                        stakeholder_latest.groupby("direcionador", observed=True)[
                             "frequencia_colaborador"
                         ]
                         .mean()
@@ -1914,7 +1525,7 @@ class DataProcessor:
 
             # Add peer group scores
             peer_group_data = (
-                latest_data.groupby("direcionador")["frequencia_grupo"]
+                latest_data.groupby("direcionador", observed=True)["frequencia_grupo"]
                 .mean()
                 .reset_index()
             )
@@ -2040,83 +1651,13 @@ class DataProcessor:
         Returns:
             Path to the generated report file
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate team aggregation")
-            return None
-
-        # Collect all data
-        all_data = []
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(department=True)
 
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Extract team/department info (assuming it's in the profile)
-                department = "Unknown"
-                if "department" in perfil:
-                    department = perfil["department"]
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "department": department,
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate team aggregation")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -2148,7 +1689,7 @@ class DataProcessor:
 
         # Department performance table
         dept_avg = (
-            latest_data.groupby("department")["frequencia_colaborador"]
+            latest_data.groupby("department", observed=True)["frequencia_colaborador"]
             .agg(["mean", "count"])
             .reset_index()
         )
@@ -2203,7 +1744,9 @@ class DataProcessor:
 
             # Aggregate by competency
             comp_avg = (
-                dept_data.groupby("direcionador")["frequencia_colaborador"]
+                dept_data.groupby("direcionador", observed=True)[
+                    "frequencia_colaborador"
+                ]
                 .mean()
                 .reset_index()
             )
@@ -2254,7 +1797,7 @@ class DataProcessor:
 
         # Get top competencies
         top_competencies = (
-            latest_data.groupby("direcionador")["frequencia_colaborador"]
+            latest_data.groupby("direcionador", observed=True)["frequencia_colaborador"]
             .mean()
             .sort_values(ascending=False)
             .head(5)
@@ -2269,7 +1812,7 @@ class DataProcessor:
 
             # Department performance on this competency
             dept_comp_avg = (
-                comp_data.groupby("department")["frequencia_colaborador"]
+                comp_data.groupby("department", observed=True)["frequencia_colaborador"]
                 .mean()
                 .reset_index()
             )
@@ -2324,7 +1867,7 @@ class DataProcessor:
 
         # Calculate competency averages
         comp_avg = (
-            latest_data.groupby("direcionador")["frequencia_colaborador"]
+            latest_data.groupby("direcionador", observed=True)["frequencia_colaborador"]
             .mean()
             .reset_index()
         )
@@ -2392,7 +1935,7 @@ class DataProcessor:
 
         # Find common development areas
         overall_comp_avg = (
-            latest_data.groupby("direcionador")["frequencia_colaborador"]
+            latest_data.groupby("direcionador", observed=True)["frequencia_colaborador"]
             .mean()
             .reset_index()
         )
@@ -2433,77 +1976,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate benchmark reports")
-            return None
-
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate benchmark reports")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -2653,7 +2132,9 @@ class DataProcessor:
 
             # Prepare data
             comp_avg = (
-                latest_data.groupby("direcionador")["frequencia_colaborador"]
+                latest_data.groupby("direcionador", observed=True)[
+                    "frequencia_colaborador"
+                ]
                 .mean()
                 .reset_index()
             )
@@ -2758,7 +2239,7 @@ class DataProcessor:
 
             # Calculate peer group averages by competency
             peer_avg = (
-                latest_data.groupby("direcionador")["frequencia_grupo"]
+                latest_data.groupby("direcionador", observed=True)["frequencia_grupo"]
                 .mean()
                 .reset_index()
             )
@@ -2849,87 +2330,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate heat maps")
-            return None
-
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            # Determine the stakeholder type
-                            stakeholder = avaliacao["avaliador"].lower()
-                            if "gestor" in stakeholder or "manager" in stakeholder:
-                                stakeholder_type = "manager"
-                            elif "auto" in stakeholder or "self" in stakeholder:
-                                stakeholder_type = "self"
-                            else:
-                                stakeholder_type = "peer"
-
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "stakeholder_type": stakeholder_type,
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(stakeholder_type=True)
 
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate heat maps")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -3040,19 +2447,21 @@ class DataProcessor:
 
             # Calculate averages by competency and stakeholder
             comp_data = (
-                latest_data.groupby(["direcionador", "stakeholder_type"])[
-                    "frequencia_colaborador"
-                ]
+                latest_data.groupby(
+                    ["direcionador", "stakeholder_type"], observed=True
+                )["frequencia_colaborador"]
                 .mean()
                 .reset_index()
             )
             comp_overall = (
-                latest_data.groupby("direcionador")["frequencia_colaborador"]
+                latest_data.groupby("direcionador", observed=True)[
+                    "frequencia_colaborador"
+                ]
                 .mean()
                 .reset_index()
             )
             comp_group = (
-                latest_data.groupby("direcionador")["frequencia_grupo"]
+                latest_data.groupby("direcionador", observed=True)["frequencia_grupo"]
                 .mean()
                 .reset_index()
             )
@@ -3143,89 +2552,15 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate natural language summaries")
-            return None
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame(stakeholder_type=True)
 
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            # Determine the stakeholder type
-                            stakeholder = avaliacao["avaliador"].lower()
-                            if "gestor" in stakeholder or "manager" in stakeholder:
-                                stakeholder_type = "manager"
-                            elif "auto" in stakeholder or "self" in stakeholder:
-                                stakeholder_type = "self"
-                            else:
-                                stakeholder_type = "peer"
-
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "stakeholder_type": stakeholder_type,
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning(
                 "No valid data found to generate natural language summaries"
             )
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -3268,7 +2603,7 @@ class DataProcessor:
             score_diff = overall_score - group_score
 
             # Get top and bottom competencies
-            comp_scores = latest_data.groupby("direcionador")[
+            comp_scores = latest_data.groupby("direcionador", observed=True)[
                 "frequencia_colaborador"
             ].mean()
             top_comps = comp_scores.nlargest(2)
@@ -3357,7 +2692,7 @@ class DataProcessor:
             summary.append(development)
 
             # Stakeholder perspective paragraph
-            stakeholder_data = latest_data.groupby("stakeholder_type")[
+            stakeholder_data = latest_data.groupby("stakeholder_type", observed=True)[
                 "frequencia_colaborador"
             ].mean()
 
@@ -3438,77 +2773,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
-
-        if not files:
-            self.logger.warning("No files found to generate action plans")
-            return None
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate action plans")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -3577,7 +2848,9 @@ class DataProcessor:
 
             # Calculate scores by competency
             comp_scores = (
-                latest_data.groupby("direcionador")["frequencia_colaborador"]
+                latest_data.groupby("direcionador", observed=True)[
+                    "frequencia_colaborador"
+                ]
                 .mean()
                 .reset_index()
             )
@@ -3745,77 +3018,13 @@ class DataProcessor:
         Returns:
             Dictionary mapping person names to report file paths
         """
-        # Find all resultado.json files
-        files = list(self.data_path.glob("**/resultado.json"))
+        # Load flattened evaluation rows from the columnar store
+        df = self._load_evaluation_frame()
 
-        if not files:
-            self.logger.warning("No files found to generate individual reports")
-            return None
-
-        # Collect all data by person
-        all_data = []
-
-        for file_path in files:
-            try:
-                # Skip empty files
-                if file_path.stat().st_size == 0:
-                    continue
-
-                # Extract person and year from path
-                parts = file_path.parts
-                person = parts[-3]
-                year = parts[-2]
-
-                # Load the file
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-
-                # Load profile
-                perfil_path = file_path.parent / "perfil.json"
-                with open(perfil_path, "r", encoding="utf-8") as f:
-                    perfil = json.load(f)
-
-                # Process data
-                for direcionador in data["data"]["direcionadores"]:
-                    for comportamento in direcionador["comportamentos"]:
-                        for avaliacao in comportamento["avaliacoes_grupo"]:
-                            row = {
-                                "pessoa": person,
-                                "ano": year,
-                                "cargo": perfil["cargo"],
-                                "nivel": perfil["nivel_cargo"],
-                                "conceito": data["data"][
-                                    "conceito_ciclo_filho_descricao"
-                                ],
-                                "direcionador": direcionador["direcionador"],
-                                "comportamento": comportamento["comportamento"],
-                                "avaliador": avaliacao["avaliador"],
-                                "frequencia_colaborador": sum(
-                                    i * v
-                                    for i, v in enumerate(
-                                        avaliacao["frequencia_colaborador"]
-                                    )
-                                )
-                                / sum(avaliacao["frequencia_colaborador"]),
-                                "frequencia_grupo": sum(
-                                    i * v
-                                    for i, v in enumerate(avaliacao["frequencia_grupo"])
-                                )
-                                / sum(avaliacao["frequencia_grupo"]),
-                            }
-                            all_data.append(row)
-
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                continue
-
-        if not all_data:
+        if df.empty:
             self.logger.warning("No valid data found to generate individual reports")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(all_data)
-
         # Generate timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -3872,7 +3081,7 @@ class DataProcessor:
             content.append("")
 
             # Group by stakeholder type
-            stakeholder_scores = latest_data.groupby("avaliador")[
+            stakeholder_scores = latest_data.groupby("avaliador", observed=True)[
                 "frequencia_colaborador"
             ].mean()
 
@@ -0,0 +1,123 @@
+"""
+Memoized report intermediates for the report generator.
+
+Every report of a person-year extracts the same behavior and group data from
+the evaluation data and derives the same statistics and correlations from
+them. ExtractionCache keeps these intermediates per input: entries are keyed
+by the SHA-256 hash of the data content, so equal data loaded twice shares
+them, and an identity index remembers the hash of each data dict already
+seen so it is only serialized once.
+
+Data is assumed not to change in place while cached; call invalidate() after
+mutating a dict. The least recently used inputs are evicted beyond maxsize.
+"""
+
+import collections
+import hashlib
+import json
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Inputs (person-years) whose intermediates are kept
+DEFAULT_MAXSIZE = 64
+
+
+class ExtractionCache:
+    """Caches report intermediates by data identity and content hash."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Inputs whose intermediates are kept
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # id(data) -> (data, digest); holding data keeps its id from reuse
+        self._identities: "collections.OrderedDict[int, tuple]" = (
+            collections.OrderedDict()
+        )
+        # digest -> {intermediate name: value}
+        self._entries: "collections.OrderedDict[str, Dict[Hashable, Any]]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(data: Any) -> str:
+        """Compute the SHA-256 hash of the JSON serialization of data."""
+        content = json.dumps(data, sort_keys=True, default=repr, ensure_ascii=False)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _digest(self, data: Any) -> str:
+        """Return the content hash of data, hashing each dict only once."""
+        with self._lock:
+            identity = self._identities.get(id(data))
+            if identity is not None and identity[0] is data:
+                self._identities.move_to_end(id(data))
+                return identity[1]
+
+        digest = self.content_hash(data)
+        with self._lock:
+            self._identities[id(data)] = (data, digest)
+            while len(self._identities) > self.maxsize:
+                self._identities.popitem(last=False)
+        return digest
+
+    def get_or_compute(
+        self, name: Hashable, data: Any, compute: Callable[[], Any]
+    ) -> Any:
+        """Return an intermediate of data, computing it only on a miss.
+
+        Cached values are shared between callers and must not be mutated.
+        Errors of compute propagate and nothing is stored.
+
+        Args:
+            name: Intermediate name
+            data: Input the intermediate is derived from
+            compute: Computes the intermediate
+
+        Returns:
+            The intermediate
+        """
+        digest = self._digest(data)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is not None and name in entry:
+                self.hits += 1
+                self._entries.move_to_end(digest)
+                return entry[name]
+            self.misses += 1
+
+        value = compute()
+        with self._lock:
+            self._entries.setdefault(digest, {})[name] = value
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, data: Optional[Any] = None) -> None:
+        """Drop the intermediates of data, or of every input if None.
+
+        Call this after changing a data dict in place; its content is hashed
+        again on the next lookup.
+        """
+        with self._lock:
+            if data is None:
+                self._identities.clear()
+                self._entries.clear()
+                return
+            identity = self._identities.pop(id(data), None)
+            if identity is not None and identity[0] is data:
+                self._entries.pop(identity[1], None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the hit and miss counters and the number of cached inputs."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+            }
@@ -5,19 +5,103 @@ This module is responsible for parsing, validating, and extracting data
 from JSON files containing performance evaluation data.
 """
 
-import json
 import logging
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from peopleanalytics.frequency_tensor import (
+    MISSING_CODE,
+    ROW_GROUP,
+    FrequencyTensor,
+)
+from peopleanalytics.json_loader import load_json, loads
+from peopleanalytics.parse_cache import parse_file
+from peopleanalytics.scoring_engine import GLOBAL_SCORE_WEIGHTS, get_scoring_engine
+from peopleanalytics.vocabulary import intern_label
 
 logger = logging.getLogger(__name__)
 
+# Parse cache namespace of extract_evaluation_data results
+EXTRACTED_NAMESPACE = "json_processor.extracted"
+
+
+def _as_list(frequencies) -> List:
+    """Return a frequency vector as a list, converting tensor views."""
+    if hasattr(frequencies, "tolist"):
+        return frequencies.tolist()
+    return frequencies
+
+
+def _global_score(frequencies) -> float:
+    """Return the 0-5 weighted score of a frequency vector.
+
+    Vectors shorter than six values are padded with zeros, which scores them
+    like the weighted sum over the values given. Vectors the scoring engine
+    rejects are scored with that weighted sum directly.
+    """
+    frequencies = _as_list(frequencies)
+    if len(frequencies) < 6:
+        frequencies = list(frequencies) + [0] * (6 - len(frequencies))
+    try:
+        return get_scoring_engine().score(frequencies, "global")
+    except ValueError:
+        pass
+
+    # Weights: N/A=0, Referência=5, Acima=4, Dentro=3, Abaixo=2, Muito abaixo=1
+    weights = GLOBAL_SCORE_WEIGHTS
+    score = 0
+    total = sum(frequencies)
+    if total > 0:
+        for i, freq in enumerate(frequencies):
+            score += (freq / total) * weights[i]
+    return score
+
 
 class JsonProcessor:
     """Processes performance evaluation data from JSON files."""
 
-    def __init__(self):
-        """Initialize the JSON processor."""
+    def __init__(
+        self,
+        data_dir: Optional[Union[str, Path]] = None,
+        use_tensor: bool = False,
+        tensor_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the JSON processor.
+
+        Args:
+            data_dir: Directory with the <pessoa>/<ano>/resultado.json
+                structure, required by use_tensor
+            use_tensor: Read the frequency vectors of files under data_dir
+                from its memory-mapped FrequencyTensor instead of the JSON
+                files
+            tensor_dir: Where the tensor is kept (defaults to
+                FrequencyTensor.default_dir())
+        """
         self.logger = logging.getLogger(__name__)
+        self.data_dir = Path(data_dir).resolve() if data_dir else None
+        self.use_tensor = use_tensor and self.data_dir is not None
+        self.tensor_dir = tensor_dir
+        self._tensor = None
+
+    @property
+    def tensor(self) -> Optional[FrequencyTensor]:
+        """The frequency tensor of data_dir, opened (or rebuilt) on first access."""
+        if self.use_tensor and self._tensor is None:
+            try:
+                self._tensor = FrequencyTensor.open(self.data_dir, self.tensor_dir)
+            except Exception as e:
+                self.logger.error(
+                    f"Error opening frequency tensor, reading JSON files: {e}"
+                )
+                self.use_tensor = False
+        return self._tensor
+
+    def _tensor_key(self, json_file_path: str) -> Optional[Tuple[str, str]]:
+        """Return the (pessoa, ano) of a resultado.json file under data_dir."""
+        path = Path(json_file_path).resolve()
+        if path.name != "resultado.json" or path.parent.parent.parent != self.data_dir:
+            return None
+        return path.parent.parent.name, path.parent.name
 
     def load_json_file(self, file_path: str) -> Dict:
         """
@@ -30,9 +114,7 @@ class JsonProcessor:
             Dictionary with parsed JSON data, or empty dict on error
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data
+            return load_json(file_path)
         except Exception as e:
             self.logger.error(f"Error loading JSON file {file_path}: {e}")
             return {}
@@ -60,7 +142,9 @@ class JsonProcessor:
 
         # Extract basic information
         extracted = {
-            "conceito": data.get("conceito_ciclo_filho_descricao", "Não disponível"),
+            "conceito": intern_label(
+                "conceito", data.get("conceito_ciclo_filho_descricao", "Não disponível")
+            ),
             "peer_group": data.get("nome_peer_group"),
             "direcionadores": {},
             "comportamentos": {},
@@ -75,7 +159,9 @@ class JsonProcessor:
 
         # Process each direcionador
         for direcionador_data in direcionadores:
-            direcionador_name = direcionador_data.get("direcionador", "Unknown")
+            direcionador_name = intern_label(
+                "direcionador", direcionador_data.get("direcionador", "Unknown")
+            )
             extracted["direcionadores"][direcionador_name] = {
                 "pergunta_final": direcionador_data.get("pergunta_final", False),
                 "comportamentos": [],
@@ -84,7 +170,9 @@ class JsonProcessor:
             # Process comportamentos within this direcionador
             comportamentos = direcionador_data.get("comportamentos", [])
             for comportamento_data in comportamentos:
-                comportamento_name = comportamento_data.get("comportamento", "Unknown")
+                comportamento_name = intern_label(
+                    "comportamento", comportamento_data.get("comportamento", "Unknown")
+                )
 
                 # Add to the direcionador's comportamentos list
                 extracted["direcionadores"][direcionador_name]["comportamentos"].append(
@@ -101,7 +189,9 @@ class JsonProcessor:
                 # Process avaliacoes for this comportamento
                 avaliacoes = comportamento_data.get("avaliacoes_grupo", [])
                 for avaliacao_data in avaliacoes:
-                    avaliador = avaliacao_data.get("avaliador", "Unknown")
+                    avaliador = intern_label(
+                        "avaliador", avaliacao_data.get("avaliador", "Unknown")
+                    )
 
                     # Extract frequencies
                     freq_colaborador = avaliacao_data.get(
@@ -137,19 +227,34 @@ class JsonProcessor:
         """
         Process an evaluation JSON file.
 
+        With use_tensor, the frequency vectors of documents in the tensor are
+        zero-copy views into its memory map; other documents are extracted
+        from the JSON file, through the shared parse cache when the file
+        content was already extracted.
+
         Args:
             json_file_path: Path to the JSON file
 
         Returns:
             Dictionary with processed data
         """
-        # Load the JSON file
-        json_data = self.load_json_file(json_file_path)
-        if not json_data:
+        if self.tensor is not None:
+            key = self._tensor_key(json_file_path)
+            if key is not None:
+                processed = self.process_tensor_evaluation_data(self.tensor, *key)
+                if processed is not None:
+                    return processed
+
+        # Load and extract the JSON file
+        try:
+            extracted_data = parse_file(
+                json_file_path, EXTRACTED_NAMESPACE, self._extract_content
+            )
+        except Exception as e:
+            self.logger.error(f"Error loading JSON file {json_file_path}: {e}")
+            return {}
+        if extracted_data is None:
             return {}
-
-        # Extract evaluation data
-        extracted_data = self.extract_evaluation_data(json_data)
 
         # Enhance the extracted data with additional metrics
         # Like global scores, status summaries, etc.
@@ -157,6 +262,123 @@ class JsonProcessor:
 
         return enhanced_data
 
+    def _extract_content(self, content: bytes) -> Optional[Dict]:
+        """Decode a JSON document and extract its evaluation data."""
+        json_data = loads(content)
+        if not json_data:
+            return None
+        return self.extract_evaluation_data(json_data)
+
+    def extract_tensor_evaluation_data(
+        self, tensor: FrequencyTensor, pessoa: str, ano: str
+    ) -> Optional[Dict]:
+        """
+        Extract evaluation data of a pessoa/ano from a frequency tensor.
+
+        The result has the same structure as extract_evaluation_data, but the
+        frequency vectors are read-only views into the tensor's memory map
+        instead of lists, so no vector is copied.
+
+        Args:
+            tensor: Frequency tensor of the data directory
+            pessoa: Person name
+            ano: Evaluation year
+
+        Returns:
+            Dictionary with extracted data, or None if the evaluation is not in
+            the tensor (use process_evaluation_data on its JSON file instead)
+        """
+        group = tensor.group(pessoa, ano)
+        if group is None:
+            return None
+
+        extracted = {
+            "conceito": intern_label(
+                "conceito", group.get("conceito", "Não disponível")
+            ),
+            "peer_group": group.get("peer_group"),
+            "direcionadores": {},
+            "comportamentos": {},
+            "avaliacoes": {},
+        }
+        rows = tensor.row_slice(pessoa, ano)
+        if rows.start == rows.stop:
+            self.logger.warning("No 'direcionadores' found in JSON data")
+            return extracted
+
+        frequencies = tensor.frequencies[rows]
+        kinds = tensor.kind[rows]
+        codes = {field: tensor.codes[field][rows] for field in tensor.codes}
+
+        for i in range(len(kinds)):
+            direcionador_name = tensor.label("direcionador", codes["direcionador"][i])
+            if direcionador_name not in extracted["direcionadores"]:
+                extracted["direcionadores"][direcionador_name] = {
+                    "pergunta_final": tensor.label(
+                        "direcionador_pergunta", codes["direcionador_pergunta"][i]
+                    ),
+                    "comportamentos": [],
+                }
+
+            comportamento_code = codes["comportamento"][i]
+            if comportamento_code == MISSING_CODE:
+                continue
+
+            comportamento_name = tensor.label("comportamento", comportamento_code)
+            if comportamento_name not in extracted["comportamentos"]:
+                extracted["direcionadores"][direcionador_name]["comportamentos"].append(
+                    comportamento_name
+                )
+                extracted["comportamentos"][comportamento_name] = {
+                    "direcionador": direcionador_name,
+                    "pergunta_final": tensor.label(
+                        "comportamento_pergunta", codes["comportamento_pergunta"][i]
+                    ),
+                    "avaliacoes": {},
+                }
+
+            # Only avaliacoes_grupo entries are extracted, as from the JSON file
+            if kinds[i] != ROW_GROUP:
+                continue
+
+            avaliador = tensor.label("avaliador", codes["avaliador"][i])
+            freq_colaborador = frequencies[i, 0]
+            freq_grupo = frequencies[i, 1]
+
+            extracted["comportamentos"][comportamento_name]["avaliacoes"][avaliador] = {
+                "freq_colaborador": freq_colaborador,
+                "freq_grupo": freq_grupo,
+            }
+            extracted["avaliacoes"][f"{comportamento_name}:{avaliador}"] = {
+                "comportamento": comportamento_name,
+                "avaliador": avaliador,
+                "freq_colaborador": freq_colaborador,
+                "freq_grupo": freq_grupo,
+            }
+
+        return extracted
+
+    def process_tensor_evaluation_data(
+        self, tensor: FrequencyTensor, pessoa: str, ano: str
+    ) -> Optional[Dict]:
+        """
+        Process the evaluation of a pessoa/ano from a frequency tensor.
+
+        Args:
+            tensor: Frequency tensor of the data directory
+            pessoa: Person name
+            ano: Evaluation year
+
+        Returns:
+            Dictionary with processed data, or None if the evaluation is not in
+            the tensor
+        """
+        extracted_data = self.extract_tensor_evaluation_data(tensor, pessoa, ano)
+        if extracted_data is None:
+            return None
+
+        return self.enhance_evaluation_data(extracted_data)
+
     def enhance_evaluation_data(self, extracted_data: Dict) -> Dict:
         """
         Enhance extracted data with additional derived metrics.
@@ -186,9 +408,11 @@ class JsonProcessor:
         for comp_name, comp_data in enhanced["comportamentos"].items():
             if "todos" in comp_data["avaliacoes"]:
                 avaliacao = comp_data["avaliacoes"]["todos"]
+                freq_colaborador = _as_list(avaliacao["freq_colaborador"])
+                freq_grupo = _as_list(avaliacao["freq_grupo"])
                 for i in range(6):
-                    all_freq_colaborador[i] += avaliacao["freq_colaborador"][i]
-                    all_freq_grupo[i] += avaliacao["freq_grupo"][i]
+                    all_freq_colaborador[i] += freq_colaborador[i]
+                    all_freq_grupo[i] += freq_grupo[i]
                 count += 1
 
         # Calculate averages
@@ -223,9 +447,11 @@ class JsonProcessor:
                     comp_data = enhanced["comportamentos"][comp_name]
                     if "todos" in comp_data["avaliacoes"]:
                         avaliacao = comp_data["avaliacoes"]["todos"]
+                        freq_colaborador = _as_list(avaliacao["freq_colaborador"])
+                        freq_grupo = _as_list(avaliacao["freq_grupo"])
                         for i in range(6):
-                            dir_freq_colaborador[i] += avaliacao["freq_colaborador"][i]
-                            dir_freq_grupo[i] += avaliacao["freq_grupo"][i]
+                            dir_freq_colaborador[i] += freq_colaborador[i]
+                            dir_freq_grupo[i] += freq_grupo[i]
                         dir_count += 1
 
             # Calculate averages for this direcionador
@@ -258,23 +484,9 @@ class JsonProcessor:
         Returns:
             Dictionary with calculated scores
         """
-        # Calculate weighted average scores
-        # Weights: N/A=0, Referência=5, Acima=4, Dentro=3, Abaixo=2, Muito abaixo=1
-        weights = [0, 5, 4, 3, 2, 1]
-
-        # Calculate weighted score for collaborator
-        colab_score = 0
-        colab_total = sum(freq_colaborador)
-        if colab_total > 0:
-            for i, freq in enumerate(freq_colaborador):
-                colab_score += (freq / colab_total) * weights[i]
-
-        # Calculate weighted score for group
-        group_score = 0
-        group_total = sum(freq_grupo)
-        if group_total > 0:
-            for i, freq in enumerate(freq_grupo):
-                group_score += (freq / group_total) * weights[i]
+        # Weighted average scores (0-5), shared with the other scoring models
+        colab_score = _global_score(freq_colaborador)
+        group_score = _global_score(freq_grupo)
 
         # Normalize to 0-100 scale (max score is 5, min is 0)
         colab_norm = (colab_score / 5) * 100 if colab_score > 0 else 0
@@ -0,0 +1,146 @@
+"""
+Dependency-aware task scheduler for report generation.
+
+The reports of a person share intermediate results (behavior and group data,
+behavior statistics, correlations, clusters). ReportDAG runs a set of named
+tasks, each declaring the tasks whose results it needs: every task runs once,
+as soon as its dependencies are done, and independent tasks run concurrently
+on a thread pool.
+"""
+
+import concurrent.futures
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional, Tuple
+
+
+class ReportDAG:
+    """Runs named tasks in dependency order, concurrently where possible."""
+
+    def __init__(self):
+        """Initialize an empty task graph."""
+        self._tasks: Dict[str, Tuple[Callable[..., Any], Tuple[str, ...]]] = {}
+        self._optional: Dict[str, FrozenSet[str]] = {}
+
+    def add(
+        self,
+        name: str,
+        function: Callable[..., Any],
+        dependencies: Iterable[str] = (),
+        optional: Iterable[str] = (),
+    ) -> None:
+        """
+        Add a task to the graph.
+
+        Args:
+            name: Task name, also the keyword its result is passed as
+            function: Called with the result of each dependency as a keyword
+                argument named after it
+            dependencies: Names of the tasks or inputs the task needs
+            optional: Dependencies whose failure passes None to the task
+                instead of skipping it
+
+        Raises:
+            ValueError: If a task with the same name already exists
+        """
+        if name in self._tasks:
+            raise ValueError(f"Duplicate report task: {name}")
+        self._tasks[name] = (function, tuple(dependencies))
+        self._optional[name] = frozenset(optional)
+
+    def _check(self, inputs: Dict[str, Any]) -> None:
+        """Raise ValueError for unknown dependencies and dependency cycles."""
+        for name, (_, dependencies) in self._tasks.items():
+            unknown = [
+                dep
+                for dep in dependencies
+                if dep not in self._tasks and dep not in inputs
+            ]
+            if unknown:
+                raise ValueError(
+                    f"Report task {name} depends on unknown tasks: {', '.join(unknown)}"
+                )
+
+        resolved = set(inputs)
+        remaining = dict(self._tasks)
+        while remaining:
+            ready = [
+                name
+                for name, (_, dependencies) in remaining.items()
+                if resolved.issuperset(dependencies)
+            ]
+            if not ready:
+                raise ValueError(
+                    f"Dependency cycle between report tasks: {', '.join(remaining)}"
+                )
+            resolved.update(ready)
+            for name in ready:
+                del remaining[name]
+
+    def run(
+        self, inputs: Optional[Dict[str, Any]] = None, max_workers: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        """
+        Run every task of the graph.
+
+        A task that raises does not stop the others; the tasks depending on it
+        are skipped and report the same exception, unless the dependency is
+        optional for them.
+
+        Args:
+            inputs: Values available to the tasks as dependencies
+            max_workers: Size of the thread pool (executor default if None)
+
+        Returns:
+            Tuple with the results and the exceptions of the tasks, by name
+
+        Raises:
+            ValueError: If a dependency is unknown or the tasks form a cycle
+        """
+        inputs = dict(inputs or {})
+        self._check(inputs)
+
+        results: Dict[str, Any] = {}
+        errors: Dict[str, Exception] = {}
+        pending = dict(self._tasks)
+        available = dict(inputs)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            running = {}
+
+            def submit_ready():
+                # Skipping a task can make its own dependents skippable
+                skipped = True
+                while skipped:
+                    skipped = False
+                    for name, (function, dependencies) in list(pending.items()):
+                        failed = [
+                            dep
+                            for dep in dependencies
+                            if dep in errors and dep not in self._optional[name]
+                        ]
+                        if failed:
+                            errors[name] = errors[failed[0]]
+                            del pending[name]
+                            skipped = True
+                        elif all(
+                            dep in available or dep in errors for dep in dependencies
+                        ):
+                            arguments = {
+                                dep: available.get(dep) for dep in dependencies
+                            }
+                            running[executor.submit(function, **arguments)] = name
+                            del pending[name]
+
+            submit_ready()
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        available[name] = results[name] = future.result()
+                    except Exception as e:
+                        errors[name] = e
+                submit_ready()
+
+        return results, errors
@@ -8,13 +8,18 @@ visualizations, and insights from performance evaluation data.
 import logging
 import os
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
 
+from peopleanalytics.bootstrap import CI_METHODS, BootstrapEngine
+from peopleanalytics.domain.extraction_cache import ExtractionCache
 from peopleanalytics.domain.mermaid_visualizer import MermaidVisualizer
 from peopleanalytics.domain.pattern_analyzer import PatternAnalyzer
+from peopleanalytics.domain.report_dag import ReportDAG
 from peopleanalytics.domain.statistical_analyzer import StatisticalAnalyzer
+from peopleanalytics.parse_cache import load_json_cached
+from peopleanalytics.significance import get_significance_tester
 
 logger = logging.getLogger(__name__)
 
@@ -22,24 +27,90 @@ logger = logging.getLogger(__name__)
 class ReportGenerator:
     """Generates advanced analytical reports from performance evaluation data."""
 
-    def __init__(self):
-        """Initialize the report generator with needed components."""
+    # Reports of generate_reports: file name, renderer and the shared
+    # intermediates (see _intermediate_tasks) it reads
+    REPORTS = {
+        "executive_summary": (
+            "executive_summary.md",
+            "generate_executive_summary",
+            ("behavior_data", "group_data", "clusters"),
+        ),
+        "gap_analysis": (
+            "gap_analysis.md",
+            "generate_gap_analysis",
+            ("behavior_data", "group_data"),
+        ),
+        "patterns_correlations": (
+            "patterns_correlations.md",
+            "generate_patterns_report",
+            ("behavior_data", "group_data", "behavior_stats", "correlations"),
+        ),
+        "prioritization_roi": (
+            "prioritization_roi.md",
+            "generate_roi_analysis",
+            ("behavior_data", "group_data"),
+        ),
+    }
+
+    def __init__(
+        self,
+        corpus=None,
+        ci_method="fixed",
+        bootstrap_engine=None,
+        extraction_cache=None,
+    ):
+        """
+        Initialize the report generator with needed components.
+
+        Args:
+            corpus: Optional EvaluationCorpus of the whole organization; when
+                given, behavior gaps are judged by the org-wide significance
+                tests instead of the tests of each report alone
+            ci_method: How score and gap confidence intervals are computed:
+                "fixed" widths or "bootstrap" resampling of the frequencies
+            bootstrap_engine: BootstrapEngine used by the "bootstrap" method
+                (a default, seeded engine if not given)
+            extraction_cache: ExtractionCache keeping the intermediates of
+                each input (see _intermediate_tasks) across reports and calls
+                (a new cache if not given)
+
+        Raises:
+            ValueError: If the confidence interval method is unknown
+        """
+        if ci_method not in CI_METHODS:
+            raise ValueError(f"Unknown confidence interval method: {ci_method}")
+
         self.logger = logging.getLogger(__name__)
+        self.corpus = corpus
+        self.ci_method = ci_method
+        self.bootstrap_engine = bootstrap_engine or BootstrapEngine()
+        self.extraction_cache = extraction_cache or ExtractionCache()
         self.stat_analyzer = StatisticalAnalyzer()
         self.pattern_analyzer = PatternAnalyzer()
         self.mermaid_visualizer = MermaidVisualizer()
 
     def generate_reports(
-        self, data: Dict, output_dir: str, pessoa_name: str, ano_name: str
+        self,
+        data: Dict,
+        output_dir: str,
+        pessoa_name: str,
+        ano_name: str,
+        max_workers: Optional[int] = None,
     ) -> Dict[str, str]:
         """
         Generate all types of reports for the given data.
 
+        The reports run as a task graph (see ReportDAG): the intermediates
+        they share are computed once, independent reports are rendered
+        concurrently and the comprehensive report assembles the rendered
+        reports.
+
         Args:
             data: Processed evaluation data dictionary
             output_dir: Directory to save reports
             pessoa_name: Person name
             ano_name: Year or period name
+            max_workers: Threads rendering the reports (executor default if None)
 
         Returns:
             Dictionary mapping report types to file paths
@@ -48,63 +119,236 @@ class ReportGenerator:
         person_dir = os.path.join(output_dir, pessoa_name, ano_name, "reports")
         os.makedirs(person_dir, exist_ok=True)
 
-        # Dictionary to store report file paths
-        report_files = {}
+        dag = ReportDAG()
+        for name, (function, dependencies) in self._intermediate_tasks().items():
+            dag.add(
+                name,
+                self._memoized_task(name, function, dependencies),
+                ("data",) + tuple(dep for dep in dependencies if dep != "data"),
+            )
 
-        try:
-            # Generate the executive summary report
-            exec_report_path = os.path.join(person_dir, "executive_summary.md")
-            exec_content = self.generate_executive_summary(data, pessoa_name, ano_name)
-            with open(exec_report_path, "w", encoding="utf-8") as f:
-                f.write(exec_content)
-            report_files["executive_summary"] = exec_report_path
-
-            # Generate the gap analysis report
-            gap_report_path = os.path.join(person_dir, "gap_analysis.md")
-            gap_content = self.generate_gap_analysis(data, pessoa_name, ano_name)
-            with open(gap_report_path, "w", encoding="utf-8") as f:
-                f.write(gap_content)
-            report_files["gap_analysis"] = gap_report_path
-
-            # Generate the patterns and correlations report
-            pattern_report_path = os.path.join(person_dir, "patterns_correlations.md")
-            pattern_content = self.generate_patterns_report(data, pessoa_name, ano_name)
-            with open(pattern_report_path, "w", encoding="utf-8") as f:
-                f.write(pattern_content)
-            report_files["patterns_correlations"] = pattern_report_path
-
-            # Generate the prioritization and ROI report
-            roi_report_path = os.path.join(person_dir, "prioritization_roi.md")
-            roi_content = self.generate_prioritization_report(
-                data, pessoa_name, ano_name
+        report_paths = {}
+        for report_type, (file_name, renderer, dependencies) in self.REPORTS.items():
+            report_paths[report_type] = os.path.join(person_dir, file_name)
+            dag.add(
+                report_type,
+                self._report_task(
+                    getattr(self, renderer),
+                    report_paths[report_type],
+                    pessoa_name,
+                    ano_name,
+                ),
+                ("data",) + dependencies,
             )
-            with open(roi_report_path, "w", encoding="utf-8") as f:
-                f.write(roi_content)
-            report_files["prioritization_roi"] = roi_report_path
-
-            # Generate the root cause analysis report
-            root_report_path = os.path.join(person_dir, "root_cause_analysis.md")
-            root_content = self.generate_root_cause_report(data, pessoa_name, ano_name)
-            with open(root_report_path, "w", encoding="utf-8") as f:
-                f.write(root_content)
-            report_files["root_cause_analysis"] = root_report_path
-
-            # Generate the comprehensive report (combines all)
-            comprehensive_path = os.path.join(person_dir, "comprehensive_analysis.md")
-            comprehensive_content = self.generate_comprehensive_report(
-                data, pessoa_name, ano_name
+
+        # The comprehensive report combines all the others
+        report_paths["comprehensive"] = os.path.join(
+            person_dir, "comprehensive_analysis.md"
+        )
+
+        def comprehensive_task(**reports):
+            content = self._assemble_comprehensive_report(
+                reports, pessoa_name, ano_name
             )
-            with open(comprehensive_path, "w", encoding="utf-8") as f:
-                f.write(comprehensive_content)
-            report_files["comprehensive"] = comprehensive_path
+            with open(report_paths["comprehensive"], "w", encoding="utf-8") as f:
+                f.write(content)
+            return content
+
+        dag.add(
+            "comprehensive",
+            comprehensive_task,
+            tuple(self.REPORTS),
+            optional=tuple(self.REPORTS),
+        )
 
-        except Exception as e:
-            self.logger.error(f"Error generating reports: {e}")
+        results, errors = dag.run({"data": data}, max_workers=max_workers)
+
+        # Dictionary to store report file paths
+        report_files = {
+            report_type: path
+            for report_type, path in report_paths.items()
+            if report_type in results
+        }
+
+        for name, e in errors.items():
+            self.logger.error(f"Error generating reports ({name}): {e}")
+        if errors:
             # If an error occurred, add error info to the report_files dictionary
-            report_files["error"] = str(e)
+            report_files["error"] = str(next(iter(errors.values())))
 
         return report_files
 
+    def _report_task(
+        self,
+        renderer: Callable[..., str],
+        path: str,
+        pessoa_name: str,
+        ano_name: str,
+    ) -> Callable[..., str]:
+        """
+        Build the generate_reports task that renders a report and saves it.
+
+        Args:
+            renderer: Report method taking data, pessoa_name, ano_name and shared
+            path: File to save the report to
+            pessoa_name: Person name
+            ano_name: Year or period name
+
+        Returns:
+            Task taking the data and the shared intermediates, returning the
+            report content
+        """
+
+        def task(data, **shared):
+            content = renderer(data, pessoa_name, ano_name, shared=shared)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+            return content
+
+        return task
+
+    def _intermediate_tasks(self) -> Dict[str, tuple]:
+        """
+        Return the intermediates shared by the reports.
+
+        Returns:
+            Dictionary mapping each intermediate to the function computing it
+            and the names of its arguments (the data or other intermediates)
+        """
+        return {
+            "behavior_data": (self._extract_behavior_data, ("data",)),
+            "group_data": (self._extract_group_data, ("data",)),
+            "behavior_stats": (
+                self._calculate_behavior_stats,
+                ("behavior_data", "group_data"),
+            ),
+            "correlations": (self._calculate_correlation_matrix, ("behavior_data",)),
+            "clusters": (self._analyze_clusters, ("behavior_data",)),
+        }
+
+    def _memoized_task(
+        self, name: str, function: Callable[..., Any], dependencies: tuple
+    ) -> Callable[..., Any]:
+        """
+        Build the generate_reports task computing an intermediate.
+
+        Args:
+            name: Intermediate name
+            function: Function computing the intermediate
+            dependencies: Names of its arguments (the data or intermediates)
+
+        Returns:
+            Task taking the data and the intermediates it depends on, that
+            reads the intermediate from the extraction cache
+        """
+
+        def task(data, **arguments):
+            arguments["data"] = data
+            return self.extraction_cache.get_or_compute(
+                name,
+                data,
+                lambda: function(**{dep: arguments[dep] for dep in dependencies}),
+            )
+
+        return task
+
+    def _intermediate(
+        self, name: str, data: Dict, shared: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        """
+        Return an intermediate result of a report.
+
+        generate_reports computes each intermediate once for all its reports
+        and passes them in shared; a report generated on its own gets them
+        here, keeping them in shared when given. Either way the extraction
+        cache computes each intermediate once per input.
+
+        Args:
+            name: Intermediate name (see _intermediate_tasks)
+            data: Processed evaluation data
+            shared: Intermediates already computed
+
+        Returns:
+            The intermediate result
+        """
+        if shared is not None and name in shared:
+            return shared[name]
+
+        function, dependencies = self._intermediate_tasks()[name]
+        value = self.extraction_cache.get_or_compute(
+            name,
+            data,
+            lambda: function(
+                **{
+                    dep: (
+                        data if dep == "data" else self._intermediate(dep, data, shared)
+                    )
+                    for dep in dependencies
+                }
+            ),
+        )
+        if shared is not None:
+            shared[name] = value
+        return value
+
+    def _analyze_clusters(self, behavior_data: Dict) -> Optional[Dict]:
+        """
+        Cluster the behaviors of a report.
+
+        Args:
+            behavior_data: Dictionary of behavior data
+
+        Returns:
+            Cluster analysis results, or None with fewer than 3 behaviors
+        """
+        if len(behavior_data) < 3:
+            return None
+        return self.pattern_analyzer.analyze_clusters(behavior_data)
+
+    def _assemble_comprehensive_report(
+        self, reports: Dict[str, str], pessoa_name: str, ano_name: str
+    ) -> str:
+        """
+        Assemble the comprehensive report from the rendered reports.
+
+        Each report becomes a section: its title turns into a level-2 heading,
+        its other headings move one level down and its generation timestamp
+        is dropped. Reports that failed (None) are left out.
+
+        Args:
+            reports: Rendered reports, in the order of their sections
+            pessoa_name: Person name
+            ano_name: Year or period name
+
+        Returns:
+            Comprehensive report as markdown string
+        """
+        content = self._format_header(
+            "Análise Abrangente de Desempenho", pessoa_name, ano_name
+        )
+        title_suffix = f": {pessoa_name} - {ano_name}"
+
+        for report in reports.values():
+            if report is None:
+                continue
+            lines = []
+            in_code = False
+            timestamp_dropped = False
+            for line in report.splitlines():
+                if line.startswith("```"):
+                    in_code = not in_code
+                elif not in_code and line.startswith("#"):
+                    if line.startswith("# ") and line.endswith(title_suffix):
+                        line = line[: -len(title_suffix)]
+                    line = "#" + line
+                elif not timestamp_dropped and line.startswith("*Gerado em:"):
+                    timestamp_dropped = True
+                    continue
+                lines.append(line)
+            content += "\n".join(lines).strip() + "\n\n"
+
+        return content
+
     def _format_timestamp(self) -> str:
         """Format current timestamp for reports."""
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -210,6 +454,54 @@ class ReportGenerator:
         else:
             return "não significativo"
 
+    def _correct_significance(
+        self,
+        comp_names: List[str],
+        analyses: List[Dict],
+        pessoa_name: str,
+        ano_name: str,
+    ) -> None:
+        """
+        Replace the significance tests of behavior analyses by corrected ones.
+
+        Behaviors found in the org-wide tests of the corpus use those. The
+        p-values of the remaining behaviors are adjusted together for multiple
+        comparisons (Benjamini-Hochberg) and significance follows the adjusted
+        p-value.
+
+        Args:
+            comp_names: Behavior names
+            analyses: analyze_distributions results, aligned with comp_names
+            pessoa_name: Person name
+            ano_name: Year or period name
+        """
+        org_tests = {}
+        if self.corpus is not None:
+            org_tests = get_significance_tester().person_tests(
+                self.corpus, pessoa_name, ano_name
+            )
+
+        local = []
+        for comp_name, analysis in zip(comp_names, analyses):
+            if comp_name in org_tests:
+                analysis["significance_test"] = org_tests[comp_name]
+            else:
+                local.append(analysis)
+
+        # Only the behaviors judged locally form the correction family
+        p_values = [analysis["significance_test"]["p_value"] for analysis in local]
+        adjusted = self.stat_analyzer.adjust_p_values(p_values)
+        labels = self.stat_analyzer.significance_labels(adjusted)
+        for analysis, p_value_adjusted, label in zip(
+            local, adjusted.tolist(), labels.tolist()
+        ):
+            analysis["significance_test"] = {
+                **analysis["significance_test"],
+                "p_value_adjusted": p_value_adjusted,
+                "significance": label,
+                "is_significant": p_value_adjusted < 0.05,
+            }
+
     def _format_confidence_interval(
         self, lower: float, upper: float, precision: int = 1
     ) -> str:
@@ -387,7 +679,11 @@ class ReportGenerator:
         return group_data
 
     def generate_executive_summary(
-        self, data: Dict, pessoa_name: str, ano_name: str
+        self,
+        data: Dict,
+        pessoa_name: str,
+        ano_name: str,
+        shared: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Generate an executive summary report with key statistical insights.
@@ -396,6 +692,7 @@ class ReportGenerator:
             data: Processed evaluation data
             pessoa_name: Person name
             ano_name: Year or period name
+            shared: Intermediates already computed by generate_reports
 
         Returns:
             Executive summary report as markdown string
@@ -423,6 +720,22 @@ class ReportGenerator:
         gap_ci_low = gap - 3.2
         gap_ci_high = gap + 3.2
 
+        if (
+            self.ci_method == "bootstrap"
+            and global_freq.get("colaborador")
+            and global_freq.get("grupo")
+        ):
+            # The normalized score is the 0-5 global score scaled to 0-100
+            colab_scores, group_scores = self.bootstrap_engine.resample_scores(
+                [[global_freq["colaborador"]], [global_freq["grupo"]]], "global"
+            )
+            (colab_ci_low,), (colab_ci_high,) = (
+                self.bootstrap_engine.percentile_intervals(colab_scores * 20)
+            )
+            (gap_ci_low,), (gap_ci_high,) = self.bootstrap_engine.percentile_intervals(
+                (colab_scores - group_scores) * 20
+            )
+
         # Determine significance
         significance = "p < 0.05"  # Placeholder
 
@@ -473,59 +786,61 @@ class ReportGenerator:
         content += stats_section
 
         # Extract behavior data for pattern analysis
-        behavior_data = self._extract_behavior_data(data)
-        group_data = self._extract_group_data(data)
+        behavior_data = self._intermediate("behavior_data", data, shared)
+        group_data = self._intermediate("group_data", data, shared)
 
         # Find significant gaps to report
         significant_gaps = []
 
-        # Check each behavior
-        for comp_name, comp_freq in behavior_data.items():
-            if comp_name in group_data:
-                # Analyze distributions
-                analysis = self.stat_analyzer.analyze_distributions(
-                    comp_freq, group_data[comp_name]
-                )
+        # Analyze the distributions of every behavior at once
+        comp_names = [name for name in behavior_data if name in group_data]
+        analyses = self.stat_analyzer.analyze_distributions_batch(
+            [behavior_data[name] for name in comp_names],
+            [group_data[name] for name in comp_names],
+        )
+        self._correct_significance(comp_names, analyses, pessoa_name, ano_name)
 
-                # Add to significant gaps if significant
-                if (
-                    analysis["significance_test"]["is_significant"]
-                    and abs(analysis["score_gap"]) > 5
-                ):
-                    gap_value = analysis["score_gap"]
-                    gap_sign = "+" if gap_value > 0 else ""
-                    p_value = analysis["significance_test"]["p_value"]
-
-                    # Identify the largest category gap
-                    cat_gaps = analysis["gap_metrics"]["gaps"]
-                    max_gap_idx = cat_gaps.index(max(cat_gaps, key=abs))
-                    cat_names = [
-                        "N/A",
-                        "Referência",
-                        "Acima do esperado",
-                        "Dentro do esperado",
-                        "Abaixo do esperado",
-                        "Muito abaixo do esperado",
-                    ]
-                    max_cat = cat_names[max_gap_idx]
-                    max_gap = cat_gaps[max_gap_idx]
-                    max_gap_sign = "+" if max_gap > 0 else ""
+        # Check each behavior
+        for comp_name, analysis in zip(comp_names, analyses):
+            # Add to significant gaps if significant
+            if (
+                analysis["significance_test"]["is_significant"]
+                and abs(analysis["score_gap"]) > 5
+            ):
+                gap_value = analysis["score_gap"]
+                gap_sign = "+" if gap_value > 0 else ""
+                p_value = analysis["significance_test"]["p_value_adjusted"]
+
+                # Identify the largest category gap
+                cat_gaps = analysis["gap_metrics"]["gaps"]
+                max_gap_idx = cat_gaps.index(max(cat_gaps, key=abs))
+                cat_names = [
+                    "N/A",
+                    "Referência",
+                    "Acima do esperado",
+                    "Dentro do esperado",
+                    "Abaixo do esperado",
+                    "Muito abaixo do esperado",
+                ]
+                max_cat = cat_names[max_gap_idx]
+                max_gap = cat_gaps[max_gap_idx]
+                max_gap_sign = "+" if max_gap > 0 else ""
 
-                    # Create the insight description
-                    description = f"**{comp_name}** ({gap_sign}{gap_value:.1f}, {self._format_significance(p_value)})"
+                # Create the insight description
+                description = f"**{comp_name}** ({gap_sign}{gap_value:.1f}, {self._format_significance(p_value)})"
 
-                    # Add details about the category gap
-                    details = f"Gap em '{max_cat}': {max_gap_sign}{max_gap:.1f}%"
+                # Add details about the category gap
+                details = f"Gap em '{max_cat}': {max_gap_sign}{max_gap:.1f}%"
 
-                    significant_gaps.append(
-                        {
-                            "name": comp_name,
-                            "gap": gap_value,
-                            "p_value": p_value,
-                            "description": description,
-                            "details": details,
-                        }
-                    )
+                significant_gaps.append(
+                    {
+                        "name": comp_name,
+                        "gap": gap_value,
+                        "p_value": p_value,
+                        "description": description,
+                        "details": details,
+                    }
+                )
 
         # Sort by absolute gap and significance
         significant_gaps.sort(
@@ -561,7 +876,7 @@ class ReportGenerator:
 
         # Perform cluster analysis if we have enough behaviors
         if len(behavior_data) >= 3:
-            cluster_results = self.pattern_analyzer.analyze_clusters(behavior_data)
+            cluster_results = self._intermediate("clusters", data, shared)
             clusters = cluster_results.get("clusters", [])
 
             if clusters:
@@ -679,7 +994,13 @@ class ReportGenerator:
 
         return content
 
-    def generate_gap_analysis(self, data: Dict, pessoa_name: str, ano_name: str) -> str:
+    def generate_gap_analysis(
+        self,
+        data: Dict,
+        pessoa_name: str,
+        ano_name: str,
+        shared: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         Generate a detailed gap analysis report.
 
@@ -687,6 +1008,7 @@ class ReportGenerator:
             data: Processed evaluation data
             pessoa_name: Person name
             ano_name: Year or period name
+            shared: Intermediates already computed by generate_reports
 
         Returns:
             Gap analysis report as markdown string
@@ -786,42 +1108,42 @@ class ReportGenerator:
             content += self._format_section("Análise Global de Gaps", gap_analysis)
 
         # Extract behavior data
-        behavior_data = self._extract_behavior_data(data)
-        group_data = self._extract_group_data(data)
+        behavior_data = self._intermediate("behavior_data", data, shared)
+        group_data = self._intermediate("group_data", data, shared)
 
         if behavior_data and group_data:
             # Add Behavior-Level Analysis
             behavior_section = "### Gaps por Comportamento\n\n"
 
+            # Calculate the distribution analysis of every behavior at once
+            comp_names = [name for name in behavior_data if name in group_data]
+            analyses = self.stat_analyzer.analyze_distributions_batch(
+                [behavior_data[name] for name in comp_names],
+                [group_data[name] for name in comp_names],
+            )
+            self._correct_significance(comp_names, analyses, pessoa_name, ano_name)
+
             # Process each behavior
             behavior_analyses = []
-            for comp_name, comp_freq in behavior_data.items():
-                if comp_name in group_data:
-                    group_freq = group_data[comp_name]
-
-                    # Calculate distribution analysis
-                    analysis = self.stat_analyzer.analyze_distributions(
-                        comp_freq, group_freq
-                    )
-
-                    # Skip if the gap is not significant
-                    if abs(analysis["score_gap"]) < 3:
-                        continue
-
-                    # Get the significance test
-                    sig_test = analysis["significance_test"]
+            for comp_name, analysis in zip(comp_names, analyses):
+                # Skip if the gap is not significant
+                if abs(analysis["score_gap"]) < 3:
+                    continue
 
-                    # Store for sorting
-                    behavior_analyses.append(
-                        {
-                            "name": comp_name,
-                            "score_gap": analysis["score_gap"],
-                            "is_significant": sig_test["is_significant"],
-                            "p_value": sig_test["p_value"],
-                            "analysis": analysis,
-                            "pattern": analysis["pattern"],
-                        }
-                    )
+                # Get the significance test
+                sig_test = analysis["significance_test"]
+
+                # Store for sorting
+                behavior_analyses.append(
+                    {
+                        "name": comp_name,
+                        "score_gap": analysis["score_gap"],
+                        "is_significant": sig_test["is_significant"],
+                        "p_value": sig_test["p_value_adjusted"],
+                        "analysis": analysis,
+                        "pattern": analysis["pattern"],
+                    }
+                )
 
             # Sort by gap size (absolute value) and significance
             behavior_analyses.sort(
@@ -831,17 +1153,32 @@ class ReportGenerator:
             # Take top behaviors to analyze
             top_behaviors = behavior_analyses[:5]
 
+            # Bootstrap the gap intervals of every top behavior at once
+            gap_intervals = None
+            if self.ci_method == "bootstrap" and top_behaviors:
+                gap_intervals = list(
+                    zip(
+                        *self.bootstrap_engine.gap_intervals(
+                            [behavior_data[b["name"]] for b in top_behaviors],
+                            [group_data[b["name"]] for b in top_behaviors],
+                        )
+                    )
+                )
+
             # Add a table summarizing the gaps
             table_rows = []
-            for b in top_behaviors:
+            for i, b in enumerate(top_behaviors):
                 gap = b["score_gap"]
                 sig = "Sim" if b["is_significant"] else "Não"
                 pattern = b["pattern"]
 
                 # Format the confidence interval
-                ci_width = 3.5 if b["is_significant"] else 4.8
-                ci_low = gap - ci_width
-                ci_high = gap + ci_width
+                if gap_intervals:
+                    ci_low, ci_high = gap_intervals[i]
+                else:
+                    ci_width = 3.5 if b["is_significant"] else 4.8
+                    ci_low = gap - ci_width
+                    ci_high = gap + ci_width
                 ci_str = self._format_confidence_interval(ci_low, ci_high)
 
                 # Format the significance level
@@ -1064,7 +1401,11 @@ class ReportGenerator:
         return content
 
     def generate_patterns_report(
-        self, data: Dict, pessoa_name: str, ano_name: str
+        self,
+        data: Dict,
+        pessoa_name: str,
+        ano_name: str,
+        shared: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Generate a report analyzing patterns and correlations in evaluation data.
@@ -1073,6 +1414,7 @@ class ReportGenerator:
             data: Processed evaluation data
             pessoa_name: Person name
             ano_name: Year name
+            shared: Intermediates already computed by generate_reports
 
         Returns:
             Formatted report as a string
@@ -1090,8 +1432,8 @@ class ReportGenerator:
         )
 
         # Extract behavior data
-        behavior_data = self._extract_behavior_data(data)
-        group_data = self._extract_group_data(data)
+        behavior_data = self._intermediate("behavior_data", data, shared)
+        group_data = self._intermediate("group_data", data, shared)
 
         # Try to load historical data for year-over-year comparison
         historical_data = self._get_historical_data(pessoa_name, ano_name)
@@ -1184,7 +1526,7 @@ class ReportGenerator:
         report += "## Avaliação de Comportamentos\n\n"
 
         # Calculate behavior stats
-        behavior_stats = self._calculate_behavior_stats(behavior_data, group_data)
+        behavior_stats = self._intermediate("behavior_stats", data, shared)
 
         if behavior_stats:
             # Create summary table
@@ -1415,7 +1757,7 @@ class ReportGenerator:
         # Only perform if we have enough behaviors
         if len(behavior_data) >= 3:
             # Calculate correlation matrix
-            corr_matrix, behavior_df = self._calculate_correlation_matrix(behavior_data)
+            corr_matrix, behavior_df = self._intermediate("correlations", data, shared)
 
             if corr_matrix is not None:
                 report += "## Análise de Correlações\n\n"
@@ -1772,11 +2114,10 @@ class ReportGenerator:
 
                         try:
                             # Load data
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                data = json.load(f)
+                            data = load_json_cached(file_path)
 
                             # Extract behavior data
-                            behavior_data = self._extract_behavior_data(data)
+                            behavior_data = self._intermediate("behavior_data", data)
                             if behavior_data:
                                 historical_data[year] = behavior_data
                         except Exception:
@@ -2059,6 +2400,10 @@ class ReportGenerator:
         """
         Calculate statistical significance of gaps.
 
+        The p-values are corrected for multiple comparisons
+        (Benjamini-Hochberg) across the behaviors of the report, and
+        significance follows the adjusted p-values.
+
         Args:
             stats: Dictionary with behavior statistics
 
@@ -2080,7 +2425,8 @@ class ReportGenerator:
         std_dev = np.std(gaps)
         mean_gap = np.mean(gaps)
 
-        # Calculate significance for each behavior
+        # Calculate the test of each behavior
+        tests = {}
         for behavior, behavior_stats in stats.items():
             gap = behavior_stats["gap"]
 
@@ -2096,31 +2442,48 @@ class ReportGenerator:
             else:
                 p_value = 1.0
 
+            tests[behavior] = (z_score, p_value)
+
+        # Correct the p-values for testing every behavior of the report
+        adjusted = self.stat_analyzer.adjust_p_values(
+            [p_value for _, p_value in tests.values()]
+        )
+
+        for (behavior, (z_score, p_value)), p_value_adjusted in zip(
+            tests.items(), adjusted.tolist()
+        ):
             # Determine significance
-            is_significant = p_value < 0.05
+            is_significant = p_value_adjusted < 0.05
 
             # Format p-value
-            if p_value < 0.001:
+            if p_value_adjusted < 0.001:
                 p_value_formatted = "p<0.001"
-            elif p_value < 0.01:
+            elif p_value_adjusted < 0.01:
                 p_value_formatted = "p<0.01"
-            elif p_value < 0.05:
+            elif p_value_adjusted < 0.05:
                 p_value_formatted = "p<0.05"
-            elif p_value < 0.1:
+            elif p_value_adjusted < 0.1:
                 p_value_formatted = "p<0.1"
             else:
-                p_value_formatted = f"p={p_value:.2f}"
+                p_value_formatted = f"p={p_value_adjusted:.2f}"
 
             significance[behavior] = {
                 "z_score": z_score,
                 "p_value": p_value,
+                "p_value_adjusted": p_value_adjusted,
                 "p_value_formatted": p_value_formatted,
                 "is_significant": is_significant,
             }
 
         return significance
 
-    def generate_roi_analysis(self, data: Dict, pessoa_name: str, ano_name: str) -> str:
+    def generate_roi_analysis(
+        self,
+        data: Dict,
+        pessoa_name: str,
+        ano_name: str,
+        shared: Optional[Dict[str, Any]] = None,
+    ) -> str:
         """
         Generate an ROI analysis report that helps prioritize development actions based on
         effort vs. impact analysis.
@@ -2129,6 +2492,7 @@ class ReportGenerator:
             data: Processed evaluation data
             pessoa_name: Person name
             ano_name: Year or period name
+            shared: Intermediates already computed by generate_reports
 
         Returns:
             ROI analysis report as markdown string
@@ -2139,8 +2503,8 @@ class ReportGenerator:
         )
 
         # Extract behavior data for analysis
-        behavior_data = self._extract_behavior_data(data)
-        group_data = self._extract_group_data(data)
+        behavior_data = self._intermediate("behavior_data", data, shared)
+        group_data = self._intermediate("group_data", data, shared)
 
         # Skip if we don't have enough data
         if not behavior_data:
@@ -2405,7 +2769,7 @@ class ReportGenerator:
         )
 
         # Extract behavior data for analysis
-        behavior_data = self._extract_behavior_data(data)
+        behavior_data = self._intermediate("behavior_data", data)
 
         # Skip if we don't have enough data
         if len(behavior_data) < 3:
@@ -2983,14 +3347,16 @@ class ReportGenerator:
 
         # Get behaviors from first period
         if historical_data and historical_data[0]:
-            first_period_data = self._extract_behavior_data(historical_data[0])
+            first_period_data = self._intermediate("behavior_data", historical_data[0])
             first_period_behaviors = set(first_period_data.keys())
             common_behaviors = first_period_behaviors.copy()
 
         # Intersect with behaviors from all other periods
         for period_data in historical_data[1:]:
             if period_data:
-                period_behaviors = set(self._extract_behavior_data(period_data).keys())
+                period_behaviors = set(
+                    self._intermediate("behavior_data", period_data).keys()
+                )
                 common_behaviors = common_behaviors.intersection(period_behaviors)
 
         # Skip if we don't have common behaviors
@@ -3006,7 +3372,7 @@ class ReportGenerator:
                 behavior_scores[behavior] = []
 
                 for period_data in historical_data:
-                    behaviors_data = self._extract_behavior_data(period_data)
+                    behaviors_data = self._intermediate("behavior_data", period_data)
                     if behavior in behaviors_data:
                         # Extract frequencies and calculate normalized score
                         freqs = behaviors_data[behavior]
@@ -10,6 +10,9 @@ import logging
 import numpy as np
 from scipy import stats
 
+from peopleanalytics.constants import row_sums, stack_frequencies
+from peopleanalytics.scoring_engine import get_scoring_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,22 +37,42 @@ class StatisticalAnalyzer:
         z_scores = {}
 
         try:
+            group_mean = np.mean(group_data)
+            group_std = np.std(group_data)
             for i in range(len(individual_data)):
                 # Skip if group has no variation (avoid division by zero)
-                if np.std(group_data) == 0:
+                if group_std == 0:
                     z_scores[i] = 0
                     continue
 
                 # Calculate z-score
-                z_scores[i] = (individual_data[i] - np.mean(group_data)) / np.std(
-                    group_data
-                )
+                z_scores[i] = (individual_data[i] - group_mean) / group_std
         except Exception as e:
             self.logger.error(f"Error calculating z-scores: {e}")
             z_scores = {i: 0 for i in range(len(individual_data))}
 
         return z_scores
 
+    def calculate_z_scores_batch(self, individual_data, group_data):
+        """
+        Calculate Z-scores for many individual/group pairs at once.
+
+        Args:
+            individual_data: (N, 6) matrix of individual frequency distributions
+            group_data: (N, 6) matrix of group frequency distributions
+
+        Returns:
+            (N, 6) array with the z-score of each category, 0 where the
+            group has no variation
+        """
+        individual_data = np.asarray(individual_data, dtype=np.float64)
+        group_data = np.asarray(group_data, dtype=np.float64)
+        group_mean = np.mean(group_data, axis=1, keepdims=True)
+        group_std = np.std(group_data, axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_scores = (individual_data - group_mean) / group_std
+        return np.where(group_std == 0, 0.0, z_scores)
+
     def calculate_confidence_intervals(self, data, confidence=0.95):
         """
         Calculate confidence intervals for a data set.
@@ -112,6 +135,86 @@ class StatisticalAnalyzer:
                 "is_significant": False,
             }
 
+    def run_significance_test_batch(self, individual_data, group_data, correct=False):
+        """
+        Run the Welch t-test of many individual/group pairs in one call.
+
+        Args:
+            individual_data: (N, 6) matrix of individual frequency distributions
+            group_data: (N, 6) matrix of group frequency distributions
+            correct: Whether to correct the p-values for multiple comparisons
+                (Benjamini-Hochberg); significance then follows the adjusted
+                p-values, returned as p_value_adjusted
+
+        Returns:
+            Dictionary with arrays of t-statistics, p-values, significance
+            labels and significance flags, one entry per pair
+        """
+        individual_data = np.asarray(individual_data, dtype=np.float64)
+        group_data = np.asarray(group_data, dtype=np.float64)
+        if len(individual_data) == 0:
+            t_stat = p_value = np.zeros(0)
+        else:
+            t_stat, p_value = stats.ttest_ind(
+                individual_data, group_data, axis=1, equal_var=False
+            )
+            t_stat = np.asarray(t_stat)
+            p_value = np.asarray(p_value)
+
+        results = {"t_statistic": t_stat, "p_value": p_value}
+        if correct:
+            p_value = results["p_value_adjusted"] = self.adjust_p_values(p_value)
+        results["significance"] = self.significance_labels(p_value)
+        results["is_significant"] = p_value < 0.05
+        return results
+
+    def adjust_p_values(self, p_values):
+        """
+        Adjust p-values for multiple comparisons (Benjamini-Hochberg).
+
+        The adjusted p-values control the false discovery rate: comparing them
+        with 0.05 keeps the expected share of false positives among the
+        significant results at 5%. NaN p-values (pairs that could not be
+        tested) stay NaN and do not count as tests.
+
+        Args:
+            p_values: Sequence of p-values
+
+        Returns:
+            Array of adjusted p-values
+        """
+        p_values = np.asarray(p_values, dtype=np.float64)
+        adjusted = np.full(p_values.shape, np.nan)
+        tested = ~np.isnan(p_values)
+        count = int(tested.sum())
+        if count == 0:
+            return adjusted
+
+        order = np.argsort(p_values[tested], kind="stable")
+        ranked = p_values[tested][order] * count / np.arange(1, count + 1)
+        # Each adjusted p-value is the smallest scaled value at its rank or above
+        ranked = np.minimum.accumulate(ranked[::-1])[::-1]
+        values = np.empty(count)
+        values[order] = np.minimum(ranked, 1.0)
+        adjusted[tested] = values
+        return adjusted
+
+    def significance_labels(self, p_values):
+        """
+        Label p-values with the significance levels of run_significance_test.
+
+        Args:
+            p_values: Array of p-values
+
+        Returns:
+            Array of significance labels
+        """
+        return np.select(
+            [p_values < 0.001, p_values < 0.01, p_values < 0.05, p_values < 0.1],
+            ["p < 0.001", "p < 0.01", "p < 0.05", "p < 0.1"],
+            default="not significant",
+        ).astype(object)
+
     def calculate_gap_metrics(self, individual_freq, group_freq):
         """
         Calculate gap metrics between individual and group frequencies.
@@ -137,6 +240,36 @@ class StatisticalAnalyzer:
             "max_negative_index": gaps.index(min(gaps)) if min(gaps) < 0 else None,
         }
 
+    def calculate_gap_metrics_batch(self, individual_freq, group_freq):
+        """
+        Calculate gap metrics for many individual/group pairs at once.
+
+        Args:
+            individual_freq: (N, 6) matrix of individual frequency values
+            group_freq: (N, 6) matrix of group frequency values
+
+        Returns:
+            Dictionary with the metrics of calculate_gap_metrics as arrays, one
+            row or entry per pair; missing max indexes are -1
+        """
+        gaps = np.asarray(individual_freq, dtype=np.float64) - np.asarray(
+            group_freq, dtype=np.float64
+        )
+        absolute_gaps = np.abs(gaps)
+        max_gaps = gaps.max(axis=1, initial=-np.inf)
+        min_gaps = gaps.min(axis=1, initial=np.inf)
+
+        return {
+            "gaps": gaps,
+            "absolute_gaps": absolute_gaps,
+            "total_gap": row_sums(gaps),
+            "total_absolute_gap": row_sums(absolute_gaps),
+            "max_positive_gap": max_gaps,
+            "max_negative_gap": min_gaps,
+            "max_positive_index": np.where(max_gaps > 0, gaps.argmax(axis=1), -1),
+            "max_negative_index": np.where(min_gaps < 0, gaps.argmin(axis=1), -1),
+        }
+
     def calculate_normalized_score(self, frequencies):
         """
         Calculate normalized score from frequency distribution.
@@ -153,23 +286,11 @@ class StatisticalAnalyzer:
             frequencies: List of frequency values [na, ref, acima, dentro, abaixo, muito_abaixo]
 
         Returns:
-            Normalized score (0-100)
+            Normalized score (0-100), 0 when there are no ratings
         """
-        weights = [0, 100, 85, 70, 40, 10]
-
         try:
-            # Make sure frequencies sum to 100%
-            total = sum(frequencies)
-            if total == 0:
-                return 0
-
-            normalized_freq = [f / total * 100 if total > 0 else 0 for f in frequencies]
-
-            # Calculate weighted score
-            score = (
-                sum(normalized_freq[i] * weights[i] for i in range(len(weights))) / 100
-            )
-            return score
+            # Shared with the other scoring models (see scoring_engine)
+            return get_scoring_engine().score(frequencies, "normalized")
         except Exception as e:
             self.logger.error(f"Error calculating normalized score: {e}")
             return 0
@@ -231,6 +352,141 @@ class StatisticalAnalyzer:
             "pattern": self._classify_distribution_pattern(individual_freq, group_freq),
         }
 
+    def analyze_distributions_batch(self, individual_freqs, group_freqs):
+        """
+        Analyze many individual/group distribution pairs at once.
+
+        Scores, gaps, significance tests, entropies and patterns are computed
+        for all pairs with one vectorized call each. Pairs that are not two
+        vectors of six numbers fall back to analyze_distributions.
+
+        Args:
+            individual_freqs: Sequence of individual frequency vectors
+            group_freqs: Sequence of group frequency vectors, aligned with
+                individual_freqs
+
+        Returns:
+            List with the analyze_distributions result of each pair
+        """
+        individual, individual_valid = stack_frequencies(individual_freqs)
+        group, group_valid = stack_frequencies(group_freqs)
+        valid = individual_valid & group_valid
+        individual = individual[valid]
+        group = group[valid]
+
+        engine = get_scoring_engine()
+        individual_scores = engine.score_matrix(individual, ["normalized"])["normalized"]
+        group_scores = engine.score_matrix(group, ["normalized"])["normalized"]
+        gap_metrics = self.calculate_gap_metrics_batch(individual, group)
+        sig_tests = self.run_significance_test_batch(individual, group)
+
+        # Concentration: higher values mean more concentrated distribution
+        with np.errstate(divide="ignore", invalid="ignore"):
+            individual_entropy = np.where(
+                row_sums(individual) > 0, stats.entropy(individual, base=2, axis=1), 0
+            )
+            group_entropy = np.where(
+                row_sums(group) > 0, stats.entropy(group, base=2, axis=1), 0
+            )
+
+        gaps = gap_metrics["gaps"]
+        positive_gaps = (gaps > 0).sum(axis=1)
+        negative_gaps = (gaps < 0).sum(axis=1)
+        neutral_gaps = (gaps == 0).sum(axis=1)
+        patterns = self._classify_distribution_patterns(individual, group)
+
+        results = iter(
+            {
+                "individual_score": individual_score,
+                "group_score": group_score,
+                "score_gap": individual_score - group_score,
+                "gap_metrics": {
+                    "gaps": row_gaps,
+                    "absolute_gaps": row_absolute_gaps,
+                    "total_gap": total_gap,
+                    "total_absolute_gap": total_absolute_gap,
+                    "max_positive_gap": max_positive_gap,
+                    "max_negative_gap": max_negative_gap,
+                    "max_positive_index": (
+                        max_positive_index if max_positive_index >= 0 else None
+                    ),
+                    "max_negative_index": (
+                        max_negative_index if max_negative_index >= 0 else None
+                    ),
+                },
+                "significance_test": {
+                    "t_statistic": t_stat,
+                    "p_value": p_value,
+                    "significance": significance,
+                    "is_significant": is_significant,
+                },
+                "concentration": {
+                    "individual_entropy": ind_entropy,
+                    "group_entropy": grp_entropy,
+                    "entropy_difference": ind_entropy - grp_entropy,
+                },
+                "gap_distribution": {
+                    "positive_gaps": positive,
+                    "negative_gaps": negative,
+                    "neutral_gaps": neutral,
+                    "gap_ratio": (positive - negative) / 6,
+                },
+                "pattern": pattern,
+            }
+            for (
+                individual_score,
+                group_score,
+                row_gaps,
+                row_absolute_gaps,
+                total_gap,
+                total_absolute_gap,
+                max_positive_gap,
+                max_negative_gap,
+                max_positive_index,
+                max_negative_index,
+                t_stat,
+                p_value,
+                significance,
+                is_significant,
+                ind_entropy,
+                grp_entropy,
+                positive,
+                negative,
+                neutral,
+                pattern,
+            ) in zip(
+                individual_scores.tolist(),
+                group_scores.tolist(),
+                gaps.tolist(),
+                gap_metrics["absolute_gaps"].tolist(),
+                gap_metrics["total_gap"].tolist(),
+                gap_metrics["total_absolute_gap"].tolist(),
+                gap_metrics["max_positive_gap"].tolist(),
+                gap_metrics["max_negative_gap"].tolist(),
+                gap_metrics["max_positive_index"].tolist(),
+                gap_metrics["max_negative_index"].tolist(),
+                sig_tests["t_statistic"].tolist(),
+                sig_tests["p_value"].tolist(),
+                sig_tests["significance"].tolist(),
+                sig_tests["is_significant"].tolist(),
+                individual_entropy.tolist(),
+                group_entropy.tolist(),
+                positive_gaps.tolist(),
+                negative_gaps.tolist(),
+                neutral_gaps.tolist(),
+                patterns.tolist(),
+            )
+        )
+
+        return [
+            next(results)
+            if is_valid
+            else self.analyze_distributions(individual_freq, group_freq)
+            for individual_freq, group_freq, is_valid in zip(
+                individual_freqs, group_freqs, valid.tolist()
+            )
+        ]
+
     def _classify_distribution_pattern(self, individual_freq, group_freq):
         """
         Classify the distribution pattern based on comparison with group.
@@ -272,3 +528,41 @@ class StatisticalAnalyzer:
             return "desbalanceado_centro"
         else:
             return "misto"
+
+    def _classify_distribution_patterns(self, individual_freq, group_freq):
+        """
+        Classify the distribution pattern of many pairs at once.
+
+        Args:
+            individual_freq: (N, 6) matrix of individual frequency values
+            group_freq: (N, 6) matrix of group frequency values
+
+        Returns:
+            Array with the _classify_distribution_pattern label of each pair
+        """
+        ind_top = individual_freq[:, 1] + individual_freq[:, 2]
+        group_top = group_freq[:, 1] + group_freq[:, 2]
+
+        ind_bottom = individual_freq[:, 4] + individual_freq[:, 5]
+        group_bottom = group_freq[:, 4] + group_freq[:, 5]
+
+        # Same conditions, in the same order, as the single-pair version
+        return np.select(
+            [
+                (ind_top > group_top + 10) & (ind_bottom < group_bottom),
+                (ind_top < group_top - 10) & (ind_bottom > group_bottom),
+                individual_freq[:, 1] > group_freq[:, 1] + 10,
+                individual_freq[:, 1] < group_freq[:, 1] - 10,
+                np.abs(row_sums(individual_freq - group_freq)) < 10,
+                np.abs(individual_freq[:, 3] - group_freq[:, 3]) > 15,
+            ],
+            [
+                "superior",
+                "inferior",
+                "referência_destacada",
+                "déficit_referência",
+                "alinhado",
+                "desbalanceado_centro",
+            ],
+            default="misto",
+        ).astype(object)
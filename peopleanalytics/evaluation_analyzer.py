@@ -1,52 +1,253 @@
 import json
 import os
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from peopleanalytics.behavior_score_cube import BehaviorScoreCube
 from peopleanalytics.constants import (
     CONCEPT_CHART_COLORS,
     FREQUENCY_LABELS,
     FREQUENCY_WEIGHTS,
     calculate_score,
 )
+from peopleanalytics.data_model import PersonData
+from peopleanalytics.data_pipeline import FREQUENCY_BUCKETS
+from peopleanalytics.frequency_tensor import (
+    MISSING_CODE,
+    ROW_CONSOLIDADO,
+    ROW_GROUP,
+    ROW_STRUCTURE,
+    FrequencyTensor,
+)
+from peopleanalytics.json_loader import loads
+from peopleanalytics.parse_cache import DOCUMENT_NAMESPACE, parse_file
+from peopleanalytics.schema_validator import SchemaError, get_validator, validate_files
+from peopleanalytics.scoring_engine import get_scoring_engine
+from peopleanalytics.vocabulary import get_vocabulary, intern_document
+
+# Default memory budget for parsed evaluations kept by EvaluationAnalyzer
+DEFAULT_CACHE_BUDGET = 256 * 1024 * 1024
+
+# Rough ratio between the memory of a parsed resultado.json and its file size
+PARSED_SIZE_FACTOR = 8
+
+# Evaluations whose vectors are scored together when building the score cube
+SCORE_CUBE_CHUNK = 512
+
+# Marks a missing value where None is a valid one
+_MISSING = object()
+
+# Value types of frequency vectors scored in batch (others take the scalar path)
+_NUMBER_TYPES = frozenset((int, float, bool))
 
 
 class SchemaManager:
-    """Simplified schema manager for validation."""
+    """Schema manager validating evaluations against the resultado schema."""
+
+    def __init__(self, schema_name: str = "resultado"):
+        self.schema_name = schema_name
+        self.validator = get_validator(schema_name)
+        self.schema = self.validator.schema
+
+    def validate(self, data) -> bool:
+        """Check whether a resultado.json document matches the schema."""
+        return self.validator.is_valid(data)
+
+    def errors(self, data) -> List[SchemaError]:
+        """Return every schema violation of a document, with its JSON path."""
+        return self.validator.validate(data)
+
+
+class _LazyYearEvaluations(Mapping):
+    """Years of one person, parsed by the analyzer on first access."""
+
+    def __init__(self, analyzer: "EvaluationAnalyzer", person: str):
+        self._analyzer = analyzer
+        self._person = person
+
+    def __getitem__(self, year: str) -> Dict[str, Any]:
+        if year not in self._analyzer._evaluation_files[self._person]:
+            raise KeyError(year)
+        return self._analyzer._get_evaluation(self._person, year)
+
+    def __contains__(self, year: object) -> bool:
+        # Membership must not trigger parsing
+        return year in self._analyzer._evaluation_files[self._person]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._analyzer._evaluation_files[self._person])
+
+    def __len__(self) -> int:
+        return len(self._analyzer._evaluation_files[self._person])
+
+
+def _is_frequency_vector(frequencies: Any) -> bool:
+    """Tell whether a vector can be scored in batch (six numeric positions)."""
+    return (
+        isinstance(frequencies, (list, tuple))
+        and len(frequencies) == FREQUENCY_BUCKETS
+        and _NUMBER_TYPES.issuperset(map(type, frequencies))
+    )
+
+
+def _distribution_percentages(frequencies: np.ndarray) -> np.ndarray:
+    """Row-wise calculate_score_distribution of an (N, 6) frequency matrix."""
+    total = frequencies[:, 0]
+    for i in range(1, frequencies.shape[1]):
+        # Summed left to right, like sum()
+        total = total + frequencies[:, i]
+    nonzero = total != 0
+    safe_total = np.where(nonzero, total, 1.0)[:, None]
+    return np.where(nonzero[:, None], (frequencies / safe_total) * 100, 0.0)
+
+
+class _BehaviorScoreBatch:
+    """Behavior scores of one or more evaluations, computed in one NumPy pass.
+
+    Valid frequency vectors are queued and scored together by score(); their
+    entries are reserved in the scores dict when queued, so the result keeps
+    the order and overwrites of scoring them one by one. Anything else goes
+    through the scalar path right away and reports its error the same way.
+    """
+
+    def __init__(self, analyzer: "EvaluationAnalyzer", comparisons: bool = True):
+        self._analyzer = analyzer
+        self._comparisons = comparisons
+        self._entries: List[Dict[str, Any]] = []
+        self._colaborador: List[Any] = []
+        self._grupo: List[Any] = []
+
+    def add(
+        self,
+        scores: Dict[str, Any],
+        avaliador: str,
+        freq_colaborador: Any,
+        freq_grupo: Any,
+        source: str,
+        location: Tuple[str, str, str, str],
+    ) -> bool:
+        """Score a pair of vectors into scores[avaliador].
 
-    def __init__(self):
-        self.schema = {}
+        Args:
+            location: Person, year, direcionador and comportamento, for errors
 
-    def validate(self, data):
-        """Placeholder for schema validation."""
-        return True
+        Returns:
+            Whether the pair has a score (always true for valid vectors)
+        """
+        if _is_frequency_vector(freq_colaborador) and _is_frequency_vector(freq_grupo):
+            self.add_valid(scores, avaliador, freq_colaborador, freq_grupo)
+            return True
+
+        analyzer = self._analyzer
+        try:
+            scores[avaliador] = {
+                "score_colaborador": analyzer.calculate_weighted_score(
+                    freq_colaborador
+                ),
+                "score_grupo": analyzer.calculate_weighted_score(freq_grupo),
+                "comparison_by_category": analyzer.compare_with_group(
+                    freq_colaborador, freq_grupo
+                ),
+            }
+            return True
+        except Exception as e:
+            person, year, dir_name, comp_name = location
+            print(
+                f"Error processing {source} scores for {person}, {year}, {dir_name}, {comp_name}, {avaliador}: {str(e)}"
+            )
+            return False
+
+    def add_valid(
+        self,
+        scores: Dict[str, Any],
+        avaliador: str,
+        freq_colaborador: Any,
+        freq_grupo: Any,
+    ):
+        """Queue a pair of six-position numeric vectors for score()."""
+        entry = {}
+        scores[avaliador] = entry
+        self._entries.append(entry)
+        self._colaborador.append(freq_colaborador)
+        self._grupo.append(freq_grupo)
+
+    def score(self):
+        """Fill the queued entries with their scores."""
+        if not self._entries:
+            return
+
+        analyzer = self._analyzer
+        colaborador = np.array(self._colaborador, dtype=np.float64)
+        grupo = np.array(self._grupo, dtype=np.float64)
+        scores_colaborador = analyzer.calculate_weighted_scores(colaborador).tolist()
+        scores_grupo = analyzer.calculate_weighted_scores(grupo).tolist()
+        for entry, score_colaborador, score_grupo in zip(
+            self._entries, scores_colaborador, scores_grupo
+        ):
+            entry["score_colaborador"] = score_colaborador
+            entry["score_grupo"] = score_grupo
+
+        if self._comparisons:
+            differences = analyzer.compare_with_group_batch(colaborador, grupo)
+            labels = analyzer.frequency_labels
+            for entry, difference in zip(self._entries, differences.tolist()):
+                entry["comparison_by_category"] = dict(zip(labels, difference))
+        self._entries = []
+        self._colaborador = []
+        self._grupo = []
 
 
 class EvaluationAnalyzer:
     """Analyze evaluation data within a structured directory."""
 
-    def __init__(self, base_path: str, use_cache: bool = True):
+    def __init__(
+        self,
+        base_path: str,
+        use_cache: Union[bool, int] = True,
+        use_tensor: bool = False,
+        tensor_dir: Optional[Union[str, Path]] = None,
+    ):
         """Initialize the evaluation analyzer.
 
+        Evaluation files are discovered up front but only parsed when first
+        accessed; parsed payloads are kept in an LRU cache bounded by the
+        memory budget given in use_cache.
+
         Args:
             base_path: Path to the directory containing evaluation data.
                 Expected structure: <person>/<year>/resultado.json
-            use_cache: Whether to cache results for faster lookups
+            use_cache: Memory budget in bytes for parsed evaluations. True
+                uses DEFAULT_CACHE_BUDGET, False (or 0) disables caching
+            use_tensor: Read frequency vectors from the memory-mapped
+                FrequencyTensor of base_path instead of parsing the JSON files
+            tensor_dir: Where the tensor is kept (defaults to
+                FrequencyTensor.default_dir())
         """
         self.base_path = Path(base_path)
         self.use_cache = use_cache
-        self._cache = {}
+        if use_cache is True:
+            self.cache_budget = DEFAULT_CACHE_BUDGET
+        else:
+            self.cache_budget = max(int(use_cache or 0), 0)
+        self._cache = OrderedDict()
+        self._cache_size = 0
+        self.use_tensor = use_tensor
+        self.tensor_dir = tensor_dir
+        self._tensor = None
 
         # Default values for frequency analysis
         self.frequency_labels = FREQUENCY_LABELS
         self.frequency_weights = FREQUENCY_WEIGHTS
 
         # For storing evaluations by person and year
-        self.evaluations_by_person = defaultdict(dict)
+        self._evaluation_files = {}
+        self.evaluations_by_person = {}
 
         # Ensure the base directory exists
         os.makedirs(self.base_path, exist_ok=True)
@@ -54,19 +255,64 @@ class EvaluationAnalyzer:
         # Load schema manager for validation
         self.schema_manager = SchemaManager()
 
-        # Load all evaluations
-        self.load_all_evaluations()
+        # Discover evaluations without parsing them
+        self.discover_evaluations()
 
-        # Track the criteria for each year
-        self.year_criteria = self._extract_year_criteria()
+        # Criteria for each year, extracted on first use
+        self._year_criteria = None
+
+        # Behavior scores and concepts of every evaluation, built on first use
+        self._score_cube = None
+        self._conceitos = {}
+
+    @property
+    def year_criteria(self) -> Dict[str, Dict[str, Set[str]]]:
+        """The criteria for each year, extracted on first access."""
+        if self._year_criteria is None:
+            self._year_criteria = self._extract_year_criteria()
+        return self._year_criteria
+
+    @property
+    def score_cube(self) -> BehaviorScoreCube:
+        """The behavior scores of every evaluation, built on first access.
+
+        Comparison queries slice the cube instead of rebuilding the behavior
+        scores of each evaluation on every call.
+        """
+        if self._score_cube is None:
+            self._score_cube = BehaviorScoreCube.from_behavior_scores(
+                self._iter_behavior_scores()
+            )
+        return self._score_cube
+
+    @property
+    def tensor(self) -> Optional[FrequencyTensor]:
+        """The frequency tensor of base_path, opened (or rebuilt) on first access."""
+        if self.use_tensor and self._tensor is None:
+            try:
+                self._tensor = FrequencyTensor.open(self.base_path, self.tensor_dir)
+            except Exception as e:
+                print(f"Error opening frequency tensor, reading JSON files: {str(e)}")
+                self.use_tensor = False
+        return self._tensor
+
+    def discover_evaluations(self):
+        """Find all evaluation files in the base path without parsing them"""
+        self._evaluation_files = {}
+        self.evaluations_by_person = {}
+        self._cache.clear()
+        self._cache_size = 0
+        self._year_criteria = None
+        self._score_cube = None
+        self._conceitos = {}
+        self._tensor = None
 
-    def load_all_evaluations(self):
-        """Load all evaluation files from the base path"""
         if not self.base_path.exists():
             # If the base path doesn't exist, return without attempting to load files
             return
 
-        # First level should be people
+        # First level should be people, kept in directory order like the
+        # comparison tables built from evaluations_by_person
         for person_dir in self.base_path.iterdir():
             if not person_dir.is_dir():
                 continue
@@ -74,42 +320,110 @@ class EvaluationAnalyzer:
             person_name = person_dir.name
 
             # Second level should be years
+            years = {}
             for year_dir in person_dir.iterdir():
                 if not year_dir.is_dir():
                     continue
 
-                year = year_dir.name
-
                 # Look specifically for resultado.json
                 resultado_file = year_dir / "resultado.json"
-                if not resultado_file.exists():
-                    continue
+                if resultado_file.exists():
+                    years[year_dir.name] = resultado_file
+
+            if years:
+                self._evaluation_files[person_name] = years
+                self.evaluations_by_person[person_name] = _LazyYearEvaluations(
+                    self, person_name
+                )
+
+    def load_all_evaluations(self):
+        """Discover all evaluation files and parse them into the cache.
 
-                # Process the resultado.json file
-                try:
-                    with open(resultado_file, "r", encoding="utf-8") as f:
-                        try:
-                            data = json.load(f)
-                            # Initialize the year data if not already present
-                            if year not in self.evaluations_by_person[person_name]:
-                                self.evaluations_by_person[person_name][year] = {
-                                    "success": True,
-                                    "data": data,
-                                }
-                        except json.JSONDecodeError as e:
-                            # More detailed error message including the specific error
-                            relative_path = resultado_file.relative_to(self.base_path)
-                            print(f"Error decoding JSON from {relative_path}: {str(e)}")
-                            # Initialize with empty but valid structure to prevent downstream errors
-                            if year not in self.evaluations_by_person[person_name]:
-                                self.evaluations_by_person[person_name][year] = {
-                                    "success": False,
-                                    "data": {},
-                                }
-                except Exception as e:
-                    # Catch other potential errors like permission issues
-                    relative_path = resultado_file.relative_to(self.base_path)
-                    print(f"Error reading file {relative_path}: {str(e)}")
+        Payloads beyond the cache budget are evicted again and reparsed on
+        their next access.
+        """
+        self.discover_evaluations()
+        for person_name, years in self._evaluation_files.items():
+            for year in years:
+                self._get_evaluation(person_name, year)
+
+    def _get_evaluation(self, person: str, year: str) -> Dict[str, Any]:
+        """Return the parsed evaluation of a person in a year, using the LRU cache"""
+        key = (person, year)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached[0]
+
+        resultado_file = self._evaluation_files[person][year]
+        evaluation = self._parse_evaluation(resultado_file)
+
+        if self.cache_budget > 0:
+            try:
+                size = resultado_file.stat().st_size * PARSED_SIZE_FACTOR
+            except OSError:
+                size = 0
+            self._cache[key] = (evaluation, size)
+            self._cache_size += size
+
+            # Evict least recently used payloads, always keeping the newest one
+            while self._cache_size > self.cache_budget and len(self._cache) > 1:
+                _, (_, evicted_size) = self._cache.popitem(last=False)
+                self._cache_size -= evicted_size
+
+        return evaluation
+
+    def _parse_evaluation(self, resultado_file: Path) -> Dict[str, Any]:
+        """Parse a resultado.json file into an evaluation payload"""
+        try:
+            try:
+                data = parse_file(resultado_file, DOCUMENT_NAMESPACE, loads)
+                # Labels are shared with every other loaded evaluation
+                return {"success": True, "data": intern_document(data)}
+            except json.JSONDecodeError as e:
+                # More detailed error message including the specific error
+                relative_path = resultado_file.relative_to(self.base_path)
+                print(f"Error decoding JSON from {relative_path}: {str(e)}")
+        except Exception as e:
+            # Catch other potential errors like permission issues
+            relative_path = resultado_file.relative_to(self.base_path)
+            print(f"Error reading file {relative_path}: {str(e)}")
+
+        # Empty but valid structure to prevent downstream errors
+        return {"success": False, "data": {}}
+
+    def validate_evaluations(
+        self, workers: Optional[int] = None, executor: str = "thread"
+    ) -> Dict[str, Dict[str, List[SchemaError]]]:
+        """Validate every discovered evaluation file against the schema.
+
+        Files are validated in parallel without going through the cache.
+
+        Args:
+            workers: Number of parallel workers
+            executor: "thread" or "process"
+
+        Returns:
+            Violations by person and year, for invalid evaluations only
+        """
+        files = {
+            str(resultado_file): (person, year)
+            for person, years in self._evaluation_files.items()
+            for year, resultado_file in years.items()
+        }
+        results = validate_files(
+            list(files),
+            self.schema_manager.schema_name,
+            workers=workers,
+            executor=executor,
+        )
+
+        invalid = defaultdict(dict)
+        for path, errors in results.items():
+            if errors:
+                person, year = files[path]
+                invalid[person][year] = errors
+        return dict(invalid)
 
     def _extract_year_criteria(self) -> Dict[str, Dict[str, Set[str]]]:
         """Extract all criteria (direcionadores and comportamentos) for each year"""
@@ -168,6 +482,14 @@ class EvaluationAnalyzer:
             return sorted(self.evaluations_by_person[person].keys())
         return []
 
+    def get_years_for_person(self, person: str) -> List[str]:
+        """Alias of get_person_years"""
+        return self.get_person_years(person)
+
+    def load_person_data(self, person: str, year: str) -> PersonData:
+        """Load the evaluation and profile of a person in a year as PersonData"""
+        return PersonData.load_from_file(str(self.base_path / person / year))
+
     def get_all_people_for_year(self, year: str) -> List[str]:
         """Get all people who have evaluations for a specific year"""
         return [
@@ -179,7 +501,24 @@ class EvaluationAnalyzer:
     def get_conceito_by_year(self, person: str) -> Dict[str, str]:
         """Get the overall concept for a person across all available years"""
         result = {}
-        for year, data in self.evaluations_by_person[person].items():
+        for year in self.evaluations_by_person.get(person, {}):
+            conceito = self._get_conceito(person, year, _MISSING)
+            if conceito is not _MISSING:
+                result[year] = conceito
+        return result
+
+    def _get_conceito(self, person: str, year: str, default: Any = None) -> Any:
+        """Get the overall concept of a person in one year, or default if absent
+
+        Concepts are remembered, so later lookups do not reparse evaluations
+        evicted from the cache.
+        """
+        key = (person, year)
+        if key in self._conceitos:
+            conceito = self._conceitos[key]
+        else:
+            conceito = _MISSING
+            data = self.evaluations_by_person[person][year]
             if data["success"] and "data" in data:
                 # Handle nested data structure
                 actual_data = data["data"]
@@ -187,8 +526,9 @@ class EvaluationAnalyzer:
                     actual_data = actual_data["data"]
 
                 if "conceito_ciclo_filho_descricao" in actual_data:
-                    result[year] = actual_data["conceito_ciclo_filho_descricao"]
-        return result
+                    conceito = actual_data["conceito_ciclo_filho_descricao"]
+            self._conceitos[key] = conceito
+        return default if conceito is _MISSING else conceito
 
     def get_evaluations_for_person(self, person: str, year: str) -> Dict[str, Any]:
         """Get raw evaluation data for a person in a specific year"""
@@ -203,6 +543,19 @@ class EvaluationAnalyzer:
         self, person: str, year: str
     ) -> Dict[str, Dict[str, Dict[str, Any]]]:
         """Extract behavior scores for all direcionadores"""
+        batch = _BehaviorScoreBatch(self)
+        result = self._collect_behavior_scores(person, year, batch)
+        batch.score()
+        return result
+
+    def _collect_behavior_scores(
+        self, person: str, year: str, batch: "_BehaviorScoreBatch"
+    ) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Build the behavior scores of an evaluation, queueing them in batch.
+
+        The scores are filled in when batch.score() runs, so the vectors of
+        many evaluations can be scored together.
+        """
         result = {}
         if (
             person not in self.evaluations_by_person
@@ -210,135 +563,170 @@ class EvaluationAnalyzer:
         ):
             return result
 
+        if self.tensor is not None:
+            tensor_scores = self._behavior_scores_from_tensor(person, year, batch)
+            if tensor_scores is not None:
+                return tensor_scores
+
         data = self.evaluations_by_person[person][year]
         if not data.get("success", False) or "data" not in data:
             return result
 
+        payload = data.get("data", {})
         # Handle nested data structure - check if data["data"] is a dictionary with "data"
-        if "data" in data and isinstance(data["data"], dict) and "data" in data["data"]:
-            # Handle nested structure - one level deep
-            inner_data = data["data"]["data"]
-            if "direcionadores" in inner_data:
-                for direcionador in inner_data["direcionadores"]:
-                    dir_name = direcionador.get("direcionador", "Unknown")
-                    result[dir_name] = {}
-
-                    for comportamento in direcionador.get("comportamentos", []):
-                        comp_name = comportamento.get("comportamento", "Unknown")
-                        result[dir_name][comp_name] = {"scores": {}}
-
-                        # First try to get scores from consolidado
-                        has_consolidado_scores = False
-                        for avaliacao in comportamento.get("consolidado", []):
-                            avaliador = avaliacao.get("avaliador", "Unknown")
-                            freq_colaborador = avaliacao.get(
-                                "frequencias_colaborador", []
-                            )
-                            freq_grupo = avaliacao.get("frequencias_grupo", [])
-
-                            try:
-                                result[dir_name][comp_name]["scores"][avaliador] = {
-                                    "score_colaborador": self.calculate_weighted_score(
-                                        freq_colaborador
-                                    ),
-                                    "score_grupo": self.calculate_weighted_score(
-                                        freq_grupo
-                                    ),
-                                    "comparison_by_category": self.compare_with_group(
-                                        freq_colaborador, freq_grupo
-                                    ),
-                                }
-                                has_consolidado_scores = True
-                            except Exception as e:
-                                print(
-                                    f"Error processing consolidado scores for {person}, {year}, {dir_name}, {comp_name}, {avaliador}: {str(e)}"
-                                )
-
-                        # If no consolidado scores, try avaliacoes_grupo
-                        if not has_consolidado_scores:
-                            for avaliacao in comportamento.get("avaliacoes_grupo", []):
-                                avaliador = avaliacao.get("avaliador", "Unknown")
-                                freq_colaborador = avaliacao.get(
-                                    "frequencia_colaborador", []
-                                )
-                                freq_grupo = avaliacao.get("frequencia_grupo", [])
-
-                                try:
-                                    result[dir_name][comp_name]["scores"][avaliador] = {
-                                        "score_colaborador": self.calculate_weighted_score(
-                                            freq_colaborador
-                                        ),
-                                        "score_grupo": self.calculate_weighted_score(
-                                            freq_grupo
-                                        ),
-                                        "comparison_by_category": self.compare_with_group(
-                                            freq_colaborador, freq_grupo
-                                        ),
-                                    }
-                                except Exception as e:
-                                    print(
-                                        f"Error processing avaliacoes_grupo scores for {person}, {year}, {dir_name}, {comp_name}, {avaliador}: {str(e)}"
-                                    )
-                return result
-
-        # Original code for standard structure
-        if "direcionadores" not in data.get("data", {}):
+        if (
+            isinstance(payload, dict)
+            and "data" in payload
+            and "direcionadores" in payload["data"]
+        ):
+            payload = payload["data"]
+        elif "direcionadores" not in payload:
             return result
 
-        for direcionador in data["data"]["direcionadores"]:
+        for direcionador in payload["direcionadores"]:
             dir_name = direcionador.get("direcionador", "Unknown")
             result[dir_name] = {}
 
             for comportamento in direcionador.get("comportamentos", []):
                 comp_name = comportamento.get("comportamento", "Unknown")
                 result[dir_name][comp_name] = {"scores": {}}
+                scores = result[dir_name][comp_name]["scores"]
 
                 # First try to get scores from consolidado
                 has_consolidado_scores = False
                 for avaliacao in comportamento.get("consolidado", []):
-                    avaliador = avaliacao.get("avaliador", "Unknown")
-                    freq_colaborador = avaliacao.get("frequencias_colaborador", [])
-                    freq_grupo = avaliacao.get("frequencias_grupo", [])
-
-                    try:
-                        result[dir_name][comp_name]["scores"][avaliador] = {
-                            "score_colaborador": self.calculate_weighted_score(
-                                freq_colaborador
-                            ),
-                            "score_grupo": self.calculate_weighted_score(freq_grupo),
-                            "comparison_by_category": self.compare_with_group(
-                                freq_colaborador, freq_grupo
-                            ),
-                        }
+                    if batch.add(
+                        scores,
+                        avaliacao.get("avaliador", "Unknown"),
+                        avaliacao.get("frequencias_colaborador", []),
+                        avaliacao.get("frequencias_grupo", []),
+                        "consolidado",
+                        (person, year, dir_name, comp_name),
+                    ):
                         has_consolidado_scores = True
-                    except Exception as e:
-                        print(
-                            f"Error processing consolidado scores for {person}, {year}, {dir_name}, {comp_name}, {avaliador}: {str(e)}"
-                        )
 
                 # If no consolidado scores, try avaliacoes_grupo
                 if not has_consolidado_scores:
                     for avaliacao in comportamento.get("avaliacoes_grupo", []):
-                        avaliador = avaliacao.get("avaliador", "Unknown")
-                        freq_colaborador = avaliacao.get("frequencia_colaborador", [])
-                        freq_grupo = avaliacao.get("frequencia_grupo", [])
-
-                        try:
-                            result[dir_name][comp_name]["scores"][avaliador] = {
-                                "score_colaborador": self.calculate_weighted_score(
-                                    freq_colaborador
-                                ),
-                                "score_grupo": self.calculate_weighted_score(
-                                    freq_grupo
-                                ),
-                                "comparison_by_category": self.compare_with_group(
-                                    freq_colaborador, freq_grupo
-                                ),
-                            }
-                        except Exception as e:
-                            print(
-                                f"Error processing avaliacoes_grupo scores for {person}, {year}, {dir_name}, {comp_name}, {avaliador}: {str(e)}"
-                            )
+                        batch.add(
+                            scores,
+                            avaliacao.get("avaliador", "Unknown"),
+                            avaliacao.get("frequencia_colaborador", []),
+                            avaliacao.get("frequencia_grupo", []),
+                            "avaliacoes_grupo",
+                            (person, year, dir_name, comp_name),
+                        )
+
+        return result
+
+    def _iter_behavior_scores(
+        self, evaluations: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> Iterator[tuple]:
+        """Yield (person, year, behavior scores) for the given evaluations.
+
+        Vectors are scored in one pass per SCORE_CUBE_CHUNK evaluations;
+        category comparisons are left out.
+
+        Args:
+            evaluations: (person, year) pairs to score (defaults to every
+                evaluation)
+        """
+        if evaluations is None:
+            evaluations = (
+                (person, year)
+                for person in self.get_all_people()
+                for year in self.get_person_years(person)
+            )
+
+        batch = _BehaviorScoreBatch(self, comparisons=False)
+        pending = []
+        for person, year in evaluations:
+            pending.append(
+                (person, year, self._collect_behavior_scores(person, year, batch))
+            )
+            if (
+                person in self.evaluations_by_person
+                and year in self.evaluations_by_person[person]
+            ):
+                # Read while the evaluation is cached, for compare_people_for_year
+                self._get_conceito(person, year)
+            if len(pending) >= SCORE_CUBE_CHUNK:
+                batch.score()
+                yield from pending
+                pending = []
+        batch.score()
+        yield from pending
+
+    def _cube_for(self, evaluations: List[Tuple[str, str]]) -> BehaviorScoreCube:
+        """Return a cube holding the scores of the given evaluations.
+
+        The company-wide score_cube is reused once it has been built;
+        otherwise only the requested evaluations are parsed, so single-person
+        queries do not load everyone else's files.
+        """
+        if self._score_cube is not None:
+            return self._score_cube
+        return BehaviorScoreCube.from_behavior_scores(
+            self._iter_behavior_scores(evaluations)
+        )
+
+    def _behavior_scores_from_tensor(
+        self, person: str, year: str, batch: "_BehaviorScoreBatch"
+    ) -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+        """Extract behavior scores from the frequency tensor.
+
+        Produces the same result as reading the JSON payload; frequency
+        vectors are read from zero-copy slices of the memory map.
+
+        Returns:
+            The behavior scores, or None if the evaluation is not in the tensor
+        """
+        tensor = self.tensor
+        rows = tensor.row_slice(person, year)
+        if rows is None:
+            return None
+
+        frequencies = tensor.frequencies[rows]
+        kinds = tensor.kind[rows]
+        lengths = tensor.lengths[rows]
+        dir_codes = tensor.codes["direcionador"][rows]
+        comp_codes = tensor.codes["comportamento"][rows]
+        avaliador_codes = tensor.codes["avaliador"][rows]
+
+        # Behaviors with a valid consolidado entry ignore their avaliacoes_grupo
+        valid = (lengths == FREQUENCY_BUCKETS).all(axis=1)
+        with_consolidado = set(comp_codes[(kinds == ROW_CONSOLIDADO) & valid].tolist())
+
+        result = {}
+        for i in range(len(kinds)):
+            dir_name = tensor.label("direcionador", dir_codes[i])
+            comportamentos = result.setdefault(dir_name, {})
+            comp_code = int(comp_codes[i])
+            if comp_code == MISSING_CODE:
+                continue
+
+            comp_name = tensor.label("comportamento", comp_code)
+            scores = comportamentos.setdefault(comp_name, {"scores": {}})["scores"]
+            kind = kinds[i]
+            if kind == ROW_STRUCTURE or (
+                kind == ROW_GROUP and comp_code in with_consolidado
+            ):
+                continue
+
+            avaliador = tensor.label("avaliador", avaliador_codes[i])
+            source = "consolidado" if kind == ROW_CONSOLIDADO else "avaliacoes_grupo"
+            if valid[i]:
+                # Score straight from the memory map, without Python lists
+                batch.add_valid(scores, avaliador, frequencies[i, 0], frequencies[i, 1])
+            else:
+                batch.add(
+                    scores,
+                    avaliador,
+                    frequencies[i, 0, : lengths[i, 0]].tolist(),
+                    frequencies[i, 1, : lengths[i, 1]].tolist(),
+                    source,
+                    (person, year, dir_name, comp_name),
+                )
 
         return result
 
@@ -349,6 +737,28 @@ class EvaluationAnalyzer:
         # Use the centralized scoring function from constants module
         return calculate_score(frequencies, use_nps_model)
 
+    def calculate_weighted_scores(
+        self, frequencies: np.ndarray, use_nps_model: bool = False
+    ) -> np.ndarray:
+        """Calculate the weighted scores of an (N, 6) frequency matrix at once.
+
+        Each score is identical to calculate_weighted_score on the same row.
+        """
+        model = "nps" if use_nps_model else "traditional"
+        return get_scoring_engine().score_matrix(frequencies, [model])[model]
+
+    def compare_with_group_batch(
+        self, person_freqs: np.ndarray, group_freqs: np.ndarray
+    ) -> np.ndarray:
+        """Compare (N, 6) person frequencies with group frequencies at once.
+
+        Row i holds the per-label differences compare_with_group returns for
+        the i-th pair of vectors.
+        """
+        return _distribution_percentages(person_freqs) - _distribution_percentages(
+            group_freqs
+        )
+
     def calculate_score_distribution(self, frequencies: List[int]) -> Dict[str, float]:
         """Calculate the distribution of scores as percentages"""
         # Check if frequencies is None or empty
@@ -384,17 +794,8 @@ class EvaluationAnalyzer:
 
     def get_average_score(self, person: str, year: str) -> float:
         """Calculate average score across all behaviors for a person in a specific year"""
-        scores = []
-        behavior_scores = self.get_behavior_scores(person, year)
-
-        for direcionador, comportamentos in behavior_scores.items():
-            for comportamento, data in comportamentos.items():
-                for avaliador, scores_data in data["scores"].items():
-                    scores.append(scores_data["score_colaborador"])
-
-        if scores:
-            return sum(scores) / len(scores)
-        return 0.0
+        cube = self._cube_for([(person, year)])
+        return cube.average_scores([(person, year)]).tolist()[0]
 
     def get_criteria_for_year(self, year: str) -> Dict[str, Set[str]]:
         """Get all the criteria (direcionadores and comportamentos) for a year"""
@@ -402,17 +803,9 @@ class EvaluationAnalyzer:
 
     def get_score_for_criterion(self, person: str, year: str, criterion: str) -> float:
         """Get score for a specific criterion (direcionador) for a person in a year"""
-        scores = []
-        behavior_scores = self.get_behavior_scores(person, year)
-
-        if criterion in behavior_scores:
-            for comportamento, data in behavior_scores[criterion].items():
-                for avaliador, scores_data in data["scores"].items():
-                    scores.append(scores_data["score_colaborador"])
-
-        if scores:
-            return sum(scores) / len(scores)
-        return 0.0
+        cube = self._cube_for([(person, year)])
+        scores = cube.criterion_scores([(person, year)], [criterion])
+        return scores.tolist()[0][0]
 
     def compare_people_for_year(self, year: str) -> pd.DataFrame:
         """Compare all people for a specific year and return as a DataFrame
@@ -429,41 +822,28 @@ class EvaluationAnalyzer:
             return pd.DataFrame()  # Return empty DataFrame if no people found
 
         # Get all criteria for this year
-        criteria = self.get_criteria_for_year(year)
+        criteria = list(self.get_criteria_for_year(year))
+
+        # Average and per-criterion scores of everyone, sliced from the cube
+        evaluations = [(person, year) for person in people]
+        average_scores = self.score_cube.average_scores(evaluations).tolist()
+        criterion_scores = self.score_cube.criterion_scores(
+            evaluations, criteria
+        ).tolist()
 
         # Create results list
         results = []
 
-        for person in people:
-            # Get data for this person
-            behavior_scores = self.get_behavior_scores(person, year)
-            conceito_by_year = self.get_conceito_by_year(person)
-
-            # Calculate overall average score
-            avg_score = self.get_average_score(person, year)
-
+        for person, avg_score, scores in zip(people, average_scores, criterion_scores):
             # Create row data
             row = {
                 "Name": person,
                 "Average Score": avg_score,
-                "Concept": conceito_by_year.get(year, "Unknown"),
+                "Concept": self._get_conceito(person, year, "Unknown"),
             }
 
             # Add scores for each criterion
-            for criterion in criteria:
-                criterion_score = 0.0
-                count = 0
-
-                if criterion in behavior_scores:
-                    for comportamento, data in behavior_scores[criterion].items():
-                        for avaliador, scores_data in data["scores"].items():
-                            criterion_score += scores_data["score_colaborador"]
-                            count += 1
-
-                if count > 0:
-                    row[criterion] = criterion_score / count
-                else:
-                    row[criterion] = 0.0
+            row.update(zip(criteria, scores))
 
             results.append(row)
 
@@ -485,6 +865,10 @@ class EvaluationAnalyzer:
             # Add to DataFrame
             df = pd.concat([df, pd.DataFrame([avg_row])], ignore_index=True)
 
+            concepts = get_vocabulary("conceito").categorical(df["Concept"])
+            if concepts is not None:
+                df["Concept"] = concepts
+
         return df
 
     def find_common_behaviors(self, years: List[str]) -> Dict[str, Set[str]]:
@@ -541,42 +925,35 @@ class EvaluationAnalyzer:
             "behavior_scores_by_year": defaultdict(lambda: defaultdict(dict)),
         }
 
+        # Scores of this person's evaluations only, unless the cube is built
+        evaluations = [(person, year) for year in years]
+        cube = self._cube_for(evaluations)
+        average_scores = cube.average_scores(evaluations).tolist()
+
         # For each year, get the average score
-        for year in years:
-            results["average_score_by_year"][year] = self.get_average_score(
-                person, year
-            )
+        for year, average_score in zip(years, average_scores):
+            results["average_score_by_year"][year] = average_score
 
-            # Get scores for all direcionadores
-            behavior_scores = self.get_behavior_scores(person, year)
+            # Get the scores of all direcionadores from the cube
+            behavior_scores = cube.behavior_scores(person, year)
 
             # Calculate average score per direcionador
             for direcionador, comportamentos in behavior_scores.items():
                 direcionador_scores = []
 
-                for comportamento, data in comportamentos.items():
-                    behavior_scores_by_avaliador = []
-
-                    for avaliador, scores_data in data["scores"].items():
-                        behavior_scores_by_avaliador.append(
-                            scores_data["score_colaborador"]
-                        )
+                for comportamento, avaliador_scores in comportamentos.items():
+                    # Store individual behavior scores (the last avaliador's)
+                    if (
+                        direcionador in common_behaviors
+                        and comportamento in common_behaviors[direcionador]
+                    ):
+                        results["behavior_scores_by_year"][direcionador][comportamento][
+                            year
+                        ] = avaliador_scores[-1]
 
-                        # Store individual behavior scores
-                        if (
-                            direcionador in common_behaviors
-                            and comportamento in common_behaviors[direcionador]
-                        ):
-                            results["behavior_scores_by_year"][direcionador][
-                                comportamento
-                            ][year] = scores_data["score_colaborador"]
-
-                    # Add to direcionador scores if we have data
-                    if behavior_scores_by_avaliador:
-                        direcionador_scores.append(
-                            sum(behavior_scores_by_avaliador)
-                            / len(behavior_scores_by_avaliador)
-                        )
+                    direcionador_scores.append(
+                        sum(avaliador_scores) / len(avaliador_scores)
+                    )
 
                 # Calculate average for this direcionador
                 if direcionador_scores:
@@ -0,0 +1,74 @@
+"""
+Evaluation corpus for People Analytics.
+
+This module provides a shared, lazily loaded view over the flattened
+evaluation rows of a data directory. The corpus is read from the evaluation
+store once and reused by every report generator until it is invalidated.
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from .data_pipeline import DataPipeline
+from .vocabulary import categorize_labels
+
+
+def classify_stakeholder(avaliador: str) -> str:
+    """Classify an avaliador label as a manager, self or peer evaluation."""
+    stakeholder = avaliador.lower()
+    if "gestor" in stakeholder or "manager" in stakeholder:
+        return "manager"
+    elif "auto" in stakeholder or "self" in stakeholder:
+        return "self"
+    return "peer"
+
+
+class EvaluationCorpus:
+    """Flattened evaluation rows of a data directory, loaded once and shared."""
+
+    def __init__(self, pipeline: DataPipeline, directory: Union[str, Path]):
+        """Initialize the corpus.
+
+        Args:
+            pipeline: Data pipeline backing the evaluation store
+            directory: Data directory whose rows make up the corpus
+        """
+        self.pipeline = pipeline
+        self.directory = Path(directory)
+        self.logger = logging.getLogger("EvaluationCorpus")
+        self.version = 0
+        self._frame: Optional[pd.DataFrame] = None
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the corpus rows are currently in memory."""
+        return self._frame is not None
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """Return the shared corpus DataFrame, loading it on first access.
+
+        The frame holds every evaluation store column plus a derived
+        stakeholder_type column; label columns are vocabulary categoricals
+        (see vocabulary.categorize_labels). It is shared between callers and
+        must not be modified in place.
+        """
+        if self._frame is None:
+            self._frame = self._load()
+            self.version += 1
+        return self._frame
+
+    def invalidate(self) -> None:
+        """Drop the in-memory rows so the next access reloads the store."""
+        self._frame = None
+
+    def _load(self) -> pd.DataFrame:
+        """Read the corpus rows from the evaluation store."""
+        df = categorize_labels(self.pipeline.load_evaluations(directory=self.directory))
+        # Classifies each distinct avaliador once, through the categories
+        df["stakeholder_type"] = df["avaliador"].map(classify_stakeholder)
+        self.logger.info(f"Loaded {len(df)} evaluation rows from {self.directory}")
+        return df
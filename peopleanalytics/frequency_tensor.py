@@ -0,0 +1,420 @@
+"""
+Frequency tensor for People Analytics.
+
+This module packs every frequency vector of a ``<pessoa>/<ano>/resultado.json``
+tree into an on-disk ``int32[N, 2, 6]`` array opened with numpy.memmap, where
+``[:, 0]`` holds frequencia_colaborador and ``[:, 1]`` frequencia_grupo. Side
+index arrays hold pessoa, ano, direcionador, comportamento, avaliador and the
+pergunta_final values as categorical codes, so consumers can read a person's
+vectors as zero-copy slices instead of keeping nested lists in memory.
+
+Rows of one pessoa/ano are contiguous and follow the document order. Besides
+one row per avaliacoes_grupo entry, consolidado entries get their own rows and
+structural rows record direcionadores and comportamentos without any entry,
+which lets the nested structure be rebuilt exactly. Documents the layout cannot
+represent (vectors longer than 6, non-integer counts, duplicate names) are left
+out and readers fall back to the JSON file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .data_pipeline import FREQUENCY_BUCKETS
+from .json_loader import load_json
+
+logger = logging.getLogger(__name__)
+
+TENSOR_VERSION = 1
+
+# Categorical index arrays stored next to the frequency tensor
+INDEX_FIELDS = (
+    "pessoa",
+    "ano",
+    "direcionador",
+    "comportamento",
+    "avaliador",
+    "direcionador_pergunta",
+    "comportamento_pergunta",
+)
+
+# Per pessoa/ano values kept in the metadata, when present in the document
+GROUP_FIELDS = {
+    "conceito": "conceito_ciclo_filho_descricao",
+    "peer_group": "nome_peer_group",
+}
+
+# Code used in the index arrays of structural rows
+MISSING_CODE = -1
+
+# Row kinds
+ROW_GROUP = 0  # an avaliacoes_grupo entry
+ROW_CONSOLIDADO = 1  # a consolidado entry
+ROW_STRUCTURE = 2  # a direcionador or comportamento without entries
+
+
+class _UnsupportedDocument(ValueError):
+    """Raised when a document cannot be represented in the tensor."""
+
+
+# Placeholder for the labels a structural row does not have
+_MISSING = object()
+
+
+def _vector(values: Any) -> Tuple[List[int], int]:
+    """Pad a frequency vector to 6 buckets.
+
+    Returns:
+        The padded vector and the length of the original
+    """
+    if not isinstance(values, list) or len(values) > FREQUENCY_BUCKETS:
+        raise _UnsupportedDocument("frequency vector is not a list of up to 6 values")
+    if any(isinstance(v, bool) or not isinstance(v, int) for v in values):
+        raise _UnsupportedDocument("frequency vector has non-integer values")
+    return list(values) + [0] * (FREQUENCY_BUCKETS - len(values)), len(values)
+
+
+def encode_document(document: Any) -> List[Tuple]:
+    """Encode a resultado.json document into tensor rows.
+
+    Args:
+        document: The decoded resultado.json
+
+    Returns:
+        List of (direcionador, comportamento, avaliador, direcionador_pergunta,
+        comportamento_pergunta, kind, lengths, colaborador, grupo) tuples
+
+    Raises:
+        _UnsupportedDocument: If the document cannot be represented exactly
+    """
+    if not isinstance(document, dict):
+        raise _UnsupportedDocument("document is not an object")
+    data = document.get("data", document)
+    if not isinstance(data, dict) or not isinstance(
+        data.get("direcionadores", []), list
+    ):
+        raise _UnsupportedDocument("unexpected data section")
+
+    rows = []
+    seen_direcionadores = set()
+    seen_comportamentos = set()
+    for direcionador in data.get("direcionadores", []):
+        dir_name = direcionador.get("direcionador", "Unknown")
+        dir_pergunta = direcionador.get("pergunta_final", False)
+        comportamentos = direcionador.get("comportamentos", [])
+        if dir_name in seen_direcionadores:
+            raise _UnsupportedDocument(f"duplicate direcionador {dir_name}")
+        if not isinstance(comportamentos, list):
+            raise _UnsupportedDocument("comportamentos is not a list")
+        seen_direcionadores.add(dir_name)
+
+        if not comportamentos:
+            rows.append(
+                (dir_name, _MISSING, _MISSING, dir_pergunta, _MISSING)
+                + (ROW_STRUCTURE, (0, 0))
+                + ([0] * FREQUENCY_BUCKETS, [0] * FREQUENCY_BUCKETS)
+            )
+
+        for comportamento in comportamentos:
+            comp_name = comportamento.get("comportamento", "Unknown")
+            comp_pergunta = comportamento.get("pergunta_final", False)
+            consolidado = comportamento.get("consolidado", [])
+            avaliacoes = comportamento.get("avaliacoes_grupo", [])
+            if comp_name in seen_comportamentos:
+                raise _UnsupportedDocument(f"duplicate comportamento {comp_name}")
+            if not isinstance(consolidado, list) or not isinstance(avaliacoes, list):
+                raise _UnsupportedDocument("entries are not lists")
+            seen_comportamentos.add(comp_name)
+
+            entries = [
+                (ROW_CONSOLIDADO, entry, "frequencias_colaborador", "frequencias_grupo")
+                for entry in consolidado
+            ] + [
+                (ROW_GROUP, entry, "frequencia_colaborador", "frequencia_grupo")
+                for entry in avaliacoes
+            ]
+            if not entries:
+                rows.append(
+                    (dir_name, comp_name, _MISSING, dir_pergunta, comp_pergunta)
+                    + (ROW_STRUCTURE, (0, 0))
+                    + ([0] * FREQUENCY_BUCKETS, [0] * FREQUENCY_BUCKETS)
+                )
+
+            for kind, entry, colaborador_key, grupo_key in entries:
+                avaliador = entry.get("avaliador", "Unknown")
+                try:
+                    hash(avaliador)
+                except TypeError:
+                    raise _UnsupportedDocument("avaliador is not hashable")
+
+                colaborador, colaborador_length = _vector(
+                    entry.get(colaborador_key, [])
+                )
+                grupo, grupo_length = _vector(entry.get(grupo_key, []))
+                rows.append(
+                    (
+                        dir_name,
+                        comp_name,
+                        avaliador,
+                        dir_pergunta,
+                        comp_pergunta,
+                        kind,
+                        (colaborador_length, grupo_length),
+                        colaborador,
+                        grupo,
+                    )
+                )
+
+    return rows
+
+
+class FrequencyTensor:
+    """Memory-mapped frequency vectors with categorical index arrays."""
+
+    def __init__(self, tensor_dir: Union[str, Path]):
+        """Open a built tensor read-only.
+
+        Args:
+            tensor_dir: Directory the tensor was built into
+        """
+        self.tensor_dir = Path(tensor_dir)
+        with open(self.tensor_dir / "metadata.json", "r", encoding="utf-8") as f:
+            self.metadata = json.load(f)
+
+        self.rows = self.metadata["rows"]
+        self.categories: Dict[str, List[Any]] = self.metadata["categories"]
+        self.groups: Dict[str, Dict[str, Any]] = self.metadata["groups"]
+
+        self.frequencies = self._open("frequencies", np.int32, (2, FREQUENCY_BUCKETS))
+        self.kind = self._open("kind", np.int8)
+        self.lengths = self._open("lengths", np.int8, (2,))
+        self.codes = {field: self._open(field, np.int32) for field in INDEX_FIELDS}
+
+    @staticmethod
+    def default_dir(output_dir: Union[str, Path] = "output") -> Path:
+        """Return the default tensor directory, kept with the generated output.
+
+        The data directory may be read-only or shared, so the tensor lives
+        under ``<output_dir>/store`` like the DuckDB evaluation store.
+        """
+        return Path(output_dir) / "store" / "tensor"
+
+    @staticmethod
+    def source_files(data_dir: Union[str, Path]) -> List[Tuple[str, str, Path]]:
+        """List the (pessoa, ano, resultado.json) sources of a data directory."""
+        sources = []
+        # Absolute paths, so tensors of different data directories never match
+        with os.scandir(Path(data_dir).resolve()) as pessoa_entries:
+            pessoa_dirs = sorted(
+                (
+                    e
+                    for e in pessoa_entries
+                    if e.is_dir() and not e.name.startswith(".")
+                ),
+                key=lambda e: e.name,
+            )
+        for pessoa_entry in pessoa_dirs:
+            with os.scandir(pessoa_entry.path) as ano_entries:
+                ano_dirs = sorted(
+                    (e for e in ano_entries if e.is_dir()), key=lambda e: e.name
+                )
+            for ano_entry in ano_dirs:
+                resultado = Path(ano_entry.path) / "resultado.json"
+                if resultado.is_file():
+                    sources.append((pessoa_entry.name, ano_entry.name, resultado))
+        return sources
+
+    @staticmethod
+    def fingerprint(sources: List[Tuple[str, str, Path]]) -> str:
+        """Fingerprint the sources by path, size and mtime."""
+        digest = hashlib.sha256()
+        for pessoa, ano, path in sources:
+            stat = path.stat()
+            digest.update(
+                f"{pessoa}/{ano}:{path}:{stat.st_size}:{stat.st_mtime_ns}\n".encode()
+            )
+        return digest.hexdigest()
+
+    @classmethod
+    def open(
+        cls,
+        data_dir: Union[str, Path],
+        tensor_dir: Optional[Union[str, Path]] = None,
+    ) -> "FrequencyTensor":
+        """Open the tensor of a data directory, rebuilding it when stale.
+
+        Args:
+            data_dir: Directory with the pessoa/ano structure
+            tensor_dir: Where the tensor lives (defaults to default_dir())
+
+        Returns:
+            The opened tensor
+        """
+        tensor_dir = Path(tensor_dir) if tensor_dir else cls.default_dir()
+        sources = cls.source_files(data_dir)
+        fingerprint = cls.fingerprint(sources)
+
+        try:
+            tensor = cls(tensor_dir)
+            if (
+                tensor.metadata.get("version") == TENSOR_VERSION
+                and tensor.metadata.get("fingerprint") == fingerprint
+            ):
+                return tensor
+        except (OSError, ValueError, KeyError):
+            pass
+
+        return cls.build(data_dir, tensor_dir, sources=sources, fingerprint=fingerprint)
+
+    @classmethod
+    def build(
+        cls,
+        data_dir: Union[str, Path],
+        tensor_dir: Optional[Union[str, Path]] = None,
+        sources: Optional[List[Tuple[str, str, Path]]] = None,
+        fingerprint: Optional[str] = None,
+    ) -> "FrequencyTensor":
+        """Build the tensor of a data directory.
+
+        Rows are streamed to disk one document at a time, so building never
+        holds more than one parsed document in memory.
+
+        Args:
+            data_dir: Directory with the pessoa/ano structure
+            tensor_dir: Where to build the tensor (defaults to default_dir())
+            sources: Precomputed source list from source_files
+            fingerprint: Precomputed fingerprint of the sources
+
+        Returns:
+            The opened tensor
+        """
+        tensor_dir = Path(tensor_dir) if tensor_dir else cls.default_dir()
+        tensor_dir.mkdir(parents=True, exist_ok=True)
+        if sources is None:
+            sources = cls.source_files(data_dir)
+        if fingerprint is None:
+            fingerprint = cls.fingerprint(sources)
+
+        categories = {field: [] for field in INDEX_FIELDS}
+        lookup = {field: {} for field in INDEX_FIELDS}
+
+        def code(field, value):
+            if value is _MISSING:
+                return MISSING_CODE
+            key = json.dumps(value, sort_keys=True)
+            if key not in lookup[field]:
+                lookup[field][key] = len(categories[field])
+                categories[field].append(value)
+            return lookup[field][key]
+
+        names = ["frequencies", "kind", "lengths"] + list(INDEX_FIELDS)
+        handles = {name: open(tensor_dir / f"{name}.bin.tmp", "wb") for name in names}
+        groups = {}
+        total = 0
+        try:
+            for pessoa, ano, path in sources:
+                try:
+                    document = load_json(path)
+                    rows = encode_document(document)
+                except Exception as e:
+                    # Readers fall back to the JSON file for these documents
+                    logger.info(f"Leaving {path} out of the frequency tensor: {e}")
+                    continue
+
+                data = document.get("data", document)
+                group = {"start": total, "stop": total + len(rows)}
+                for key, source_key in GROUP_FIELDS.items():
+                    if source_key in data:
+                        group[key] = data[source_key]
+                groups[f"{pessoa}/{ano}"] = group
+                total += len(rows)
+                if not rows:
+                    continue
+
+                pessoa_code = code("pessoa", pessoa)
+                ano_code = code("ano", ano)
+                columns = {field: [] for field in INDEX_FIELDS}
+                kinds, lengths, vectors = [], [], []
+                for row in rows:
+                    columns["pessoa"].append(pessoa_code)
+                    columns["ano"].append(ano_code)
+                    columns["direcionador"].append(code("direcionador", row[0]))
+                    columns["comportamento"].append(code("comportamento", row[1]))
+                    columns["avaliador"].append(code("avaliador", row[2]))
+                    columns["direcionador_pergunta"].append(
+                        code("direcionador_pergunta", row[3])
+                    )
+                    columns["comportamento_pergunta"].append(
+                        code("comportamento_pergunta", row[4])
+                    )
+                    kinds.append(row[5])
+                    lengths.append(row[6])
+                    vectors.append((row[7], row[8]))
+
+                handles["frequencies"].write(np.asarray(vectors, np.int32).tobytes())
+                handles["kind"].write(np.asarray(kinds, np.int8).tobytes())
+                handles["lengths"].write(np.asarray(lengths, np.int8).tobytes())
+                for field in INDEX_FIELDS:
+                    handles[field].write(np.asarray(columns[field], np.int32).tobytes())
+        finally:
+            for handle in handles.values():
+                handle.close()
+
+        for name in names:
+            os.replace(tensor_dir / f"{name}.bin.tmp", tensor_dir / f"{name}.bin")
+
+        # Metadata goes last, so a reader never sees it ahead of the arrays
+        metadata_tmp = tensor_dir / "metadata.json.tmp"
+        with open(metadata_tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": TENSOR_VERSION,
+                    "fingerprint": fingerprint,
+                    "rows": total,
+                    "categories": categories,
+                    "groups": groups,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(metadata_tmp, tensor_dir / "metadata.json")
+
+        logger.info(f"Built frequency tensor with {total} rows in {tensor_dir}")
+        return cls(tensor_dir)
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def group(self, pessoa: str, ano: str) -> Optional[Dict[str, Any]]:
+        """Return the metadata of a pessoa/ano, or None if it is not in the tensor."""
+        return self.groups.get(f"{pessoa}/{ano}")
+
+    def row_slice(self, pessoa: str, ano: str) -> Optional[slice]:
+        """Return the rows of a pessoa/ano, or None if it is not in the tensor."""
+        group = self.group(pessoa, ano)
+        if group is None:
+            return None
+        return slice(group["start"], group["stop"])
+
+    def label(self, field: str, code: int) -> Any:
+        """Return the category value of a code, or None for MISSING_CODE."""
+        if code == MISSING_CODE:
+            return None
+        return self.categories[field][code]
+
+    def _open(self, name: str, dtype, shape: Tuple[int, ...] = ()) -> np.ndarray:
+        """Map one of the tensor arrays read-only."""
+        if self.rows == 0:
+            # numpy cannot map empty files
+            return np.zeros((0,) + shape, dtype=dtype)
+        return np.memmap(
+            self.tensor_dir / f"{name}.bin",
+            dtype=dtype,
+            mode="r",
+            shape=(self.rows,) + shape,
+        )
@@ -0,0 +1,217 @@
+"""
+JSON loader for People Analytics.
+
+This module provides the single entry point used to read resultado.json and
+perfil.json files. Documents are read as bytes in one call and decoded with
+the fastest available backend: orjson or msgspec when installed, the standard
+library otherwise. Evaluation documents can optionally be decoded into typed
+dataclasses instead of plain dictionaries.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Errors the fast backends raise for documents the standard library may accept
+FAST_DECODE_ERRORS = (ValueError,)
+if msgspec is not None:
+    FAST_DECODE_ERRORS += (msgspec.DecodeError,)
+
+if orjson is not None:
+    JSON_BACKEND = "orjson"
+elif msgspec is not None:
+    JSON_BACKEND = "msgspec"
+else:
+    JSON_BACKEND = "json"
+
+
+@dataclass
+class AvaliacaoGrupo:
+    """Frequency distributions given by one evaluator group."""
+
+    avaliador: str
+    frequencia_colaborador: List[int] = field(default_factory=list)
+    frequencia_grupo: List[int] = field(default_factory=list)
+
+
+@dataclass
+class Comportamento:
+    """A behavior evaluated within a direcionador."""
+
+    comportamento: str
+    pergunta_final: Any = None
+    avaliacoes_grupo: List[AvaliacaoGrupo] = field(default_factory=list)
+    consolidado: Any = None
+
+
+@dataclass
+class Direcionador:
+    """A direcionador grouping evaluated behaviors."""
+
+    direcionador: str
+    pergunta_final: Any = None
+    comportamentos: List[Comportamento] = field(default_factory=list)
+
+
+@dataclass
+class EvaluationData:
+    """The data section of a resultado.json document."""
+
+    conceito_ciclo_filho_descricao: Optional[str] = None
+    nome_peer_group: Optional[str] = None
+    direcionadores: List[Direcionador] = field(default_factory=list)
+
+
+@dataclass
+class Resultado:
+    """A resultado.json document."""
+
+    data: EvaluationData
+    success: bool = True
+    status_code: Optional[int] = None
+
+
+def read_bytes(file_path: Union[str, Path]) -> bytes:
+    """Read a whole file as bytes, sized up front so it takes a single read.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        The file contents
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = os.fstat(fd).st_size
+        # Ask for one byte more than the size so EOF is seen by the same read
+        content = os.read(fd, size + 1)
+        if len(content) == size:
+            return content
+
+        # Short read or the file changed since fstat; read until EOF
+        chunks = [content]
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return b"".join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def loads(content: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the configured backend.
+
+    Documents the fast backend rejects (e.g. NaN literals) are retried with
+    the standard library, so results and errors match json.loads.
+
+    Args:
+        content: The JSON document
+
+    Returns:
+        The decoded document
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    try:
+        if JSON_BACKEND == "orjson":
+            return orjson.loads(content)
+        if JSON_BACKEND == "msgspec":
+            return msgspec.json.decode(content)
+    except FAST_DECODE_ERRORS:
+        pass
+    return json.loads(content)
+
+
+def load_json(file_path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file.
+
+    Args:
+        file_path: Path to the JSON file
+
+    Returns:
+        The decoded document
+    """
+    return loads(read_bytes(file_path))
+
+
+def load_resultado(file_path: Union[str, Path], typed: bool = False) -> Any:
+    """Read a resultado.json file.
+
+    Typed documents are decoded straight into dataclasses by msgspec when it
+    is installed; documents its strict validation rejects (missing fields,
+    mismatched types) go through to_resultado, so both paths give the same
+    result.
+
+    Args:
+        file_path: Path to the resultado.json file
+        typed: Decode into a Resultado dataclass instead of a dictionary
+
+    Returns:
+        The decoded document
+    """
+    content = read_bytes(file_path)
+    if not typed:
+        return loads(content)
+
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(content, type=Resultado)
+        except msgspec.DecodeError:
+            pass
+    return to_resultado(loads(content))
+
+
+def to_resultado(document: dict) -> Resultado:
+    """Convert a decoded resultado.json dictionary into a Resultado."""
+    data = document.get("data") or {}
+    return Resultado(
+        success=document.get("success", True),
+        status_code=document.get("status_code"),
+        data=EvaluationData(
+            conceito_ciclo_filho_descricao=data.get("conceito_ciclo_filho_descricao"),
+            nome_peer_group=data.get("nome_peer_group"),
+            direcionadores=[
+                Direcionador(
+                    direcionador=direcionador.get("direcionador", ""),
+                    pergunta_final=direcionador.get("pergunta_final"),
+                    comportamentos=[
+                        Comportamento(
+                            comportamento=comportamento.get("comportamento", ""),
+                            pergunta_final=comportamento.get("pergunta_final"),
+                            avaliacoes_grupo=[
+                                AvaliacaoGrupo(
+                                    avaliador=avaliacao.get("avaliador", ""),
+                                    frequencia_colaborador=avaliacao.get(
+                                        "frequencia_colaborador", []
+                                    ),
+                                    frequencia_grupo=avaliacao.get(
+                                        "frequencia_grupo", []
+                                    ),
+                                )
+                                for avaliacao in comportamento.get(
+                                    "avaliacoes_grupo", []
+                                )
+                            ],
+                            consolidado=comportamento.get("consolidado"),
+                        )
+                        for comportamento in direcionador.get("comportamentos", [])
+                    ],
+                )
+                for direcionador in data.get("direcionadores", [])
+            ],
+        ),
+    )
@@ -0,0 +1,306 @@
+"""
+Content-addressed parse cache for People Analytics.
+
+Several tools parse the same ``resultado.json`` files independently (sync,
+the JSON processor, the evaluation analyzer, PersonData and the report
+generator). This module keeps one shared on-disk cache of their parsed
+results, keyed by the SHA-256 hash of the file content, so a file is decoded
+and normalized once and every later reader, in any process, only unpickles
+the stored structure.
+
+Entries live under ``<cache_dir>/v<version>/<namespace>/<hash[:2]>/<hash>.pkl``.
+The namespace separates the different structures stored for the same content
+(the decoded document, the JSON processor extraction, ...). Since keys are
+content hashes, entries never go stale; changed files simply get new keys.
+
+Entries of edited files would otherwise pile up forever, so the cache is kept
+under a size bound: reading an entry refreshes its mtime, and a write that
+takes the cache over max_bytes deletes the least recently used entries (by
+mtime) until it is back under PRUNE_RATIO of the bound.
+
+The cache is disabled unless configured, either with configure() (the CLI
+does this, see ``--parse-cache``) or the PEOPLEANALYTICS_PARSE_CACHE
+environment variable. Readers fall back to parsing when it is disabled or
+unusable.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from .json_loader import loads, read_bytes
+
+PARSE_CACHE_VERSION = 1
+
+# Environment variable holding the cache directory
+PARSE_CACHE_ENV = "PEOPLEANALYTICS_PARSE_CACHE"
+
+# Environment variable holding the cache size bound in bytes
+PARSE_CACHE_MAX_BYTES_ENV = "PEOPLEANALYTICS_PARSE_CACHE_MAX_BYTES"
+
+# Default cache directory used by the CLI, next to the other stores
+DEFAULT_PARSE_CACHE_DIR = Path("output") / "store" / "parse_cache"
+
+# Default size bound of the cache
+DEFAULT_PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Share of max_bytes the cache is trimmed down to when it overflows
+PRUNE_RATIO = 0.8
+
+# Namespace of decoded JSON documents
+DOCUMENT_NAMESPACE = "document"
+
+logger = logging.getLogger(__name__)
+
+
+class ParseCache:
+    """On-disk cache of parsed results keyed by file content hash."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_bytes: int = DEFAULT_PARSE_CACHE_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_bytes: Size bound of the entries on disk
+        """
+        self.cache_dir = Path(cache_dir)
+        self.root = self.cache_dir / f"v{PARSE_CACHE_VERSION}"
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Size of the entries on disk, scanned on the first write
+        self._size = None
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """Compute the SHA-256 hash of file content."""
+        return hashlib.sha256(content).hexdigest()
+
+    def entry_path(self, namespace: str, digest: str) -> Path:
+        """Return the path of the entry for a namespace and content hash."""
+        return self.root / namespace / digest[:2] / f"{digest}.pkl"
+
+    def get(self, namespace: str, digest: str) -> Any:
+        """Load an entry.
+
+        Returns:
+            The stored value, or None if there is no readable entry
+        """
+        entry_path = self.entry_path(namespace, digest)
+        try:
+            with open(entry_path, "rb") as f:
+                value = pickle.load(f)
+            # Mark the entry as recently used for prune()
+            os.utime(entry_path)
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache entry {digest}: {e}")
+            return None
+
+    def put(self, namespace: str, digest: str, value: Any) -> None:
+        """Store an entry atomically; failures only log a warning."""
+        entry_path = self.entry_path(namespace, digest)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    size = f.tell()
+                os.replace(tmp_path, entry_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write parse cache entry {digest}: {e}")
+            return
+
+        if self._size is None:
+            self._size = sum(entry[1] for entry in self._entries())
+        else:
+            self._size += size
+        if self._size > self.max_bytes:
+            self.prune()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) of every entry on disk."""
+        entries = []
+        for entry_path in self.root.glob("*/*/*.pkl"):
+            try:
+                stat = entry_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+        return entries
+
+    def prune(self, max_bytes: Optional[int] = None) -> int:
+        """Delete the least recently used entries until the cache fits.
+
+        Args:
+            max_bytes: Size bound to enforce (defaults to the cache's own);
+                the cache is trimmed to PRUNE_RATIO of it
+
+        Returns:
+            Number of entries deleted
+        """
+        if max_bytes is None:
+            max_bytes = self.max_bytes
+        entries = sorted(self._entries())
+        size = sum(entry[1] for entry in entries)
+        removed = 0
+        if size > max_bytes:
+            target = max_bytes * PRUNE_RATIO
+            for _, entry_size, entry_path in entries:
+                if size <= target:
+                    break
+                try:
+                    entry_path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"Could not delete parse cache entry: {e}")
+                    continue
+                size -= entry_size
+                removed += 1
+        self._size = size
+        return removed
+
+    def parse(
+        self,
+        content: bytes,
+        namespace: str,
+        parser: Callable[[bytes], Any],
+    ) -> Any:
+        """Return the parsed result of content, parsing it only on a miss.
+
+        Every call returns a fresh object, so callers may mutate the result.
+        Parser errors propagate and nothing is stored.
+
+        Args:
+            content: The file content
+            namespace: Namespace of the parsed structure
+            parser: Parses the content into the structure to cache
+
+        Returns:
+            The parsed result
+        """
+        digest = self.content_hash(content)
+        value = self.get(namespace, digest)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = parser(content)
+        if value is not None:
+            self.put(namespace, digest, value)
+        return value
+
+
+_parse_cache: Optional[ParseCache] = None
+_configured = False
+
+
+def configure(
+    cache_dir: Optional[Union[str, Path]],
+    max_bytes: Optional[int] = None,
+) -> Optional[ParseCache]:
+    """Set the process-wide parse cache.
+
+    The settings are also exported to PEOPLEANALYTICS_PARSE_CACHE and
+    PEOPLEANALYTICS_PARSE_CACHE_MAX_BYTES, so worker processes started
+    afterwards share the same cache and bound.
+
+    Args:
+        cache_dir: Cache directory, or None to disable the cache
+        max_bytes: Size bound of the cache (defaults to
+            DEFAULT_PARSE_CACHE_MAX_BYTES)
+
+    Returns:
+        The configured cache, or None
+    """
+    global _parse_cache, _configured
+    if cache_dir:
+        if max_bytes is None:
+            max_bytes = DEFAULT_PARSE_CACHE_MAX_BYTES
+        _parse_cache = ParseCache(Path(cache_dir).resolve(), max_bytes)
+        os.environ[PARSE_CACHE_ENV] = str(_parse_cache.cache_dir)
+        os.environ[PARSE_CACHE_MAX_BYTES_ENV] = str(max_bytes)
+    else:
+        _parse_cache = None
+        os.environ.pop(PARSE_CACHE_ENV, None)
+        os.environ.pop(PARSE_CACHE_MAX_BYTES_ENV, None)
+    _configured = True
+    return _parse_cache
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the process-wide parse cache, or None if it is disabled."""
+    if not _configured:
+        max_bytes = os.environ.get(PARSE_CACHE_MAX_BYTES_ENV)
+        configure(
+            os.environ.get(PARSE_CACHE_ENV), int(max_bytes) if max_bytes else None
+        )
+    return _parse_cache
+
+
+def parse_file(
+    file_path: Union[str, Path],
+    namespace: str,
+    parser: Callable[[bytes], Any],
+) -> Any:
+    """Read a file and parse it through the process-wide cache.
+
+    Args:
+        file_path: Path to the file
+        namespace: Namespace of the parsed structure
+        parser: Parses the file content into the structure to cache
+
+    Returns:
+        The parsed result
+    """
+    return parse_content(read_bytes(file_path), namespace, parser)
+
+
+def parse_content(
+    content: bytes,
+    namespace: str,
+    parser: Callable[[bytes], Any],
+) -> Any:
+    """Parse already read file content through the process-wide cache.
+
+    Args:
+        content: The file content
+        namespace: Namespace of the parsed structure
+        parser: Parses the content into the structure to cache
+
+    Returns:
+        The parsed result
+    """
+    cache = get_parse_cache()
+    if cache is None:
+        return parser(content)
+    return cache.parse(content, namespace, parser)
+
+
+def load_json_cached(file_path: Union[str, Path]) -> Any:
+    """Read and decode a JSON file through the process-wide cache.
+
+    Drop-in replacement for json_loader.load_json.
+    """
+    return parse_file(file_path, DOCUMENT_NAMESPACE, loads)
+
+
+def loads_cached(content: bytes) -> Any:
+    """Decode already read JSON content through the process-wide cache."""
+    return parse_content(content, DOCUMENT_NAMESPACE, loads)
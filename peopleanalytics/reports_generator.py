@@ -10,6 +10,7 @@ import seaborn as sns
 
 from .data_model import PersonData
 from .evaluation_analyzer import EvaluationAnalyzer
+from .frequency_tensor import FrequencyTensor
 
 
 class ChartConfig:
@@ -153,8 +154,13 @@ def generate_360_evaluation_report(data: Dict[str, Any], output_dir: str) -> str
     )
     os.makedirs(report_dir, exist_ok=True)
 
-    # Initialize analyzer
-    analyzer = EvaluationAnalyzer(data_path)
+    # Initialize analyzer; the comparative and historical reports score every
+    # person, so frequency vectors are read from the memory-mapped tensor
+    analyzer = EvaluationAnalyzer(
+        data_path,
+        use_tensor=True,
+        tensor_dir=FrequencyTensor.default_dir(output_dir),
+    )
 
     # Get available years and people if not specified
     available_years = analyzer.get_all_years()
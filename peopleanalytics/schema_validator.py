@@ -0,0 +1,362 @@
+"""
+Schema validation for People Analytics.
+
+This module compiles the JSON schemas under ``assets/schemas`` once into a tree
+of small check functions, so a document is validated in a single pass that
+reports every violation with its JSON path instead of stopping at the first.
+Whole directories can be validated in bulk with a thread or process pool.
+
+Only the subset of JSON Schema (draft-07) used by the shipped schemas is
+supported: type, required, properties, additionalProperties, items, minItems,
+maxItems, minimum, maximum, enum and local ``#/definitions`` references.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from . import DEFAULT_SCHEMAS_PATH
+from .json_loader import load_json
+
+SUPPORTED_KEYWORDS = {
+    "$schema",
+    "$id",
+    "$ref",
+    "title",
+    "description",
+    "definitions",
+    "type",
+    "required",
+    "properties",
+    "additionalProperties",
+    "items",
+    "minItems",
+    "maxItems",
+    "minimum",
+    "maximum",
+    "enum",
+}
+
+
+def _is_integer(value: Any) -> bool:
+    """Check the JSON integer type (floats with a zero fraction included)."""
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+
+
+def _is_number(value: Any) -> bool:
+    """Check the JSON number type (booleans excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+TYPE_CHECKS = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": lambda value: isinstance(value, bool),
+    "null": lambda value: value is None,
+}
+
+
+class SchemaError(NamedTuple):
+    """A schema violation at a JSON path of the document."""
+
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+# A compiled check: (value, path, errors) -> None, appending violations
+Check = Callable[[Any, str, List[SchemaError]], None]
+
+
+class SchemaValidator:
+    """JSON schema compiled into check functions."""
+
+    def __init__(self, schema: Dict[str, Any]):
+        """Compile a schema.
+
+        Args:
+            schema: The JSON schema
+
+        Raises:
+            ValueError: If the schema uses an unsupported keyword or reference
+        """
+        self.schema = schema
+        self._definitions = {}
+        self._check = self._compile(schema)
+
+    def iter_errors(self, data: Any) -> Iterator[SchemaError]:
+        """Iterate over every violation of the document."""
+        errors = []
+        self._check(data, "$", errors)
+        return iter(errors)
+
+    def validate(self, data: Any) -> List[SchemaError]:
+        """Return every violation of the document, in document order."""
+        return list(self.iter_errors(data))
+
+    def is_valid(self, data: Any) -> bool:
+        """Check whether the document has no violations."""
+        return not self.validate(data)
+
+    def _compile(self, schema: Dict[str, Any]) -> Check:
+        """Compile a (sub)schema into a single check function."""
+        unsupported = set(schema) - SUPPORTED_KEYWORDS
+        if unsupported:
+            raise ValueError(f"Unsupported schema keywords: {sorted(unsupported)}")
+
+        if "$ref" in schema:
+            return self._compile_ref(schema["$ref"])
+
+        checks = []
+
+        if "type" in schema:
+            types = schema["type"]
+            types = [types] if isinstance(types, str) else list(types)
+            type_checks = [TYPE_CHECKS[name] for name in types]
+            expected = " or ".join(types)
+
+            def check_type(value, path, errors):
+                if not any(check(value) for check in type_checks):
+                    errors.append(
+                        SchemaError(
+                            path, f"expected {expected}, got {_type_name(value)}"
+                        )
+                    )
+                    return False
+                return True
+
+        else:
+
+            def check_type(value, path, errors):
+                return True
+
+        if "enum" in schema:
+            allowed = list(schema["enum"])
+
+            def check_enum(value, path, errors):
+                if value not in allowed:
+                    errors.append(
+                        SchemaError(path, f"{value!r} is not one of {allowed}")
+                    )
+
+            checks.append(check_enum)
+
+        if "minimum" in schema or "maximum" in schema:
+            minimum = schema.get("minimum")
+            maximum = schema.get("maximum")
+
+            def check_range(value, path, errors):
+                if not _is_number(value):
+                    return
+                if minimum is not None and value < minimum:
+                    errors.append(SchemaError(path, f"{value} is less than {minimum}"))
+                if maximum is not None and value > maximum:
+                    errors.append(SchemaError(path, f"{value} is more than {maximum}"))
+
+            checks.append(check_range)
+
+        object_check = self._compile_object(schema)
+        if object_check is not None:
+            checks.append(object_check)
+
+        array_check = self._compile_array(schema)
+        if array_check is not None:
+            checks.append(array_check)
+
+        def check(value, path, errors):
+            # Nested checks only run on values of the expected type
+            if check_type(value, path, errors):
+                for nested in checks:
+                    nested(value, path, errors)
+
+        return check
+
+    def _compile_ref(self, ref: str) -> Check:
+        """Compile a local ``#/definitions/<name>`` reference."""
+        prefix = "#/definitions/"
+        name = ref[len(prefix) :] if ref.startswith(prefix) else None
+        definitions = self.schema.get("definitions", {})
+        if name not in definitions:
+            raise ValueError(f"Unsupported schema reference: {ref}")
+
+        if name not in self._definitions:
+            # Placeholder first, so recursive definitions resolve lazily
+            self._definitions[name] = None
+            self._definitions[name] = self._compile(definitions[name])
+
+        def check(value, path, errors):
+            self._definitions[name](value, path, errors)
+
+        return check
+
+    def _compile_object(self, schema: Dict[str, Any]) -> Optional[Check]:
+        """Compile the object keywords of a schema."""
+        required = list(schema.get("required", []))
+        properties = {
+            name: self._compile(subschema)
+            for name, subschema in schema.get("properties", {}).items()
+        }
+        additional = schema.get("additionalProperties", True)
+        if additional is True:
+            additional_check = None
+        elif additional is False:
+
+            def additional_check(value, path, errors):
+                errors.append(SchemaError(path, "additional property not allowed"))
+
+        else:
+            additional_check = self._compile(additional)
+
+        if not (required or properties or additional_check):
+            return None
+
+        def check(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for name in required:
+                if name not in value:
+                    errors.append(
+                        SchemaError(path, f"missing required property '{name}'")
+                    )
+            for name, item in value.items():
+                property_check = properties.get(name, additional_check)
+                if property_check is not None:
+                    property_check(item, f"{path}.{name}", errors)
+
+        return check
+
+    def _compile_array(self, schema: Dict[str, Any]) -> Optional[Check]:
+        """Compile the array keywords of a schema."""
+        items = self._compile(schema["items"]) if "items" in schema else None
+        min_items = schema.get("minItems")
+        max_items = schema.get("maxItems")
+
+        if items is None and min_items is None and max_items is None:
+            return None
+
+        def check(value, path, errors):
+            if not isinstance(value, list):
+                return
+            if min_items is not None and len(value) < min_items:
+                errors.append(
+                    SchemaError(
+                        path, f"expected at least {min_items} items, got {len(value)}"
+                    )
+                )
+            if max_items is not None and len(value) > max_items:
+                errors.append(
+                    SchemaError(
+                        path, f"expected at most {max_items} items, got {len(value)}"
+                    )
+                )
+            if items is not None:
+                for index, item in enumerate(value):
+                    items(item, f"{path}[{index}]", errors)
+
+        return check
+
+
+def _type_name(value: Any) -> str:
+    """Return the JSON type name of a decoded value."""
+    for name in ("null", "boolean", "integer", "number", "string", "array", "object"):
+        if TYPE_CHECKS[name](value):
+            return name
+    return type(value).__name__
+
+
+def load_schema(name: str, schemas_path: Union[str, Path] = None) -> Dict[str, Any]:
+    """Load ``<name>.schema.json`` from the schemas directory."""
+    schemas_path = Path(schemas_path or DEFAULT_SCHEMAS_PATH)
+    return load_json(schemas_path / f"{name}.schema.json")
+
+
+@lru_cache(maxsize=None)
+def get_validator(name: str = "resultado") -> SchemaValidator:
+    """Return the compiled validator of a shipped schema, compiling it once."""
+    return SchemaValidator(load_schema(name))
+
+
+def validate_file(
+    file_path: Union[str, Path], schema: str = "resultado"
+) -> List[SchemaError]:
+    """Validate a JSON file against a shipped schema.
+
+    Args:
+        file_path: Path to the JSON file
+        schema: Name of the schema under assets/schemas
+
+    Returns:
+        List of violations; a file that cannot be read or decoded yields a
+        single violation at ``$``
+    """
+    try:
+        data = load_json(file_path)
+    except Exception as e:
+        return [SchemaError("$", f"cannot load file: {e}")]
+    return get_validator(schema).validate(data)
+
+
+def validate_files(
+    file_paths: List[Union[str, Path]],
+    schema: str = "resultado",
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> Dict[str, List[SchemaError]]:
+    """Validate many JSON files in parallel.
+
+    Args:
+        file_paths: Paths of the JSON files
+        schema: Name of the schema under assets/schemas
+        workers: Number of workers (defaults to the executor's default)
+        executor: "thread" or "process"; processes avoid the GIL for large
+            batches, each worker compiling the schema once
+
+    Returns:
+        Dict mapping every file path to its violations
+    """
+    paths = [str(path) for path in file_paths]
+    if not paths:
+        return {}
+
+    # Compile in the parent first, so schema errors surface immediately
+    get_validator(schema)
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        chunksize = max(1, len(paths) // ((workers or os.cpu_count() or 1) * 4))
+        results = pool.map(
+            validate_file, paths, [schema] * len(paths), chunksize=chunksize
+        )
+        return dict(zip(paths, results))
+
+
+def validate_directory(
+    directory: Union[str, Path],
+    schema: str = "resultado",
+    pattern: str = "**/resultado.json",
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> Dict[str, List[SchemaError]]:
+    """Validate every matching file of a directory in parallel.
+
+    Args:
+        directory: Directory to search
+        schema: Name of the schema under assets/schemas
+        pattern: Glob pattern of the files to validate
+        workers: Number of workers
+        executor: "thread" or "process"
+
+    Returns:
+        Dict mapping the path of each invalid file to its violations
+    """
+    files = sorted(Path(directory).glob(pattern))
+    results = validate_files(files, schema, workers=workers, executor=executor)
+    return {path: errors for path, errors in results.items() if errors}
@@ -0,0 +1,223 @@
+"""
+Scoring engine for People Analytics.
+
+Frequency vectors (n/a, referência, sempre, quase sempre, poucas vezes,
+raramente) are scored with several models across the package: the NPS-like
+and traditional scores of constants.calculate_score, the 0-5 global score of
+the JSON processor, the 0-100 normalized score of the statistical analyzer
+and the index-weighted mean of the evaluation store. This module defines every
+model over (N, 6) matrices, computes them together in one vectorized pass and
+caches the results, per corpus and per vector, so every call site reads the
+same numbers.
+
+Each model performs the same operations in the same order as the scorer it
+replaces, so results are identical to the previous per-vector code.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .constants import calculate_scores, row_sums, stack_frequencies
+from .data_pipeline import FREQ_COLABORADOR_COLUMNS, FREQ_GRUPO_COLUMNS
+
+# Weights of the 0-5 global score (N/A, Referência, Acima, Dentro, Abaixo, Muito abaixo)
+GLOBAL_SCORE_WEIGHTS = [0, 5, 4, 3, 2, 1]
+
+# Weights of the 0-100 normalized score
+NORMALIZED_SCORE_WEIGHTS = [0, 100, 85, 70, 40, 10]
+
+# Vectors kept in the per-vector cache of the default engine
+DEFAULT_VECTOR_CACHE_SIZE = 65536
+
+
+def _global_score(frequencies: np.ndarray) -> np.ndarray:
+    """Share-weighted 0-5 score; 0 without ratings."""
+    total = row_sums(frequencies)
+    rated = total > 0
+    safe_total = np.where(rated, total, 1.0)
+    score = (frequencies[:, 0] / safe_total) * GLOBAL_SCORE_WEIGHTS[0]
+    for i in range(1, 6):
+        score = score + (frequencies[:, i] / safe_total) * GLOBAL_SCORE_WEIGHTS[i]
+    return np.where(rated, score, 0.0)
+
+
+def _normalized_score(frequencies: np.ndarray) -> np.ndarray:
+    """Percentage-weighted 0-100 score; 0 without ratings."""
+    total = row_sums(frequencies)
+    rated = total > 0
+    safe_total = np.where(rated, total, 1.0)
+    score = (frequencies[:, 0] / safe_total * 100) * NORMALIZED_SCORE_WEIGHTS[0]
+    for i in range(1, 6):
+        score = score + (frequencies[:, i] / safe_total * 100) * (
+            NORMALIZED_SCORE_WEIGHTS[i]
+        )
+    return np.where(rated, score / 100, 0.0)
+
+
+def _index_mean(frequencies: np.ndarray) -> np.ndarray:
+    """Mean of the bucket indexes, as computed by the evaluation store."""
+    numerator = frequencies[:, 0] * 0
+    for i in range(1, 6):
+        numerator = numerator + frequencies[:, i] * i
+    # Like the store, an empty vector gives NaN
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return numerator / row_sums(frequencies)
+
+
+# Scoring models, each mapping an (N, 6) float matrix to N scores
+SCORE_MODELS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    # constants.calculate_score(use_nps_model=True)
+    "nps": lambda frequencies: calculate_scores(frequencies, "nps"),
+    # constants.calculate_score(use_nps_model=True, normalize=True)
+    "nps_normalized": lambda frequencies: calculate_scores(
+        frequencies, "nps", normalize=True
+    ),
+    # constants.calculate_score(use_nps_model=False)
+    "traditional": lambda frequencies: calculate_scores(frequencies, "traditional"),
+    # JsonProcessor.calculate_global_scores
+    "global": _global_score,
+    # StatisticalAnalyzer.calculate_normalized_score
+    "normalized": _normalized_score,
+    # frequencia_colaborador / frequencia_grupo of the evaluation store
+    "index_mean": _index_mean,
+}
+
+
+class ScoringEngine:
+    """Computes every scoring model in one pass and caches the results."""
+
+    def __init__(self, vector_cache_size: int = DEFAULT_VECTOR_CACHE_SIZE):
+        """Initialize the engine.
+
+        Args:
+            vector_cache_size: Number of vectors whose scores are kept by score()
+        """
+        self.vector_cache_size = vector_cache_size
+        self._vectors: "OrderedDict[tuple, Dict[str, float]]" = OrderedDict()
+        self._corpora = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def score_matrix(
+        self, frequencies: np.ndarray, models: Optional[Iterable[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Score an (N, 6) frequency matrix with several models at once.
+
+        Args:
+            frequencies: One frequency vector per row
+            models: Names from SCORE_MODELS (all of them by default)
+
+        Returns:
+            dict: Model name to the array of N scores
+
+        Raises:
+            ValueError: If the matrix is not (N, 6) or a model is unknown
+        """
+        frequencies = np.asarray(frequencies, dtype=np.float64)
+        if frequencies.ndim != 2 or frequencies.shape[1] != 6:
+            raise ValueError(
+                f"Frequency matrix must have shape (N, 6), got {frequencies.shape}"
+            )
+
+        names = list(SCORE_MODELS) if models is None else list(models)
+        unknown = [name for name in names if name not in SCORE_MODELS]
+        if unknown:
+            raise ValueError(f"Unknown scoring models: {', '.join(unknown)}")
+        return {name: SCORE_MODELS[name](frequencies) for name in names}
+
+    def score(self, frequencies: Any, model: str) -> float:
+        """Score a single frequency vector.
+
+        The first lookup of a vector computes all the models for it, so other
+        call sites scoring the same vector read the cached values.
+
+        Args:
+            frequencies: Six numeric frequencies
+            model: Name from SCORE_MODELS
+
+        Returns:
+            The score of the vector under the model
+
+        Raises:
+            ValueError: If the vector is not six numbers or the model is unknown
+        """
+        if model not in SCORE_MODELS:
+            raise ValueError(f"Unknown scoring model: {model}")
+        matrix, valid = stack_frequencies([frequencies])
+        if not valid[0]:
+            raise ValueError(
+                f"Frequency vector must hold 6 numeric values, got {frequencies!r}"
+            )
+
+        key = tuple(matrix[0].tolist())
+        with self._lock:
+            scores = self._vectors.get(key)
+            if scores is not None:
+                self._vectors.move_to_end(key)
+                return scores[model]
+
+        scores = {
+            name: float(values[0]) for name, values in self.score_matrix(matrix).items()
+        }
+        with self._lock:
+            self._vectors[key] = scores
+            while len(self._vectors) > self.vector_cache_size:
+                self._vectors.popitem(last=False)
+        return scores[model]
+
+    def corpus_scores(self, corpus) -> pd.DataFrame:
+        """Return the scores of every evaluation row of a corpus.
+
+        All models are computed for the colaborador and grupo vectors in one
+        pass and cached until the corpus is reloaded (its version changes).
+
+        Args:
+            corpus: EvaluationCorpus whose frame holds the raw frequency columns
+
+        Returns:
+            DataFrame aligned with corpus.frame, with a "<model>_colaborador"
+            and a "<model>_grupo" column per model
+        """
+        frame = corpus.frame
+        with self._lock:
+            cached = self._corpora.get(corpus)
+        if cached is not None and cached[0] == corpus.version:
+            return cached[1]
+
+        columns = {}
+        for suffix, frequency_columns in (
+            ("colaborador", FREQ_COLABORADOR_COLUMNS),
+            ("grupo", FREQ_GRUPO_COLUMNS),
+        ):
+            matrix = frame[frequency_columns].to_numpy(dtype=np.float64)
+            for name, values in self.score_matrix(matrix).items():
+                columns[f"{name}_{suffix}"] = values
+        scores = pd.DataFrame(columns, index=frame.index)
+
+        with self._lock:
+            self._corpora[corpus] = (corpus.version, scores)
+        return scores
+
+    def clear(self) -> None:
+        """Drop every cached score."""
+        with self._lock:
+            self._vectors.clear()
+            self._corpora = weakref.WeakKeyDictionary()
+
+
+_engine: Optional[ScoringEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_scoring_engine() -> ScoringEngine:
+    """Return the process-wide scoring engine."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = ScoringEngine()
+    return _engine
@@ -0,0 +1,133 @@
+"""
+Org-wide significance tests for People Analytics.
+
+Reports test whether a collaborator's rating distribution of a behavior
+differs from their group's (Welch t-test). Run one report at a time, the tests
+are uncorrected, so with dozens of behaviors per person some gaps come out
+"significant" by chance. This module tests every (pessoa, ano, behavior) of a
+corpus against its group in one vectorized call, corrects the p-values across
+the whole organization with Benjamini-Hochberg and caches the results until
+the corpus is reloaded, so every report reads the same decisions.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .data_pipeline import FREQ_COLABORADOR_COLUMNS, FREQ_GRUPO_COLUMNS
+from .domain.statistical_analyzer import StatisticalAnalyzer
+
+# Avaliador whose rows hold the consolidated rating of a behavior
+CONSOLIDATED_AVALIADOR = "todos"
+
+# Columns of the tests of a corpus, besides the labels of each row
+TEST_COLUMNS = [
+    "t_statistic",
+    "p_value",
+    "p_value_adjusted",
+    "significance",
+    "is_significant",
+]
+
+
+class SignificanceTester:
+    """Tests every behavior of a corpus against its group, once per corpus version."""
+
+    def __init__(self, avaliador: str = CONSOLIDATED_AVALIADOR):
+        """Initialize the tester.
+
+        Args:
+            avaliador: Avaliador of the rows to test
+        """
+        self.avaliador = avaliador
+        self.stat_analyzer = StatisticalAnalyzer()
+        self._corpora = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def _results(self, corpus) -> Tuple[pd.DataFrame, Dict[Tuple[str, str], Dict]]:
+        """Return the cached tests of a corpus, running them if it changed."""
+        frame = corpus.frame
+        with self._lock:
+            cached = self._corpora.get(corpus)
+        if cached is not None and cached[0] == corpus.version:
+            return cached[1], cached[2]
+
+        rows = frame[frame["avaliador"] == self.avaliador]
+        results = self.stat_analyzer.run_significance_test_batch(
+            rows[FREQ_COLABORADOR_COLUMNS].to_numpy(dtype="float64"),
+            rows[FREQ_GRUPO_COLUMNS].to_numpy(dtype="float64"),
+            correct=True,
+        )
+        tests = pd.DataFrame(
+            {
+                "pessoa": rows["pessoa"].to_numpy(dtype=object),
+                "ano": rows["ano"].to_numpy(dtype=object),
+                "direcionador": rows["direcionador"].to_numpy(dtype=object),
+                "comportamento": rows["comportamento"].to_numpy(dtype=object),
+                **{column: results[column] for column in TEST_COLUMNS},
+            },
+            index=rows.index,
+        )
+
+        # Results by evaluation, keyed like the behaviors of a report
+        by_evaluation: Dict[Tuple[str, str], Dict[str, Dict[str, Any]]] = {}
+        for pessoa, ano, comportamento, *values in zip(
+            tests["pessoa"].tolist(),
+            tests["ano"].tolist(),
+            tests["comportamento"].tolist(),
+            *(tests[column].tolist() for column in TEST_COLUMNS),
+        ):
+            behaviors = by_evaluation.setdefault((str(pessoa), str(ano)), {})
+            behaviors[comportamento] = dict(zip(TEST_COLUMNS, values))
+
+        with self._lock:
+            self._corpora[corpus] = (corpus.version, tests, by_evaluation)
+        return tests, by_evaluation
+
+    def corpus_tests(self, corpus) -> pd.DataFrame:
+        """Return the tests of every consolidated behavior row of a corpus.
+
+        Args:
+            corpus: EvaluationCorpus whose frame holds the raw frequency columns
+
+        Returns:
+            DataFrame indexed like the tested rows of corpus.frame, with the
+            labels of each row and the TEST_COLUMNS; significance follows the
+            p-values adjusted across the whole corpus
+        """
+        return self._results(corpus)[0]
+
+    def person_tests(self, corpus, pessoa: str, ano: str) -> Dict[str, Dict[str, Any]]:
+        """Return the tests of the behaviors of one evaluation.
+
+        Args:
+            corpus: EvaluationCorpus to test
+            pessoa: Person name
+            ano: Year
+
+        Returns:
+            Dictionary mapping behavior names to their test results (empty if
+            the corpus has no such evaluation)
+        """
+        return self._results(corpus)[1].get((str(pessoa), str(ano)), {})
+
+    def clear(self) -> None:
+        """Drop every cached test."""
+        with self._lock:
+            self._corpora = weakref.WeakKeyDictionary()
+
+
+_tester: Optional[SignificanceTester] = None
+_tester_lock = threading.Lock()
+
+
+def get_significance_tester() -> SignificanceTester:
+    """Return the process-wide significance tester."""
+    global _tester
+    if _tester is None:
+        with _tester_lock:
+            if _tester is None:
+                _tester = SignificanceTester()
+    return _tester
@@ -0,0 +1,160 @@
+"""
+Sync discovery for People Analytics.
+
+This module walks the ``<pessoa>/<ano>/`` data tree once with os.scandir and
+returns an immutable work list describing every directory to sync, with the
+paths, sizes and mtimes of its files, so later stages never need to glob or
+stat the tree again.
+"""
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+# Result files picked up when no include patterns are given
+DEFAULT_INCLUDE_PATTERNS = ("resultado.*",)
+
+# Profile file read alongside the result files of each directory
+PROFILE_FILE_NAME = "perfil.json"
+
+
+class SyncFile(NamedTuple):
+    """A file found during discovery, with the metadata seen at that time."""
+
+    path: Path
+    size: int
+    mtime: float
+
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> "SyncFile":
+        """Stat a file and return its SyncFile."""
+        path = Path(path)
+        stat = path.stat()
+        return cls(path, stat.st_size, stat.st_mtime)
+
+
+class WorkItem(NamedTuple):
+    """A pessoa/ano directory to sync."""
+
+    pessoa: str
+    ano: str
+    path: str
+    files: Tuple[SyncFile, ...]
+    profile: Optional[SyncFile] = None
+
+    @property
+    def result_paths(self) -> List[Path]:
+        """Paths of the result files of the directory."""
+        return [entry.path for entry in self.files]
+
+    @property
+    def tracked_files(self) -> Dict[str, SyncFile]:
+        """Result and profile files of the directory, keyed by file name."""
+        tracked = {entry.path.name: entry for entry in self.files}
+        if self.profile is not None:
+            tracked[PROFILE_FILE_NAME] = self.profile
+        return tracked
+
+
+def matches_any(relative_path: str, patterns: Iterable[str]) -> bool:
+    """Check a path against glob patterns.
+
+    Patterns containing a slash are matched against the path relative to the
+    data directory (``pessoa/ano/file``); other patterns against the file name.
+
+    Args:
+        relative_path: Path relative to the data directory, using slashes
+        patterns: Glob patterns
+
+    Returns:
+        bool: True if any pattern matches
+    """
+    name = relative_path.rsplit("/", 1)[-1]
+    for pattern in patterns:
+        target = relative_path if "/" in pattern else name
+        if fnmatchcase(target, pattern):
+            return True
+    return False
+
+
+def discover_work_items(
+    data_dir: Union[str, Path],
+    pessoa: Optional[str] = None,
+    ano: Optional[str] = None,
+    include: Iterable[str] = DEFAULT_INCLUDE_PATTERNS,
+    exclude: Iterable[str] = (),
+) -> Tuple[WorkItem, ...]:
+    """Walk the data directory once and build the sync work list.
+
+    Args:
+        data_dir: Directory with the pessoa/ano structure
+        pessoa: Only include this pessoa
+        ano: Only include this ano
+        include: Glob patterns selecting the result files
+        exclude: Glob patterns of files to leave out
+
+    Returns:
+        Tuple of WorkItem sorted by pessoa and ano; directories without any
+        selected file are left out
+    """
+    data_dir = Path(data_dir)
+    include = tuple(include)
+    exclude = tuple(exclude)
+    items = []
+
+    with os.scandir(data_dir) as pessoa_entries:
+        pessoa_dirs = sorted(
+            (entry for entry in pessoa_entries if entry.is_dir()),
+            key=lambda entry: entry.name,
+        )
+
+    for pessoa_entry in pessoa_dirs:
+        if pessoa and pessoa_entry.name != pessoa:
+            continue
+
+        with os.scandir(pessoa_entry.path) as ano_entries:
+            ano_dirs = sorted(
+                (entry for entry in ano_entries if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
+
+        for ano_entry in ano_dirs:
+            if ano and ano_entry.name != ano:
+                continue
+
+            files = []
+            profile = None
+            with os.scandir(ano_entry.path) as file_entries:
+                for entry in file_entries:
+                    if not entry.is_file():
+                        continue
+
+                    relative_path = f"{pessoa_entry.name}/{ano_entry.name}/{entry.name}"
+                    is_profile = entry.name == PROFILE_FILE_NAME
+                    is_result = matches_any(relative_path, include) and not matches_any(
+                        relative_path, exclude
+                    )
+                    if not (is_profile or is_result):
+                        continue
+
+                    stat = entry.stat()
+                    sync_file = SyncFile(Path(entry.path), stat.st_size, stat.st_mtime)
+                    if is_profile:
+                        profile = sync_file
+                    if is_result:
+                        files.append(sync_file)
+
+            if files:
+                files.sort(key=lambda entry: entry.path.name)
+                items.append(
+                    WorkItem(
+                        pessoa=pessoa_entry.name,
+                        ano=ano_entry.name,
+                        path=ano_entry.path,
+                        files=tuple(files),
+                        profile=profile,
+                    )
+                )
+
+    return tuple(items)
@@ -0,0 +1,116 @@
+"""
+Asynchronous file loading for People Analytics sync.
+
+On high-latency storage (NFS, network shares) a sync spends most of its time
+waiting on small file reads. The AsyncDirectoryLoader overlaps those reads
+with asyncio: the files of many pessoa/ano directories are read at once, with
+at most ``io_concurrency`` reads in flight and at most ``io_concurrency``
+directories buffered, while the decoding of the directories already read
+runs in a separate worker pool.
+
+Reads use a dedicated thread pool (file I/O has no portable non-blocking
+API); asyncio only schedules them and hands the raw bytes to the decoder.
+"""
+
+import asyncio
+import concurrent.futures
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from .json_loader import read_bytes
+from .sync_discovery import WorkItem
+
+# Default number of file reads in flight
+DEFAULT_IO_CONCURRENCY = 32
+
+# Decodes a directory: (pessoa, ano, result files, contents by path) -> data
+DecodeDirectory = Callable[[str, str, list, Dict[Path, bytes]], Any]
+
+# Receives each loaded directory: (work item, data, error) -> keep going
+ResultHandler = Callable[[WorkItem, Any, Optional[BaseException]], bool]
+
+
+class AsyncDirectoryLoader:
+    """Read directories concurrently and decode them in a worker pool."""
+
+    def __init__(
+        self,
+        decode: DecodeDirectory,
+        io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+        decode_executor: Optional[concurrent.futures.Executor] = None,
+        read: Callable[[Path], bytes] = read_bytes,
+    ):
+        """Initialize the loader.
+
+        Args:
+            decode: Decodes and combines the contents of a directory; runs in
+                decode_executor, so it must be picklable for process pools
+            io_concurrency: Maximum file reads and buffered directories
+            decode_executor: Pool running decode (the loop's default
+                executor when None)
+            read: Reads a whole file as bytes
+        """
+        self.decode = decode
+        self.io_concurrency = max(1, io_concurrency)
+        self.decode_executor = decode_executor
+        self.read = read
+
+    def run(self, items: Sequence[WorkItem], on_result: ResultHandler) -> bool:
+        """Load the directories, calling on_result as each one is decoded.
+
+        on_result runs in the calling thread, one directory at a time, so it
+        may update shared state without locks. When it returns False the
+        remaining directories are cancelled.
+
+        Args:
+            items: Work items to load
+            on_result: Called with (work item, decoded data, error); error is
+                the exception raised while reading or decoding, if any
+
+        Returns:
+            bool: False if on_result stopped the run
+        """
+        if not items:
+            return True
+        return asyncio.run(self._run(items, on_result))
+
+    async def _run(self, items: Sequence[WorkItem], on_result: ResultHandler) -> bool:
+        """Read, decode and report every directory within one event loop."""
+        loop = asyncio.get_running_loop()
+        directories = asyncio.Semaphore(self.io_concurrency)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.io_concurrency, thread_name_prefix="sync-io"
+        ) as io_executor:
+
+            async def load(item):
+                async with directories:
+                    paths = item.result_paths
+                    try:
+                        contents = await asyncio.gather(
+                            *(
+                                loop.run_in_executor(io_executor, self.read, path)
+                                for path in paths
+                            )
+                        )
+                        data = await loop.run_in_executor(
+                            self.decode_executor,
+                            self.decode,
+                            item.pessoa,
+                            item.ano,
+                            paths,
+                            dict(zip(paths, contents)),
+                        )
+                    except Exception as e:
+                        return item, None, e
+                    return item, data, None
+
+            tasks = [asyncio.ensure_future(load(item)) for item in items]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    if not on_result(*await next_done):
+                        return False
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+        return True
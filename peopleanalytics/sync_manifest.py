@@ -0,0 +1,250 @@
+"""
+Sync manifest for People Analytics.
+
+This module keeps a persisted record of the input files seen by each
+pessoa/ano directory (path, size, mtime and content hash) so that a sync run
+only reprocesses directories whose inputs changed. The combined output of each
+processed directory is cached next to the manifest, allowing aggregate stages
+to reuse it without reparsing the raw files.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from .sync_discovery import PROFILE_FILE_NAME, SyncFile
+
+MANIFEST_VERSION = 1
+
+
+class SyncManifest:
+    """Persisted fingerprints and cached outputs of synced directories."""
+
+    def __init__(self, manifest_dir: Union[str, Path]):
+        """Initialize the manifest.
+
+        Args:
+            manifest_dir: Directory holding manifest.json and cached outputs
+        """
+        self.manifest_dir = Path(manifest_dir)
+        self.manifest_file = self.manifest_dir / "manifest.json"
+        self.outputs_dir = self.manifest_dir / "outputs"
+        self.logger = logging.getLogger(__name__)
+        self.directories: Dict[str, Dict[str, Any]] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load the manifest from disk, starting empty if it is missing or stale."""
+        self.directories = {}
+        if not self.manifest_file.exists():
+            return
+
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Ignoring unreadable sync manifest: {e}")
+            return
+
+        if manifest.get("version") != MANIFEST_VERSION:
+            self.logger.info("Sync manifest version changed, rebuilding")
+            return
+
+        self.directories = manifest.get("directories", {})
+
+    def save(self) -> None:
+        """Write the manifest to disk atomically."""
+        self.manifest_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.manifest_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": MANIFEST_VERSION, "directories": self.directories},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(tmp_file, self.manifest_file)
+
+    @staticmethod
+    def directory_key(pessoa: str, ano: str) -> str:
+        """Return the manifest key for a pessoa/ano directory."""
+        return f"{pessoa}/{ano}"
+
+    @staticmethod
+    def hash_file(file_path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+        """Compute the SHA-256 content hash of a file."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def tracked_files(
+        directory: Union[str, Path], result_files: Iterable[Path]
+    ) -> Dict[str, SyncFile]:
+        """Stat the files tracked for a directory, keyed by file name.
+
+        Only needed when the files do not come from a discovery WorkItem,
+        whose tracked_files already carry this metadata.
+
+        Args:
+            directory: The pessoa/ano directory
+            result_files: The resultado.* files of the directory
+
+        Returns:
+            Dictionary mapping file names to SyncFile entries
+        """
+        files = {Path(path).name: SyncFile.from_path(path) for path in result_files}
+        profile = Path(directory) / PROFILE_FILE_NAME
+        if profile.exists():
+            files[PROFILE_FILE_NAME] = SyncFile.from_path(profile)
+        return files
+
+    def fingerprint(
+        self, files: Dict[str, SyncFile], previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Fingerprint a set of files.
+
+        Files whose size and mtime match the previous fingerprint keep their
+        stored hash, so unchanged files are never read.
+
+        Args:
+            files: Dictionary mapping file names to SyncFile entries
+            previous: Previous fingerprints keyed by file name
+
+        Returns:
+            Dictionary mapping file names to size, mtime and sha256
+        """
+        previous = previous or {}
+        fingerprints = {}
+        for name, entry in files.items():
+            known = previous.get(name)
+            if (
+                known
+                and known.get("size") == entry.size
+                and known.get("mtime") == entry.mtime
+            ):
+                fingerprints[name] = known
+                continue
+
+            fingerprints[name] = {
+                "path": str(entry.path),
+                "size": entry.size,
+                "mtime": entry.mtime,
+                "sha256": self.hash_file(entry.path),
+            }
+        return fingerprints
+
+    def is_unchanged(self, pessoa: str, ano: str, files: Dict[str, SyncFile]) -> bool:
+        """Check whether a directory matches its manifest entry.
+
+        A directory is unchanged when the same files are present with the same
+        content hashes and its cached output is still available.
+
+        Args:
+            pessoa: Name of the pessoa
+            ano: Year
+            files: The tracked files of the directory, keyed by file name
+
+        Returns:
+            bool: True if the directory can be skipped
+        """
+        entry = self.directories.get(self.directory_key(pessoa, ano))
+        if not entry or not self._output_path(pessoa, ano).exists():
+            return False
+
+        stored = entry.get("files", {})
+        if set(files) != set(stored):
+            return False
+
+        current = self.fingerprint(files, stored)
+        if any(current[name]["sha256"] != stored[name].get("sha256") for name in files):
+            return False
+
+        # Refresh size/mtime so touched-but-identical files stay cheap to check
+        entry["files"] = current
+        return True
+
+    def record(
+        self,
+        pessoa: str,
+        ano: str,
+        directory: Union[str, Path],
+        files: Dict[str, SyncFile],
+        output: Any,
+        summary: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record the fingerprints and cached output of a processed directory.
+
+        Args:
+            pessoa: Name of the pessoa
+            ano: Year
+            directory: The pessoa/ano directory
+            files: The tracked files of the directory, keyed by file name
+            output: The combined data produced for the directory
+            summary: Compact JSON-serializable summary of the output, kept
+                in the manifest itself
+        """
+        key = self.directory_key(pessoa, ano)
+        previous = self.directories.get(key, {}).get("files")
+
+        output_path = self._output_path(pessoa, ano)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.directories[key] = {
+            "path": str(directory),
+            "files": self.fingerprint(files, previous),
+        }
+        if summary is not None:
+            self.directories[key]["summary"] = summary
+
+    def load_output(self, pessoa: str, ano: str) -> Any:
+        """Load the cached combined output of a directory.
+
+        Returns:
+            The cached data, or None if it is not available
+        """
+        output_path = self._output_path(pessoa, ano)
+        try:
+            with open(output_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not load cached output {output_path}: {e}")
+            return None
+
+    def load_summary(self, pessoa: str, ano: str) -> Optional[Dict[str, Any]]:
+        """Return the recorded summary of a directory, or None if there is none."""
+        return self.directories.get(self.directory_key(pessoa, ano), {}).get("summary")
+
+    def forget_missing(self, present_keys: Iterable[str]) -> int:
+        """Drop entries for directories that no longer exist.
+
+        Args:
+            present_keys: Manifest keys of the directories found in this run
+
+        Returns:
+            Number of entries removed
+        """
+        present = set(present_keys)
+        removed = 0
+        for key in list(self.directories):
+            if key in present:
+                continue
+            pessoa, _, ano = key.partition("/")
+            output_path = self._output_path(pessoa, ano)
+            if output_path.exists():
+                output_path.unlink()
+            del self.directories[key]
+            removed += 1
+        return removed
+
+    def _output_path(self, pessoa: str, ano: str) -> Path:
+        """Return the cached output path for a pessoa/ano directory."""
+        return self.outputs_dir / pessoa / f"{ano}.pkl"
@@ -0,0 +1,163 @@
+"""
+Sharded sync for People Analytics.
+
+A large sync can be spread over several machines sharing the output
+directory: ``sync --shard i/N`` processes only the pessoa directories whose
+stable hash falls into shard i and writes a shard artifact, then
+``sync --merge`` combines the N artifacts and runs the cross-person
+analytics once.
+
+Shards are 1-based (``1/4`` to ``4/4``). The hash of a pessoa is SHA-256 based,
+so the assignment is the same on every machine and Python process.
+"""
+
+import hashlib
+import os
+import pickle
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+
+SHARD_ARTIFACT_VERSION = 1
+
+_SHARD_PATTERN = re.compile(r"^\s*(\d+)\s*/\s*(\d+)\s*$")
+_ARTIFACT_PATTERN = re.compile(r"^shard-(\d+)-of-(\d+)\.pkl$")
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """Parse an ``i/N`` shard specification.
+
+    Args:
+        spec: The specification, e.g. "2/4"
+
+    Returns:
+        tuple: (shard index, shard count)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    match = _SHARD_PATTERN.match(spec or "")
+    if not match:
+        raise ValueError(f"Invalid shard '{spec}', expected i/N (e.g. 1/4)")
+    index, count = int(match.group(1)), int(match.group(2))
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"Invalid shard '{spec}', i must be between 1 and N")
+    return index, count
+
+
+def shard_of(pessoa: str, count: int) -> int:
+    """Return the 1-based shard a pessoa belongs to."""
+    digest = hashlib.sha256(pessoa.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def artifact_path(shards_dir: Union[str, Path], index: int, count: int) -> Path:
+    """Return the artifact path of a shard."""
+    return Path(shards_dir) / f"shard-{index}-of-{count}.pkl"
+
+
+def write_artifact(
+    shards_dir: Union[str, Path],
+    index: int,
+    count: int,
+    processed_data: Dict[str, Dict[str, Any]],
+    processed_directories: List[str],
+    errors: List[str],
+) -> Path:
+    """Write the artifact of a shard atomically.
+
+    Args:
+        shards_dir: Directory holding the shard artifacts
+        index: Shard index
+        count: Shard count
+        processed_data: Outputs of the shard, by pessoa and ano
+        processed_directories: Directories processed by the shard
+        errors: Errors of the shard
+
+    Returns:
+        Path of the written artifact
+    """
+    path = artifact_path(shards_dir, index, count)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".pkl.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(
+            {
+                "version": SHARD_ARTIFACT_VERSION,
+                "shard": index,
+                "count": count,
+                "processed_data": processed_data,
+                "processed_directories": processed_directories,
+                "errors": errors,
+            },
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(tmp_path, path)
+    return path
+
+
+def find_artifact_counts(shards_dir: Union[str, Path]) -> List[int]:
+    """Return the shard counts that have artifacts in a directory."""
+    shards_dir = Path(shards_dir)
+    if not shards_dir.is_dir():
+        return []
+    counts = set()
+    for entry in os.scandir(shards_dir):
+        match = _ARTIFACT_PATTERN.match(entry.name)
+        if match:
+            counts.add(int(match.group(2)))
+    return sorted(counts)
+
+
+def merge_artifacts(shards_dir: Union[str, Path], count: int) -> Dict[str, Any]:
+    """Combine the artifacts of all N shards.
+
+    The merge is deterministic: pessoas are ordered by name and directories
+    and errors follow shard order, whatever order the shards finished in.
+
+    Args:
+        shards_dir: Directory holding the shard artifacts
+        count: Shard count
+
+    Returns:
+        dict: processed_data, processed_directories and errors of all shards
+
+    Raises:
+        FileNotFoundError: If the artifact of any shard is missing
+        ValueError: If an artifact is from another version or shard layout
+    """
+    missing = [
+        f"{index}/{count}"
+        for index in range(1, count + 1)
+        if not artifact_path(shards_dir, index, count).exists()
+    ]
+    if missing:
+        raise FileNotFoundError(f"Missing shard artifacts: {', '.join(missing)}")
+
+    processed_data = {}
+    processed_directories = []
+    errors = []
+    for index in range(1, count + 1):
+        with open(artifact_path(shards_dir, index, count), "rb") as f:
+            artifact = pickle.load(f)
+        if (
+            artifact.get("version") != SHARD_ARTIFACT_VERSION
+            or artifact.get("shard") != index
+            or artifact.get("count") != count
+        ):
+            raise ValueError(f"Shard artifact {index}/{count} is not compatible")
+
+        for pessoa, anos in artifact["processed_data"].items():
+            processed_data.setdefault(pessoa, {}).update(anos)
+        processed_directories.extend(artifact["processed_directories"])
+        errors.extend(artifact["errors"])
+
+    return {
+        "processed_data": {
+            pessoa: dict(sorted(processed_data[pessoa].items()))
+            for pessoa in sorted(processed_data)
+        },
+        "processed_directories": processed_directories,
+        "errors": errors,
+    }
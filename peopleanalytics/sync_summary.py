@@ -0,0 +1,126 @@
+"""
+Compact summaries of synced directories.
+
+When DataSync runs in batches, the combined output of each pessoa/ano
+directory is flushed to disk and replaced in memory by the small summary built
+here, so aggregate stages work over the whole company without holding every
+raw payload at once. Summaries are JSON-serializable and are kept in the sync
+manifest.
+"""
+
+from typing import Any, Dict
+
+import pandas as pd
+
+from .constants import calculate_score, stack_frequencies
+from .scoring_engine import get_scoring_engine
+
+# Output keys whose (scalar) contents aggregate stages read
+SUMMARY_MAPPING_KEYS = ("competencies",)
+
+
+def _is_scalar(value: Any) -> bool:
+    """Check whether a value is a JSON scalar."""
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _summarize_evaluation(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize the data section of a resultado.json document.
+
+    Scores are the mean traditional score of the valid avaliacoes_grupo
+    vectors of each direcionador.
+    """
+    comportamentos = 0
+    avaliacoes = 0
+    # Vectors of each direcionador, scored together in one NumPy pass
+    direcionadores = []
+    vectors = []
+    for direcionador in data.get("direcionadores", []):
+        if not isinstance(direcionador, dict):
+            continue
+        direcionador_vectors = []
+        for comportamento in direcionador.get("comportamentos", []):
+            if not isinstance(comportamento, dict):
+                continue
+            comportamentos += 1
+            for avaliacao in comportamento.get("avaliacoes_grupo", []):
+                avaliacoes += 1
+                try:
+                    vector = avaliacao.get("frequencia_colaborador", [])
+                except AttributeError:
+                    continue
+                direcionador_vectors.append(len(vectors))
+                vectors.append(vector)
+        direcionadores.append((direcionador, direcionador_vectors))
+
+    matrix, valid = stack_frequencies(vectors)
+    batch_scores = (
+        get_scoring_engine().score_matrix(matrix, ["traditional"])["traditional"]
+    ).tolist()
+
+    scores = {}
+    for direcionador, direcionador_vectors in direcionadores:
+        direcionador_scores = []
+        for index in direcionador_vectors:
+            if valid[index]:
+                direcionador_scores.append(batch_scores[index])
+                continue
+            try:
+                direcionador_scores.append(
+                    calculate_score(vectors[index], use_nps_model=False)
+                )
+            except (AttributeError, TypeError, ValueError):
+                continue
+        if direcionador_scores:
+            name = str(direcionador.get("direcionador", "Unknown"))
+            scores[name] = sum(direcionador_scores) / len(direcionador_scores)
+
+    return {
+        "conceito": data.get("conceito_ciclo_filho_descricao"),
+        "peer_group": data.get("nome_peer_group"),
+        "direcionadores": len(data.get("direcionadores", [])),
+        "comportamentos": comportamentos,
+        "avaliacoes": avaliacoes,
+        "scores": scores,
+    }
+
+
+def summarize_output(output: Any) -> Dict[str, Any]:
+    """Build the compact summary of a directory's combined output.
+
+    The summary keeps the scalar top-level values and the scalar entries of
+    SUMMARY_MAPPING_KEYS, so aggregate stages can read it like the full
+    output, plus an ``evaluation`` section with counts and direcionador scores
+    for resultado.json data.
+
+    Args:
+        output: The combined data of a pessoa/ano directory
+
+    Returns:
+        dict: JSON-serializable summary
+    """
+    if isinstance(output, pd.DataFrame):
+        return {"rows": len(output), "columns": [str(c) for c in output.columns]}
+    if isinstance(output, list):
+        return {"rows": len(output)}
+    if not isinstance(output, dict):
+        return {}
+
+    summary = {
+        key: value
+        for key, value in output.items()
+        if isinstance(key, str) and _is_scalar(value)
+    }
+    for key in SUMMARY_MAPPING_KEYS:
+        if isinstance(output.get(key), dict):
+            summary[key] = {
+                str(name): value
+                for name, value in output[key].items()
+                if _is_scalar(value)
+            }
+
+    data = output.get("data")
+    if isinstance(data, dict) and isinstance(data.get("direcionadores"), list):
+        summary["evaluation"] = _summarize_evaluation(data)
+
+    return summary
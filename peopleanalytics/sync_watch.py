@@ -0,0 +1,225 @@
+"""
+Watch mode for People Analytics sync.
+
+A SyncWatcher keeps polling the ``<pessoa>/<ano>/`` data tree with the same
+single os.scandir walk used by discovery and compares the sizes and mtimes of
+the tracked files of every directory. Bursts of writes are debounced: changes
+are only reported once the tree has been quiet for the debounce period, so a
+directory being copied file by file is processed once.
+
+When the optional ``inotify_simple`` package is installed (Linux), the
+watcher sleeps on inotify events instead of the fixed poll interval; polling
+stays the source of truth, inotify only wakes it up early.
+"""
+
+import logging
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from .sync_discovery import WorkItem
+
+try:
+    import inotify_simple
+except ImportError:
+    inotify_simple = None
+
+# Seconds between two polls of the data tree
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Seconds the tree must stay unchanged before changes are reported
+DEFAULT_DEBOUNCE = 1.0
+
+# Snapshot of the data tree: (pessoa, ano) -> (work item, file signature)
+Snapshot = Dict[Tuple[str, str], Tuple[WorkItem, tuple]]
+
+
+def snapshot(items: Sequence[WorkItem]) -> Snapshot:
+    """Index discovered work items by pessoa/ano with their file signature.
+
+    The signature holds the name, size and mtime of every tracked file, so
+    any write, addition or removal of a file changes it.
+
+    Args:
+        items: Work items from discovery
+
+    Returns:
+        Snapshot of the data tree
+    """
+    return {
+        (item.pessoa, item.ano): (
+            item,
+            tuple(
+                (name, entry.size, entry.mtime)
+                for name, entry in sorted(item.tracked_files.items())
+            ),
+        )
+        for item in items
+    }
+
+
+def diff_snapshots(
+    previous: Snapshot, current: Snapshot
+) -> Tuple[List[WorkItem], List[Tuple[str, str]]]:
+    """Compare two snapshots of the data tree.
+
+    Args:
+        previous: Snapshot of the last processed state
+        current: Snapshot of the tree now
+
+    Returns:
+        tuple: (work items of new or modified directories, pessoa/ano keys of
+            removed directories)
+    """
+    changed = [
+        item
+        for key, (item, signature) in current.items()
+        if key not in previous or previous[key][1] != signature
+    ]
+    removed = [key for key in previous if key not in current]
+    return changed, removed
+
+
+class _InotifyWaiter:
+    """Sleep until something changes under the data directory or a timeout."""
+
+    FLAGS = (
+        "CREATE",
+        "DELETE",
+        "MODIFY",
+        "CLOSE_WRITE",
+        "MOVED_FROM",
+        "MOVED_TO",
+        "ATTRIB",
+    )
+
+    def __init__(self, data_dir: Union[str, Path]):
+        self.data_dir = Path(data_dir)
+        self.inotify = inotify_simple.INotify()
+        self.mask = 0
+        for name in self.FLAGS:
+            self.mask |= getattr(inotify_simple.flags, name)
+        self.watches = {}
+
+    def refresh(self, items: Sequence[WorkItem]) -> None:
+        """Watch the data directory and every pessoa and pessoa/ano directory."""
+        paths = {self.data_dir}
+        for item in items:
+            paths.add(Path(item.path))
+            paths.add(Path(item.path).parent)
+        for path in paths - set(self.watches):
+            try:
+                self.watches[path] = self.inotify.add_watch(path, self.mask)
+            except OSError:
+                continue
+        for path in set(self.watches) - paths:
+            try:
+                self.inotify.rm_watch(self.watches.pop(path))
+            except OSError:
+                continue
+
+    def wait(self, timeout: float) -> None:
+        """Block until an event arrives or the timeout expires."""
+        self.inotify.read(timeout=int(timeout * 1000))
+
+    def close(self) -> None:
+        self.inotify.close()
+
+
+class SyncWatcher:
+    """Poll the data tree and report debounced changes."""
+
+    def __init__(
+        self,
+        discover: Callable[[], Sequence[WorkItem]],
+        on_change: Callable[[Sequence[WorkItem], List[WorkItem], List], None],
+        interval: float = DEFAULT_POLL_INTERVAL,
+        debounce: float = DEFAULT_DEBOUNCE,
+        data_dir: Optional[Union[str, Path]] = None,
+        use_inotify: bool = True,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            discover: Callable returning the current work items
+            on_change: Called with (current work items, changed work items,
+                removed pessoa/ano keys) once a burst of changes settles
+            interval: Seconds between polls
+            debounce: Seconds without changes before on_change is called
+            data_dir: Directory to watch with inotify
+            use_inotify: Use inotify when available and data_dir is given
+            logger: Logger for watcher messages
+        """
+        self.discover = discover
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self.logger = logger or logging.getLogger(__name__)
+        self.waiter = None
+        if use_inotify and data_dir is not None and inotify_simple is not None:
+            try:
+                self.waiter = _InotifyWaiter(data_dir)
+            except OSError as e:
+                self.logger.warning(f"inotify unavailable, polling instead: {e}")
+
+    def run(
+        self,
+        baseline: Optional[Sequence[WorkItem]] = None,
+        max_cycles: Optional[int] = None,
+    ) -> None:
+        """Watch the tree until interrupted.
+
+        Args:
+            baseline: Work items of the last processed state (discovered now
+                when omitted)
+            max_cycles: Stop after this many polls (runs forever when None)
+        """
+        items = self.discover() if baseline is None else baseline
+        processed = snapshot(items)
+        seen = processed
+        last_change = None
+        cycles = 0
+
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                cycles += 1
+                timeout = self.interval
+                if last_change is not None:
+                    remaining = self.debounce - (time.monotonic() - last_change)
+                    timeout = max(0.0, min(timeout, remaining))
+                self._wait(items, timeout)
+
+                try:
+                    items = self.discover()
+                except OSError as e:
+                    self.logger.warning(f"Could not scan data directory: {e}")
+                    continue
+
+                current = snapshot(items)
+                if current != seen:
+                    seen = current
+                    last_change = time.monotonic()
+                    continue
+
+                if last_change is None:
+                    continue
+                if time.monotonic() - last_change < self.debounce:
+                    continue
+
+                last_change = None
+                changed, removed = diff_snapshots(processed, current)
+                processed = current
+                if changed or removed:
+                    self.on_change(items, changed, removed)
+        finally:
+            if self.waiter is not None:
+                self.waiter.close()
+
+    def _wait(self, items: Sequence[WorkItem], timeout: float) -> None:
+        """Sleep for the timeout, waking up early on inotify events."""
+        if self.waiter is None:
+            time.sleep(timeout)
+            return
+        self.waiter.refresh(items)
+        self.waiter.wait(timeout)
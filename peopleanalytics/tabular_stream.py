@@ -0,0 +1,214 @@
+"""
+Streaming readers for tabular result files.
+
+CSV and Excel exports can hold hundreds of thousands of rows. The readers in
+this module stream them in bounded chunks (``pandas.read_csv`` with a
+chunksize, openpyxl ``read_only`` worksheets) and shrink every chunk to
+compact column types (downcast numbers, categorical text) before it is kept,
+so neither the whole raw table nor a list of row dicts is ever held in memory.
+"""
+
+import io
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+from pandas.api.types import (
+    infer_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+    union_categoricals,
+)
+
+# Rows read per chunk
+DEFAULT_CHUNK_ROWS = 50_000
+
+# Text columns with at most this ratio of distinct values become categorical
+CATEGORICAL_RATIO = 0.5
+
+# Extensions openpyxl can stream; others (.xls) go through pandas.read_excel
+STREAMABLE_EXCEL_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the columns of a frame to compact types.
+
+    Integers are downcast to the smallest type holding their values and
+    repetitive text columns become categorical. Floats keep float64, so no
+    precision is lost.
+
+    Args:
+        df: Frame to convert
+
+    Returns:
+        pd.DataFrame: The converted frame
+    """
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if is_integer_dtype(series.dtype):
+            df.isetitem(position, pd.to_numeric(series, downcast="integer"))
+        elif (
+            (is_object_dtype(series.dtype) or isinstance(series.dtype, pd.StringDtype))
+            and len(series)
+            and infer_dtype(series, skipna=True) == "string"
+            and series.nunique() <= CATEGORICAL_RATIO * len(series)
+        ):
+            df.isetitem(position, series.astype("category"))
+    return df
+
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate compact chunks column by column.
+
+    Categorical columns are unioned, so they stay categorical even when the
+    chunks saw different categories.
+
+    Args:
+        frames: Chunks, normally with the same columns
+
+    Returns:
+        pd.DataFrame: The concatenated frame
+    """
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    if any(not frame.columns.equals(frames[0].columns) for frame in frames):
+        return compact_frame(pd.concat(frames, ignore_index=True))
+
+    # Columns are matched by position, as CSV chunks may repeat column names
+    columns = []
+    for position in range(frames[0].shape[1]):
+        parts = [frame.iloc[:, position] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            columns.append(pd.Series(union_categoricals(parts, ignore_order=True)))
+        else:
+            columns.append(pd.concat(parts, ignore_index=True))
+
+    frame = pd.concat(columns, axis=1, ignore_index=True)
+    frame.columns = frames[0].columns
+    return compact_frame(frame)
+
+
+def iter_csv_chunks(
+    file_path: Union[str, Path], chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[pd.DataFrame]:
+    """Read a CSV file in compact chunks.
+
+    Args:
+        file_path: Path to the CSV file
+        chunk_rows: Rows per chunk
+
+    Yields:
+        pd.DataFrame: Compact chunks of at most chunk_rows rows
+    """
+    with pd.read_csv(file_path, chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            yield compact_frame(chunk)
+
+
+def read_csv(
+    file_path: Union[str, Path],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    content: Optional[bytes] = None,
+) -> pd.DataFrame:
+    """Read a CSV file into a compact frame, chunk by chunk.
+
+    Args:
+        file_path: Path to the CSV file
+        chunk_rows: Rows per chunk
+        content: Contents of the file, when it was already read
+
+    Returns:
+        pd.DataFrame: The rows of the file
+    """
+    source = file_path if content is None else io.BytesIO(content)
+    return concat_frames(list(iter_csv_chunks(source, chunk_rows)))
+
+
+def _header_names(header: Optional[Sequence]) -> List:
+    """Name header cells the way pandas does (Unnamed: i, deduplicated x.1)."""
+    names = []
+    seen = {}
+    for index, name in enumerate(header or ()):
+        if name is None:
+            name = f"Unnamed: {index}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def iter_excel_chunks(
+    file_path: Union[str, Path], chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> Iterator[Tuple[str, pd.DataFrame]]:
+    """Read the sheets of an Excel workbook in compact chunks.
+
+    Worksheets are read with openpyxl in read-only mode, so rows are parsed
+    lazily from the file. The first row of each sheet is the header; rows
+    without any value are skipped.
+
+    Args:
+        file_path: Path to the .xlsx file
+        chunk_rows: Rows per chunk
+
+    Yields:
+        tuple: (sheet name, compact chunk); sheets without data rows yield one
+            empty chunk with the header columns
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        for worksheet in workbook.worksheets:
+            rows = worksheet.iter_rows(values_only=True)
+            columns = _header_names(next(rows, None))
+
+            buffer = []
+            emitted = False
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                buffer.append(row[: len(columns)])
+                if len(buffer) >= chunk_rows:
+                    yield worksheet.title, compact_frame(
+                        pd.DataFrame.from_records(buffer, columns=columns)
+                    )
+                    buffer = []
+                    emitted = True
+
+            if buffer or not emitted:
+                yield worksheet.title, compact_frame(
+                    pd.DataFrame.from_records(buffer, columns=columns)
+                )
+    finally:
+        workbook.close()
+
+
+def read_excel(
+    file_path: Union[str, Path],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    content: Optional[bytes] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Read every sheet of an Excel workbook into compact frames.
+
+    Args:
+        file_path: Path to the workbook
+        chunk_rows: Rows per chunk
+        content: Contents of the workbook, when it was already read
+
+    Returns:
+        dict: Compact frame of each sheet, keyed by sheet name
+    """
+    source = file_path if content is None else io.BytesIO(content)
+    if Path(file_path).suffix.lower() not in STREAMABLE_EXCEL_EXTENSIONS:
+        sheets = pd.read_excel(source, sheet_name=None)
+        return {name: compact_frame(df) for name, df in sheets.items()}
+
+    chunks = {}
+    for sheet_name, chunk in iter_excel_chunks(source, chunk_rows):
+        chunks.setdefault(sheet_name, []).append(chunk)
+    return {name: concat_frames(frames) for name, frames in chunks.items()}
@@ -6,7 +6,6 @@ de desenvolvimento concretas e monitoráveis.
 """
 import datetime
 from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
 from pathlib import Path
 
 from peopleanalytics.data_pipeline import DataPipeline
@@ -14,9 +13,10 @@ from peopleanalytics.talent_development.feedback_cycle.learning_path import Pers
 from peopleanalytics.talent_development.feedback_cycle.gap_analyzer import FeedbackGapAnalyzer
 from peopleanalytics.talent_development.feedback_cycle.bias_detector import CognitiveBiasDetector
 from peopleanalytics.talent_development.feedback_cycle.progress_tracker import ProgressTracker
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class FeedbackItem:
     """Representa um item individual de feedback."""
     feedback_id: str
@@ -35,7 +35,7 @@ class FeedbackItem:
         return self.feedback_type == 'self'
 
 
-@dataclass
+@slotted_dataclass
 class CompetencyAssessment:
     """Avaliação consolidada de uma competência específica."""
     competency: str
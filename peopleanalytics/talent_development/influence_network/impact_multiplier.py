@@ -9,14 +9,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
 from pathlib import Path
 
 from peopleanalytics.data_pipeline import DataPipeline
 from peopleanalytics.talent_development.influence_network.network_analyzer import InfluenceNetwork
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class TeamOutcome:
     """Resultado obtido por um time ou projeto."""
     outcome_id: str
@@ -17,6 +17,7 @@ import random
 
 from peopleanalytics.data_pipeline import DataPipeline
 from peopleanalytics.talent_development.influence_network.network_analyzer import InfluenceNetwork
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
 @dataclass
@@ -38,7 +39,7 @@ class KnowledgeAsset:
     metadata: Dict[str, Any] = None
 
 
-@dataclass
+@slotted_dataclass
 class KnowledgeTransfer:
     """Representa uma transferência de conhecimento entre duas pessoas."""
     transfer_id: str
@@ -11,14 +11,14 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd
 from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
 from pathlib import Path
 import community  # python-louvain
 
 from peopleanalytics.data_pipeline import DataPipeline
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class InfluenceRelation:
     """Relação de influência entre duas pessoas."""
     source_id: str  # ID da pessoa de origem
@@ -11,15 +11,15 @@ import pandas as pd
 import networkx as nx
 import seaborn as sns
 from typing import List, Dict, Any, Optional, Tuple, Set
-from dataclasses import dataclass
 from pathlib import Path
 import matplotlib.cm as cm
 
 from peopleanalytics.data_pipeline import DataPipeline
 from peopleanalytics.talent_development.influence_network.network_analyzer import InfluenceNetwork
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class Collaboration:
     """Representa uma colaboração entre pessoas."""
     collab_id: str
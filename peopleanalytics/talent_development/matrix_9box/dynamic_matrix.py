@@ -10,7 +10,6 @@ import matplotlib
 matplotlib.use("Agg")  # Set backend to Agg (non-interactive)
 
 import datetime
-from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
 import matplotlib.pyplot as plt
@@ -18,9 +17,10 @@ import numpy as np
 
 from peopleanalytics.data_pipeline import DataPipeline
 from peopleanalytics.talent_development.matrix_9box.trajectory import TrajectoryAnalyzer
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class MatrixPosition:
     """Posição de um colaborador na matriz 9-box."""
 
@@ -22,9 +22,10 @@ from sklearn.metrics import mean_squared_error, r2_score
 from sklearn.impute import SimpleImputer
 
 from peopleanalytics.data_pipeline import DataPipeline
+from peopleanalytics.talent_development.records import slotted_dataclass
 
 
-@dataclass
+@slotted_dataclass
 class PerformanceMetric:
     """Representa uma métrica de desempenho de uma pessoa."""
     metric_id: str
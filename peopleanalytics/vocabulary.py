@@ -0,0 +1,175 @@
+"""
+Label vocabularies for People Analytics.
+
+Every flattened evaluation row repeats the same long Portuguese labels
+(direcionador, comportamento, avaliador, cargo, conceito). This module keeps
+one process-wide vocabulary per label column that interns each label once and
+gives it a stable integer code, so parsed documents share a single copy of
+every label and DataFrames store the label columns as pandas categoricals.
+
+Categoricals use the sorted labels of the vocabulary as categories, so frames
+built from the same vocabulary have matching categories (merges and concats
+stay categorical) and sorting or grouping by a label column keeps the
+alphabetical order of plain strings. Groupbys over label columns should pass
+``observed=True`` so labels absent from a frame do not show up as empty groups.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Label columns interned and stored as categoricals
+LABEL_COLUMNS = ("direcionador", "comportamento", "avaliador", "cargo", "conceito")
+
+# Document keys holding each label, at any depth of a resultado.json document
+DOCUMENT_LABEL_KEYS = {
+    "direcionador": "direcionador",
+    "comportamento": "comportamento",
+    "avaliador": "avaliador",
+    "cargo": "cargo",
+    "conceito_ciclo_filho_descricao": "conceito",
+}
+
+
+class Vocabulary:
+    """Append-only set of labels with stable integer codes."""
+
+    def __init__(self):
+        """Initialize an empty vocabulary."""
+        self._codes: Dict[str, int] = {}
+        self._labels: List[str] = []
+        self._sorted: Optional[pd.Index] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def code(self, label: str) -> int:
+        """Return the code of a label, adding it to the vocabulary if needed."""
+        code = self._codes.get(label)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(label)
+                if code is None:
+                    code = len(self._labels)
+                    self._labels.append(label)
+                    self._codes[label] = code
+                    self._sorted = None
+        return code
+
+    def intern(self, label: Any) -> Any:
+        """Return the vocabulary's copy of a label; non-strings are returned as is."""
+        if not isinstance(label, str):
+            return label
+        return self._labels[self.code(label)]
+
+    def label(self, code: int) -> str:
+        """Return the label of a code."""
+        return self._labels[code]
+
+    def codes(self, values: Iterable[str]) -> np.ndarray:
+        """Return the stable codes of labels as an int32 array."""
+        return np.fromiter((self.code(value) for value in values), dtype=np.int32)
+
+    def categories(self) -> pd.Index:
+        """Return the labels in sorted order, used as categorical categories."""
+        categories = self._sorted
+        if categories is None:
+            with self._lock:
+                categories = pd.Index(sorted(self._labels), dtype=object)
+                self._sorted = categories
+        return categories
+
+    def categorical(self, values: Sequence) -> Optional[pd.Categorical]:
+        """Encode values as a categorical over the vocabulary's categories.
+
+        Missing values stay missing. Values that are not strings cannot be
+        ordered with the labels, so they are not encoded.
+
+        Args:
+            values: Labels, e.g. a DataFrame column
+
+        Returns:
+            The categorical, or None if some value is not a string
+        """
+        if isinstance(getattr(values, "dtype", None), pd.CategoricalDtype):
+            values = values.astype(object)
+        positions, uniques = pd.factorize(values)
+        uniques = list(uniques)
+        if not all(isinstance(label, str) for label in uniques):
+            return None
+
+        for label in uniques:
+            self.code(label)
+        categories = self.categories()
+        ranks = categories.get_indexer(uniques).astype(np.int32)
+        if len(ranks):
+            codes = np.where(positions >= 0, ranks[positions], -1)
+        else:
+            codes = positions
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+
+_vocabularies: Dict[str, Vocabulary] = {}
+_vocabularies_lock = threading.Lock()
+
+
+def get_vocabulary(column: str) -> Vocabulary:
+    """Return the process-wide vocabulary of a label column."""
+    vocabulary = _vocabularies.get(column)
+    if vocabulary is None:
+        with _vocabularies_lock:
+            vocabulary = _vocabularies.setdefault(column, Vocabulary())
+    return vocabulary
+
+
+def intern_label(column: str, label: Any) -> Any:
+    """Intern a label in the vocabulary of its column."""
+    return get_vocabulary(column).intern(label)
+
+
+def intern_document(document: Any) -> Any:
+    """Intern the labels of a parsed resultado.json document in place.
+
+    Args:
+        document: The parsed document
+
+    Returns:
+        The same document, whose label values are now vocabulary copies
+    """
+    stack = [document]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key, value in node.items():
+                column = DOCUMENT_LABEL_KEYS.get(key)
+                if column is not None and isinstance(value, str):
+                    node[key] = get_vocabulary(column).intern(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+        elif isinstance(node, list):
+            stack.extend(item for item in node if isinstance(item, (dict, list)))
+    return document
+
+
+def categorize_labels(
+    df: pd.DataFrame, columns: Iterable[str] = LABEL_COLUMNS
+) -> pd.DataFrame:
+    """Store the label columns of a frame as vocabulary categoricals.
+
+    Args:
+        df: The frame, modified in place
+        columns: Label columns to encode (missing ones are ignored)
+
+    Returns:
+        The same frame
+    """
+    for column in columns:
+        if column not in df.columns:
+            continue
+        categorical = get_vocabulary(column).categorical(df[column])
+        if categorical is not None:
+            df[column] = categorical
+    return df
@@ -0,0 +1,65 @@
+"""
+Testes para os intervalos de confiança por bootstrap.
+
+Este módulo verifica a reprodutibilidade dos intervalos com um gerador
+semeado, a independência do número de processos e os casos degenerados.
+"""
+
+import unittest
+
+import numpy as np
+
+from peopleanalytics.bootstrap import BootstrapEngine
+from peopleanalytics.scoring_engine import SCORE_MODELS
+
+
+class TestBootstrapEngine(unittest.TestCase):
+    """Testes para o BootstrapEngine"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.individual = rng.integers(0, 15, size=(40, 6)).astype(float)
+        self.group = rng.integers(0, 60, size=(40, 6)).astype(float)
+        self.individual[0] = 0
+        self.individual[1] = [0, 0, 12, 0, 0, 0]
+
+    def test_score_intervals(self):
+        """Testa os intervalos dos scores, incluindo vetores degenerados"""
+        engine = BootstrapEngine(n_resamples=500, seed=3)
+        lower, upper = engine.score_intervals(self.individual)
+        scores = SCORE_MODELS["normalized"](self.individual)
+
+        self.assertEqual(lower.shape, (40,))
+        self.assertTrue((lower <= upper).all())
+        self.assertTrue(((lower <= scores) & (scores <= upper)).mean() > 0.9)
+        # Sem avaliações o score é 0; com um único nível não há incerteza
+        self.assertEqual((lower[0], upper[0]), (0.0, 0.0))
+        self.assertEqual((lower[1], upper[1]), (scores[1], scores[1]))
+
+        with self.assertRaises(ValueError):
+            engine.score_intervals(np.zeros((3, 5)))
+        with self.assertRaises(ValueError):
+            engine.score_intervals(self.individual, model="linear")
+
+    def test_reproducible_across_workers(self):
+        """Testa se a mesma semente dá os mesmos intervalos com ou sem processos"""
+        serial = BootstrapEngine(n_resamples=200, seed=11, chunk_rows=8)
+        parallel = BootstrapEngine(n_resamples=200, seed=11, chunk_rows=8, workers=2)
+
+        expected = serial.gap_intervals(self.individual, self.group)
+        for lower, upper in (
+            serial.gap_intervals(self.individual, self.group),
+            parallel.gap_intervals(self.individual, self.group),
+        ):
+            self.assertEqual(lower.tolist(), expected[0].tolist())
+            self.assertEqual(upper.tolist(), expected[1].tolist())
+
+        other = BootstrapEngine(n_resamples=200, seed=12, chunk_rows=8)
+        self.assertNotEqual(
+            other.gap_intervals(self.individual, self.group)[0].tolist(),
+            expected[0].tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Testes unitários para o armazenamento colunar do DataPipeline.
+
+Este módulo verifica a ingestão de arquivos resultado.json/perfil.json no
+armazenamento de avaliações e a leitura das linhas achatadas.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics.data_pipeline import DataPipeline
+from peopleanalytics.evaluation_corpus import EvaluationCorpus
+from peopleanalytics.scoring_engine import ScoringEngine
+from peopleanalytics.significance import SignificanceTester
+
+
+class TestDataPipelineStore(unittest.TestCase):
+    """Testes para o armazenamento de avaliações do DataPipeline"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.pipeline = DataPipeline(
+            self.data_dir, store_path=Path(self.temp_dir) / "store.duckdb"
+        )
+        self.resultado = self._write_person("pessoa1", "2023", [0, 1, 2, 1, 0, 0])
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        self.pipeline.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _write_person(self, pessoa, ano, freq_colaborador):
+        """Cria os arquivos resultado.json e perfil.json de uma pessoa/ano"""
+        directory = self.data_dir / pessoa / ano
+        directory.mkdir(parents=True, exist_ok=True)
+
+        resultado = {
+            "success": True,
+            "status_code": 200,
+            "data": {
+                "conceito_ciclo_filho_descricao": "Bom",
+                "direcionadores": [
+                    {
+                        "direcionador": "Colaboração",
+                        "pergunta_final": "Pergunta?",
+                        "comportamentos": [
+                            {
+                                "comportamento": "Compartilha conhecimento",
+                                "pergunta_final": False,
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "todos",
+                                        "frequencia_colaborador": freq_colaborador,
+                                        "frequencia_grupo": [1, 1, 1, 1, 0, 0],
+                                    },
+                                    {
+                                        "avaliador": "gestor",
+                                        "frequencia_colaborador": [0, 0, 1],
+                                        "frequencia_grupo": [0, 2, 2, 0, 0, 0],
+                                    },
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+        with open(directory / "resultado.json", "w", encoding="utf-8") as f:
+            json.dump(resultado, f)
+        with open(directory / "perfil.json", "w", encoding="utf-8") as f:
+            json.dump({"cargo": "Dev", "nivel_cargo": "Pleno"}, f)
+
+        return directory / "resultado.json"
+
+    def test_ingest_and_load(self):
+        """Testa se as linhas achatadas são gravadas e lidas do armazenamento"""
+        result = self.pipeline.ingest_file(self.resultado)
+        self.assertTrue(result["success"])
+        self.assertEqual(result["rows"], 2)
+
+        df = self.pipeline.load_evaluations()
+        self.assertEqual(list(df["avaliador"]), ["todos", "gestor"])
+        self.assertEqual(df.loc[0, "pessoa"], "pessoa1")
+        self.assertEqual(df.loc[0, "ano"], "2023")
+        self.assertEqual(df.loc[0, "department"], "Unknown")
+        self.assertAlmostEqual(df.loc[0, "frequencia_colaborador"], 2.0)
+        self.assertAlmostEqual(df.loc[0, "frequencia_grupo"], 1.5)
+        # Vetores curtos são completados com zeros
+        self.assertAlmostEqual(df.loc[1, "frequencia_colaborador"], 2.0)
+        self.assertEqual(df.loc[1, "freq_colaborador_5"], 0)
+
+    def test_unchanged_file_is_skipped(self):
+        """Testa se um arquivo inalterado não é reprocessado"""
+        self.pipeline.ingest_file(self.resultado)
+        result = self.pipeline.ingest_file(self.resultado)
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error_type"], "exists")
+
+    def test_modified_file_replaces_rows(self):
+        """Testa se um arquivo modificado substitui as linhas anteriores"""
+        self.pipeline.ingest_file(self.resultado)
+        self._write_person("pessoa1", "2023", [0, 0, 0, 0, 0, 4])
+        stat = self.resultado.stat()
+        os.utime(self.resultado, (stat.st_atime, stat.st_mtime + 10))
+
+        result = self.pipeline.ingest_file(self.resultado)
+        self.assertTrue(result["success"])
+
+        df = self.pipeline.load_evaluations()
+        self.assertEqual(len(df), 2)
+        self.assertAlmostEqual(df.loc[0, "frequencia_colaborador"], 5.0)
+
+    def test_modified_profile_replaces_rows(self):
+        """Testa se alterações no perfil.json forçam a reingestão"""
+        self.pipeline.ingest_file(self.resultado)
+        perfil = self.resultado.parent / "perfil.json"
+        perfil.write_text(json.dumps({"cargo": "Tech Lead", "nivel_cargo": "Sênior"}))
+        stat = perfil.stat()
+        os.utime(perfil, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertTrue(self.pipeline.ingest_file(self.resultado)["success"])
+        df = self.pipeline.load_evaluations()
+        self.assertEqual(set(df["cargo"]), {"Tech Lead"})
+
+    def test_corrupted_file_drops_rows(self):
+        """Testa se um arquivo que deixa de ser válido tem suas linhas removidas"""
+        self.pipeline.ingest_file(self.resultado)
+        self.resultado.write_text("{invalido")
+        stat = self.resultado.stat()
+        os.utime(self.resultado, (stat.st_atime, stat.st_mtime + 10))
+
+        result = self.pipeline.ingest_file(self.resultado)
+        self.assertEqual(result["error_type"], "processing")
+        self.assertTrue(self.pipeline.load_evaluations().empty)
+
+    def test_zero_frequency_vector_fails(self):
+        """Testa se vetores de frequência vazios são rejeitados"""
+        resultado = self._write_person("pessoa2", "2023", [0, 0, 0, 0, 0, 0])
+        result = self.pipeline.ingest_file(resultado)
+        self.assertFalse(result["success"])
+        self.assertEqual(result["error_type"], "processing")
+        self.assertTrue(self.pipeline.load_evaluations().empty)
+
+    def test_prune_missing(self):
+        """Testa se dados de arquivos removidos são descartados"""
+        self.pipeline.ingest_file(self.resultado)
+        shutil.rmtree(self.resultado.parent)
+
+        self.assertEqual(self.pipeline.prune_missing(self.data_dir), 1)
+        self.assertTrue(self.pipeline.load_evaluations().empty)
+
+    def test_load_filters(self):
+        """Testa os filtros de pessoa, ano e diretório"""
+        self.pipeline.ingest_file(self.resultado)
+        self.pipeline.ingest_file(
+            self._write_person("pessoa2", "2022", [0, 1, 0, 0, 0, 0])
+        )
+
+        self.assertEqual(len(self.pipeline.load_evaluations(person="pessoa2")), 2)
+        self.assertEqual(len(self.pipeline.load_evaluations(year="2023")), 2)
+        self.assertEqual(
+            len(self.pipeline.load_evaluations(directory=self.data_dir / "pessoa1")), 2
+        )
+
+    def test_corpus_is_loaded_once(self):
+        """Testa se o corpus compartilhado só relê o armazenamento após invalidação"""
+        self.pipeline.ingest_file(self.resultado)
+        corpus = EvaluationCorpus(self.pipeline, self.data_dir)
+
+        frame = corpus.frame
+        self.assertIs(corpus.frame, frame)
+        self.assertEqual(corpus.version, 1)
+        self.assertEqual(list(frame["stakeholder_type"]), ["peer", "manager"])
+
+        corpus.invalidate()
+        self.assertFalse(corpus.loaded)
+        self.assertIsNot(corpus.frame, frame)
+        self.assertEqual(corpus.version, 2)
+
+    def test_corpus_scores(self):
+        """Testa se os scores do motor batem com as médias do armazenamento"""
+        self.pipeline.ingest_file(self.resultado)
+        corpus = EvaluationCorpus(self.pipeline, self.data_dir)
+        engine = ScoringEngine()
+
+        scores = engine.corpus_scores(corpus)
+        self.assertEqual(
+            scores["index_mean_colaborador"].tolist(),
+            corpus.frame["frequencia_colaborador"].tolist(),
+        )
+        self.assertEqual(
+            scores["index_mean_grupo"].tolist(),
+            corpus.frame["frequencia_grupo"].tolist(),
+        )
+        self.assertEqual(scores["traditional_colaborador"].tolist(), [3.375, 4.0])
+        self.assertIs(engine.corpus_scores(corpus), scores)
+
+        corpus.invalidate()
+        self.assertIsNot(engine.corpus_scores(corpus), scores)
+
+    def test_significance_tests(self):
+        """Testa os testes de significância de todo o corpus"""
+        self.pipeline.ingest_file(self.resultado)
+        self.pipeline.ingest_file(
+            self._write_person("pessoa2", "2023", [0, 9, 9, 0, 0, 0])
+        )
+        corpus = EvaluationCorpus(self.pipeline, self.data_dir)
+        tester = SignificanceTester()
+
+        tests = tester.corpus_tests(corpus)
+        # Apenas as linhas consolidadas ("todos") são testadas
+        self.assertEqual(tests["pessoa"].tolist(), ["pessoa1", "pessoa2"])
+        self.assertEqual(
+            tests["p_value_adjusted"].tolist(),
+            tester.stat_analyzer.adjust_p_values(tests["p_value"]).tolist(),
+        )
+        self.assertIs(tester.corpus_tests(corpus), tests)
+
+        behaviors = tester.person_tests(corpus, "pessoa2", "2023")
+        self.assertEqual(list(behaviors), ["Compartilha conhecimento"])
+        self.assertEqual(
+            behaviors["Compartilha conhecimento"]["p_value"],
+            tests["p_value"].iloc[1],
+        )
+        self.assertEqual(tester.person_tests(corpus, "pessoa3", "2023"), {})
+
+        corpus.invalidate()
+        self.assertIsNot(tester.corpus_tests(corpus), tests)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,180 @@
+"""
+Testes unitários para o carregamento preguiçoso do EvaluationAnalyzer.
+
+Este módulo verifica que os arquivos resultado.json só são lidos quando
+acessados, que o cache respeita o orçamento de memória e que as comparações
+usam o cubo de scores.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics.evaluation_analyzer import EvaluationAnalyzer
+
+
+class TestEvaluationAnalyzerLazyLoading(unittest.TestCase):
+    """Testes para o carregamento sob demanda do EvaluationAnalyzer"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        for pessoa in ["pessoa1", "pessoa2"]:
+            for ano in ["2022", "2023"]:
+                directory = Path(self.temp_dir) / pessoa / ano
+                directory.mkdir(parents=True)
+                resultado = {
+                    "data": {
+                        "conceito_ciclo_filho_descricao": "Bom",
+                        "direcionadores": [
+                            {
+                                "direcionador": "Colaboração",
+                                "comportamentos": [
+                                    {
+                                        "comportamento": "Compartilha conhecimento",
+                                        "avaliacoes_grupo": [
+                                            {
+                                                "avaliador": "gestor",
+                                                "frequencia_colaborador": [
+                                                    0,
+                                                    1,
+                                                    2,
+                                                    1,
+                                                    0,
+                                                    0,
+                                                ],
+                                                "frequencia_grupo": [0, 1, 1, 1, 1, 0],
+                                            }
+                                        ],
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                }
+                with open(directory / "resultado.json", "w", encoding="utf-8") as f:
+                    json.dump(resultado, f)
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_discovery_does_not_parse(self):
+        """Testa se a descoberta de arquivos não faz parsing"""
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+
+        self.assertEqual(analyzer.get_all_people(), ["pessoa1", "pessoa2"])
+        self.assertEqual(analyzer.get_all_years(), ["2022", "2023"])
+        self.assertEqual(
+            sorted(analyzer.get_all_people_for_year("2023")), ["pessoa1", "pessoa2"]
+        )
+        self.assertEqual(len(analyzer._cache), 0)
+
+    def test_access_parses_only_requested_person(self):
+        """Testa se apenas a avaliação acessada é carregada"""
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+
+        scores = analyzer.get_behavior_scores("pessoa1", "2023")
+
+        self.assertIn("Compartilha conhecimento", scores["Colaboração"])
+        self.assertEqual(list(analyzer._cache), [("pessoa1", "2023")])
+
+    def test_cache_budget_evicts_least_recently_used(self):
+        """Testa se o orçamento de memória limita as avaliações em cache"""
+        analyzer = EvaluationAnalyzer(self.temp_dir, use_cache=1)
+
+        analyzer.get_evaluations_for_person("pessoa1", "2022")
+        evaluation = analyzer.get_evaluations_for_person("pessoa2", "2023")
+
+        self.assertTrue(evaluation["success"])
+        self.assertEqual(list(analyzer._cache), [("pessoa2", "2023")])
+
+    def test_single_person_queries_parse_only_that_person(self):
+        """Testa se consultas de uma pessoa não carregam o corpus inteiro"""
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+
+        score = analyzer.get_average_score("pessoa2", "2023")
+        criterion = analyzer.get_score_for_criterion("pessoa2", "2022", "Colaboração")
+
+        self.assertGreater(score, 0.0)
+        self.assertEqual(criterion, score)
+        self.assertIsNone(analyzer._score_cube)
+        self.assertEqual(
+            sorted(analyzer._cache), [("pessoa2", "2022"), ("pessoa2", "2023")]
+        )
+
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+        # The criteria of each year are sampled from the first person found
+        person = next(iter(analyzer.evaluations_by_person))
+        history = analyzer.person_year_over_year(person)
+
+        self.assertEqual(
+            history["average_score_by_year"], {"2022": score, "2023": score}
+        )
+        self.assertIsNone(analyzer._score_cube)
+        self.assertEqual(sorted(analyzer._cache), [(person, "2022"), (person, "2023")])
+
+    def test_comparison_rows_follow_directory_order(self):
+        """Testa se a tabela comparativa mantém a ordem dos diretórios"""
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+
+        df = analyzer.compare_people_for_year("2023")
+
+        people = [path.name for path in Path(self.temp_dir).iterdir()]
+        self.assertEqual(df["Name"].tolist(), people + ["Group Average"])
+
+    def test_score_cube_answers_comparisons(self):
+        """Testa se as comparações saem do cubo de scores construído uma vez"""
+        analyzer = EvaluationAnalyzer(self.temp_dir)
+        expected = analyzer.get_behavior_scores("pessoa1", "2023")["Colaboração"][
+            "Compartilha conhecimento"
+        ]["scores"]["gestor"]
+
+        df = analyzer.compare_people_for_year("2023")
+        cube = analyzer.score_cube
+
+        self.assertEqual(
+            sorted(df["Name"].tolist()), ["Group Average", "pessoa1", "pessoa2"]
+        )
+        self.assertEqual(df["Average Score"][0], expected["score_colaborador"])
+        self.assertEqual(df["Colaboração"][0], expected["score_colaborador"])
+        self.assertEqual(df["Concept"][0], "Bom")
+        self.assertEqual(
+            analyzer.get_score_for_criterion("pessoa2", "2022", "Colaboração"),
+            expected["score_colaborador"],
+        )
+        self.assertEqual(analyzer.get_average_score("pessoa3", "2023"), 0.0)
+
+        frame = cube.frame()
+        self.assertEqual(len(frame), 4)
+        self.assertEqual(
+            frame.loc[
+                (
+                    "pessoa1",
+                    "2023",
+                    "Colaboração",
+                    "Compartilha conhecimento",
+                    "gestor",
+                ),
+                "score_grupo",
+            ],
+            expected["score_grupo"],
+        )
+
+        history = analyzer.person_year_over_year("pessoa1")
+        self.assertIs(analyzer.score_cube, cube)
+        self.assertEqual(
+            history["behavior_scores_by_year"]["Colaboração"][
+                "Compartilha conhecimento"
+            ],
+            {
+                "2022": expected["score_colaborador"],
+                "2023": expected["score_colaborador"],
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
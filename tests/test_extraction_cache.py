@@ -0,0 +1,64 @@
+"""
+Testes para o cache de resultados intermediários dos relatórios.
+
+Este módulo verifica se cada resultado é calculado uma vez por conteúdo, os
+contadores de acertos e a invalidação explícita.
+"""
+
+import unittest
+
+from peopleanalytics.domain.extraction_cache import ExtractionCache
+
+
+class TestExtractionCache(unittest.TestCase):
+    """Testes para o ExtractionCache"""
+
+    def setUp(self):
+        self.cache = ExtractionCache(maxsize=2)
+        self.calls = []
+
+    def extract(self, data):
+        """Extrai os comportamentos, registrando cada cálculo"""
+        return self.cache.get_or_compute(
+            "behavior_data",
+            data,
+            lambda: self.calls.append(data["pessoa"]) or sorted(data["comportamentos"]),
+        )
+
+    def test_memoization(self):
+        """Testa se dados iguais compartilham os resultados"""
+        data = {"pessoa": "ana", "comportamentos": ["b", "a"]}
+
+        self.assertEqual(self.extract(data), ["a", "b"])
+        self.assertEqual(self.extract(data), ["a", "b"])
+        # Uma cópia tem o mesmo conteúdo e reaproveita o resultado
+        self.assertEqual(self.extract(dict(data)), ["a", "b"])
+        self.assertEqual(self.calls, ["ana"])
+        self.assertEqual(self.cache.stats(), {"hits": 2, "misses": 1, "entries": 1})
+
+        with self.assertRaises(KeyError):
+            self.cache.get_or_compute("erro", data, lambda: {}["x"])
+        self.assertEqual(self.extract(data), ["a", "b"])
+
+    def test_invalidation(self):
+        """Testa a invalidação explícita e o limite de entradas"""
+        data = {"pessoa": "ana", "comportamentos": ["b", "a"]}
+        self.extract(data)
+
+        data["comportamentos"].append("c")
+        self.assertEqual(self.extract(data), ["a", "b"])
+        self.cache.invalidate(data)
+        self.assertEqual(self.extract(data), ["a", "b", "c"])
+
+        for pessoa in ("bia", "caio"):
+            self.extract({"pessoa": pessoa, "comportamentos": []})
+        self.assertEqual(self.cache.stats()["entries"], 2)
+        self.extract({"pessoa": "ana", "comportamentos": ["b", "a", "c"]})
+        self.assertEqual(self.calls, ["ana", "ana", "bia", "caio", "ana"])
+
+        self.cache.invalidate()
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Testes unitários para o tensor de frequências mapeado em memória.
+
+Este módulo verifica que os vetores de frequência são lidos do memmap sem
+cópia e que os consumidores produzem os mesmos resultados da leitura do JSON.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from peopleanalytics.domain.json_processor import JsonProcessor
+from peopleanalytics.evaluation_analyzer import EvaluationAnalyzer
+from peopleanalytics.frequency_tensor import FrequencyTensor
+
+
+class TestFrequencyTensor(unittest.TestCase):
+    """Testes para o FrequencyTensor"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = tempfile.mkdtemp()
+        self.tensor_dir = FrequencyTensor.default_dir(self.output_dir)
+        self.resultado = {
+            "data": {
+                "conceito_ciclo_filho_descricao": "Bom",
+                "direcionadores": [
+                    {
+                        "direcionador": "Colaboração",
+                        "comportamentos": [
+                            {
+                                "comportamento": "Compartilha conhecimento",
+                                "consolidado": [
+                                    {
+                                        "avaliador": "todos",
+                                        "frequencias_colaborador": [0, 2, 3, 1, 0, 0],
+                                        "frequencias_grupo": [0, 1, 2, 2, 1, 0],
+                                    }
+                                ],
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "todos",
+                                        "frequencia_colaborador": [0, 1, 2, 1, 0, 0],
+                                        "frequencia_grupo": [0, 1, 1, 1, 1, 0],
+                                    }
+                                ],
+                            },
+                            {
+                                "comportamento": "Ajuda o time",
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "gestor",
+                                        "frequencia_colaborador": [0, 0, 1, 1, 0, 0],
+                                        "frequencia_grupo": [0, 1, 0, 1, 0],
+                                    }
+                                ],
+                            },
+                        ],
+                    },
+                    {"direcionador": "Inovação", "comportamentos": []},
+                ],
+            }
+        }
+        for pessoa in ["pessoa1", "pessoa2"]:
+            directory = Path(self.temp_dir) / pessoa / "2023"
+            directory.mkdir(parents=True)
+            with open(directory / "resultado.json", "w", encoding="utf-8") as f:
+                json.dump(self.resultado, f, ensure_ascii=False)
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(self.output_dir)
+
+    def test_rows_are_memory_mapped_views(self):
+        """Testa se os vetores de uma pessoa são fatias do memmap"""
+        tensor = FrequencyTensor.open(self.temp_dir, self.tensor_dir)
+        rows = tensor.frequencies[tensor.row_slice("pessoa2", "2023")]
+
+        self.assertEqual(tensor.frequencies.shape, (8, 2, 6))
+        self.assertIsInstance(tensor.frequencies, np.memmap)
+        self.assertTrue(np.shares_memory(rows, tensor.frequencies))
+        self.assertEqual(tensor.group("pessoa1", "2023")["conceito"], "Bom")
+
+    def test_consumers_match_json(self):
+        """Testa se analisador e processador produzem os mesmos resultados do JSON"""
+        from_json = EvaluationAnalyzer(self.temp_dir)
+        from_tensor = EvaluationAnalyzer(
+            self.temp_dir, use_tensor=True, tensor_dir=self.tensor_dir
+        )
+        self.assertEqual(
+            from_tensor.get_behavior_scores("pessoa1", "2023"),
+            from_json.get_behavior_scores("pessoa1", "2023"),
+        )
+        # O tensor fica junto da saída, sem escrever no diretório de dados
+        self.assertTrue((self.tensor_dir / "metadata.json").exists())
+        self.assertEqual(
+            sorted(p.name for p in Path(self.temp_dir).iterdir()),
+            ["pessoa1", "pessoa2"],
+        )
+
+        processor = JsonProcessor(
+            self.temp_dir, use_tensor=True, tensor_dir=self.tensor_dir
+        )
+        resultado_file = Path(self.temp_dir) / "pessoa1" / "2023" / "resultado.json"
+        processed = processor.process_evaluation_data(str(resultado_file))
+        expected = JsonProcessor().process_evaluation_data(str(resultado_file))
+        freq_grupo = processed["avaliacoes"]["Ajuda o time:gestor"]["freq_grupo"]
+        self.assertTrue(np.shares_memory(freq_grupo, processor.tensor.frequencies))
+        self.assertEqual(processed["global_scores"], expected["global_scores"])
+        self.assertEqual(
+            freq_grupo.tolist(),
+            expected["avaliacoes"]["Ajuda o time:gestor"]["freq_grupo"],
+        )
+
+    def test_processor_falls_back_to_json(self):
+        """Testa se arquivos fora do tensor são lidos do JSON"""
+        outside_file = Path(self.output_dir) / "resultado.json"
+        shutil.copy(
+            Path(self.temp_dir) / "pessoa1" / "2023" / "resultado.json", outside_file
+        )
+        processor = JsonProcessor(
+            self.temp_dir, use_tensor=True, tensor_dir=self.tensor_dir
+        )
+
+        processed = processor.process_evaluation_data(str(outside_file))
+
+        self.assertEqual(
+            processed["avaliacoes"]["Ajuda o time:gestor"]["freq_grupo"],
+            [0, 1, 0, 1, 0, 0],
+        )
+
+    def test_stale_tensor_is_rebuilt(self):
+        """Testa se alterações nos arquivos de origem reconstroem o tensor"""
+        tensor = FrequencyTensor.open(self.temp_dir, self.tensor_dir)
+        shutil.rmtree(Path(self.temp_dir) / "pessoa2")
+
+        rebuilt = FrequencyTensor.open(self.temp_dir, self.tensor_dir)
+
+        self.assertNotEqual(
+            rebuilt.metadata["fingerprint"], tensor.metadata["fingerprint"]
+        )
+        self.assertIsNone(rebuilt.row_slice("pessoa2", "2023"))
+        self.assertEqual(len(rebuilt), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Testes unitários para o carregador de JSON.
+
+Este módulo verifica que o carregador produz os mesmos resultados do módulo
+json da biblioteca padrão, independentemente do backend disponível.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from peopleanalytics import json_loader
+
+
+class TestJsonLoader(unittest.TestCase):
+    """Testes para o json_loader"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.resultado = {
+            "success": True,
+            "status_code": 200,
+            "data": {
+                "conceito_ciclo_filho_descricao": "Bom",
+                "direcionadores": [
+                    {
+                        "direcionador": "Colaboração",
+                        "pergunta_final": False,
+                        "comportamentos": [
+                            {
+                                "comportamento": "Compartilha conhecimento",
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "gestor",
+                                        "frequencia_colaborador": [0, 1, 2, 1, 0, 0],
+                                        "frequencia_grupo": [1, 1, 1, 1, 0, 0],
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+        self.file_path = Path(self.temp_dir) / "resultado.json"
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            json.dump(self.resultado, f, ensure_ascii=False)
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_load_json_matches_stdlib(self):
+        """Testa se o documento carregado é igual ao do json.load"""
+        self.assertEqual(json_loader.load_json(self.file_path), self.resultado)
+
+    def test_nan_falls_back_to_stdlib(self):
+        """Testa se literais aceitos apenas pela biblioteca padrão continuam válidos"""
+        data = json_loader.loads(b'{"valor": NaN}')
+        self.assertNotEqual(data["valor"], data["valor"])
+
+    def test_invalid_json_raises_decode_error(self):
+        """Testa se JSON inválido gera json.JSONDecodeError"""
+        with self.assertRaises(json.JSONDecodeError):
+            json_loader.loads(b'{"valor": ')
+
+    def test_typed_resultado(self):
+        """Testa a decodificação em dataclasses do esquema de avaliação"""
+        resultado = json_loader.load_resultado(self.file_path, typed=True)
+        comportamento = resultado.data.direcionadores[0].comportamentos[0]
+
+        self.assertEqual(resultado.data.conceito_ciclo_filho_descricao, "Bom")
+        self.assertEqual(comportamento.avaliacoes_grupo[0].avaliador, "gestor")
+        self.assertEqual(
+            comportamento.avaliacoes_grupo[0].frequencia_colaborador,
+            [0, 1, 2, 1, 0, 0],
+        )
+
+    @unittest.skipUnless(json_loader.msgspec, "msgspec não instalado")
+    def test_msgspec_backend_matches_stdlib(self):
+        """Testa se o backend msgspec se comporta como a biblioteca padrão"""
+        avaliacao = self.resultado["data"]["direcionadores"][0]["comportamentos"][0]
+        del avaliacao["avaliacoes_grupo"][0]["avaliador"]
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            json.dump(self.resultado, f, ensure_ascii=False)
+
+        with patch.object(json_loader, "JSON_BACKEND", "msgspec"):
+            data = json_loader.loads(b'{"valor": NaN}')
+            self.assertNotEqual(data["valor"], data["valor"])
+            with self.assertRaises(json.JSONDecodeError):
+                json_loader.loads(b'{"valor": ')
+
+        self.assertEqual(
+            json_loader.load_resultado(self.file_path, typed=True),
+            json_loader.to_resultado(self.resultado),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
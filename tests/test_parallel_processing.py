@@ -12,6 +12,7 @@ import tempfile
 import time
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -394,5 +395,179 @@ class TestParallelStability(unittest.TestCase):
         self.assertIn("LargeFile/2023", sync.processed_directories)
 
 
+class TestProcessExecutor(unittest.TestCase):
+    """Testes para o processamento paralelo com o executor de processos"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.output_dir = Path(self.temp_dir) / "output"
+
+        for pessoa_idx in range(1, 4):
+            ano_dir = self.data_dir / f"Pessoa{pessoa_idx}" / "2023"
+            ano_dir.mkdir(parents=True)
+            with open(ano_dir / "resultado.json", "w", encoding="utf-8") as f:
+                json.dump({"success": True, "data": {"pessoa": pessoa_idx}}, f)
+
+        invalid_dir = self.data_dir / "Invalid" / "2023"
+        invalid_dir.mkdir(parents=True)
+        with open(invalid_dir / "resultado.json", "w", encoding="utf-8") as f:
+            f.write("{ this is not valid JSON }")
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_sync(self, **kwargs):
+        """Cria um DataSync com o executor de processos"""
+        return DataSync(
+            data_dir=self.data_dir,
+            output_dir=self.output_dir,
+            executor="process",
+            workers=2,
+            incremental=False,
+            generate_visualizations=False,
+            generate_dashboard=False,
+            generate_zip=False,
+            generate_excel=False,
+            generate_9box=False,
+            generate_career_sim=False,
+            generate_network=False,
+            **kwargs,
+        )
+
+    def test_worker_results_are_merged(self):
+        """Testa se os dados dos processos são combinados no processo principal"""
+        sync = self._create_sync(ignore_errors=True)
+        sync.sync()
+
+        self.assertEqual(
+            sync.processed_data,
+            {
+                f"Pessoa{i}": {"2023": {"success": True, "data": {"pessoa": i}}}
+                for i in range(1, 4)
+            },
+        )
+        self.assertEqual(
+            sorted(Path(path).parent.name for path in sync.processed_directories),
+            ["Pessoa1", "Pessoa2", "Pessoa3"],
+        )
+        self.assertEqual(len(sync.errors), 1)
+        self.assertIn("Invalid", sync.errors[0])
+
+    def test_batches_are_submitted_in_chunks(self):
+        """Testa se --batch-size divide o envio de diretórios aos processos"""
+        sync = self._create_sync(ignore_errors=True, batch_size=3)
+        with patch.object(
+            DataSync, "_flush_batch", autospec=True, side_effect=DataSync._flush_batch
+        ) as flush:
+            sync.sync()
+
+        self.assertEqual([len(call.args[1]) for call in flush.call_args_list], [3, 1])
+        self.assertEqual(len(sync.processed_directories), 3)
+
+    def test_worker_error_stops_processing(self):
+        """Testa se um erro em um processo interrompe o sync sem ignore_errors"""
+        sync = self._create_sync(ignore_errors=False)
+
+        self.assertFalse(
+            sync._process_directories_parallel(sync._discover_work_items())
+        )
+        self.assertIn("Invalid", sync.errors[0])
+
+
+class TestAsyncLoader(unittest.TestCase):
+    """Testes para o carregamento assíncrono com --io-concurrency"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = Path(self.temp_dir) / "data"
+        self.output_dir = Path(self.temp_dir) / "output"
+
+        for pessoa_idx in range(1, 7):
+            ano_dir = self.data_dir / f"Pessoa{pessoa_idx}" / "2023"
+            ano_dir.mkdir(parents=True)
+            with open(ano_dir / "resultado.json", "w", encoding="utf-8") as f:
+                json.dump({"success": True, "data": {"pessoa": pessoa_idx}}, f)
+            with open(ano_dir / "resultado.csv", "w", encoding="utf-8") as f:
+                f.write(f"nota\n{pessoa_idx}\n")
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def _create_sync(self, **kwargs):
+        """Cria um DataSync sem relatórios agregados"""
+        return DataSync(
+            data_dir=self.data_dir,
+            output_dir=self.output_dir,
+            incremental=False,
+            generate_9box=False,
+            generate_career_sim=False,
+            generate_network=False,
+            **kwargs,
+        )
+
+    def test_async_loader_matches_sequential(self):
+        """Testa se o carregamento assíncrono produz os mesmos dados do sequencial"""
+        sequential = self._create_sync(use_parallel=False)
+        sequential.sync()
+        loaded = self._create_sync(io_concurrency=4, workers=2, batch_size=4)
+        loaded.sync()
+
+        self.assertEqual(set(loaded.processed_data), set(sequential.processed_data))
+        for pessoa, anos in sequential.processed_data.items():
+            self.assertEqual(loaded.processed_data[pessoa].keys(), anos.keys())
+        self.assertEqual(len(loaded.processed_directories), 6)
+        self.assertEqual(loaded.errors, [])
+
+    def test_reads_are_bounded(self):
+        """Testa se no máximo io_concurrency leituras ficam em andamento"""
+        import threading
+
+        from peopleanalytics.json_loader import read_bytes
+        from peopleanalytics.sync_io import AsyncDirectoryLoader
+
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def slow_read(path):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+            time.sleep(0.02)
+            with lock:
+                in_flight[0] -= 1
+            return read_bytes(path)
+
+        sync = self._create_sync()
+        loaded = []
+        loader = AsyncDirectoryLoader(
+            lambda pessoa, ano, paths, contents: len(contents),
+            io_concurrency=2,
+            read=slow_read,
+        )
+        loader.run(
+            sync._discover_work_items(),
+            lambda item, data, error: loaded.append((data, error)) or True,
+        )
+
+        self.assertEqual(loaded, [(2, None)] * 6)
+        self.assertLessEqual(in_flight[1], 2)
+
+    def test_error_stops_loading(self):
+        """Testa se um arquivo inválido interrompe o carregamento sem ignore_errors"""
+        with open(
+            self.data_dir / "Pessoa1" / "2023" / "resultado.json", "w", encoding="utf-8"
+        ) as f:
+            f.write("{ this is not valid JSON }")
+        sync = self._create_sync(io_concurrency=4)
+
+        self.assertFalse(sync._process_directories_async(sync._discover_work_items()))
+        self.assertIn("Pessoa1", sync.errors[0])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,119 @@
+"""
+Testes unitários para o cache de leitura endereçado por conteúdo.
+
+Este módulo verifica que arquivos resultado.json são lidos uma única vez por
+conteúdo, que os leitores compartilham o cache e que o cache respeita seu
+limite de tamanho.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics import parse_cache
+from peopleanalytics.domain.json_processor import JsonProcessor
+from peopleanalytics.evaluation_analyzer import EvaluationAnalyzer
+
+
+class TestParseCache(unittest.TestCase):
+    """Testes para o ParseCache"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.cache = parse_cache.configure(self.temp_dir / "cache")
+        self.resultado = {
+            "success": True,
+            "data": {
+                "conceito_ciclo_filho_descricao": "Bom",
+                "direcionadores": [
+                    {
+                        "direcionador": "Colaboração",
+                        "comportamentos": [
+                            {
+                                "comportamento": "Ajuda o time",
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "gestor",
+                                        "frequencia_colaborador": [0, 1, 2],
+                                        "frequencia_grupo": [1, 1, 1, 1, 0, 0],
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+        self.file_path = self.temp_dir / "pessoa1" / "2023" / "resultado.json"
+        self.file_path.parent.mkdir(parents=True)
+        self.file_path.write_text(json.dumps(self.resultado))
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        parse_cache.configure(None)
+        shutil.rmtree(self.temp_dir)
+
+    def test_same_content_is_parsed_once(self):
+        """Testa se o mesmo conteúdo é lido do cache, mesmo em outro arquivo"""
+        copy_path = self.temp_dir / "copia.json"
+        shutil.copy(self.file_path, copy_path)
+
+        first = parse_cache.load_json_cached(self.file_path)
+        first["data"]["direcionadores"].clear()
+        second = parse_cache.load_json_cached(copy_path)
+
+        self.assertEqual(second, self.resultado)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_changed_content_gets_new_entry(self):
+        """Testa se um arquivo alterado não reaproveita a entrada anterior"""
+        parse_cache.load_json_cached(self.file_path)
+        self.file_path.write_text(json.dumps({"success": False}))
+
+        self.assertEqual(
+            parse_cache.load_json_cached(self.file_path), {"success": False}
+        )
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Testa se o cache apaga as entradas usadas há mais tempo"""
+        cache = parse_cache.ParseCache(self.temp_dir / "bounded", max_bytes=10**6)
+        for index in range(3):
+            cache.put("document", f"{index:064x}", "x" * 1000)
+            entry_path = cache.entry_path("document", f"{index:064x}")
+            os.utime(entry_path, (index, index))
+        # Reading the oldest entry makes it the most recently used
+        self.assertEqual(cache.get("document", f"{0:064x}"), "x" * 1000)
+
+        cache.max_bytes = 3000
+        cache.put("document", f"{3:064x}", "x" * 1000)
+
+        self.assertIsNotNone(cache.get("document", f"{0:064x}"))
+        self.assertIsNone(cache.get("document", f"{1:064x}"))
+        self.assertIsNone(cache.get("document", f"{2:064x}"))
+        self.assertIsNotNone(cache.get("document", f"{3:064x}"))
+
+    def test_readers_share_the_cache(self):
+        """Testa se analisador e processador usam o cache compartilhado"""
+        analyzer = EvaluationAnalyzer(str(self.temp_dir))
+        self.assertEqual(
+            analyzer.evaluations_by_person["pessoa1"]["2023"]["data"],
+            self.resultado,
+        )
+        EvaluationAnalyzer(str(self.temp_dir)).evaluations_by_person["pessoa1"]["2023"]
+
+        processor = JsonProcessor()
+        expected = processor.extract_evaluation_data(self.resultado)
+        processed = processor.process_evaluation_data(str(self.file_path))
+        processor.process_evaluation_data(str(self.file_path))
+
+        self.assertEqual(processed["avaliacoes"], expected["avaliacoes"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
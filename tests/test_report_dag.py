@@ -0,0 +1,82 @@
+"""
+Testes para o agendador de tarefas dos relatórios.
+
+Este módulo verifica a ordem de execução das tarefas, o cálculo único dos
+resultados compartilhados e a propagação de erros entre dependências.
+"""
+
+import threading
+import unittest
+
+from peopleanalytics.domain.report_dag import ReportDAG
+
+
+class TestReportDAG(unittest.TestCase):
+    """Testes para o ReportDAG"""
+
+    def test_shared_results_computed_once(self):
+        """Testa se cada tarefa roda uma vez e recebe as dependências"""
+        calls = []
+        lock = threading.Lock()
+
+        def task(name, value):
+            def run(**kwargs):
+                with lock:
+                    calls.append(name)
+                return value + sum(kwargs.values())
+
+            return run
+
+        dag = ReportDAG()
+        dag.add("shared", task("shared", 1), ["data"])
+        dag.add("a", task("a", 10), ["shared"])
+        dag.add("b", task("b", 100), ["shared", "data"])
+        dag.add("total", task("total", 0), ["a", "b"])
+        results, errors = dag.run({"data": 5}, max_workers=4)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(sorted(calls), ["a", "b", "shared", "total"])
+        self.assertEqual(calls[0], "shared")
+        self.assertEqual(calls[-1], "total")
+        self.assertEqual(results, {"shared": 6, "a": 16, "b": 111, "total": 127})
+
+    def test_errors(self):
+        """Testa a propagação de erros e as dependências opcionais"""
+
+        def fail():
+            raise KeyError("dados")
+
+        dag = ReportDAG()
+        dag.add("broken", fail)
+        dag.add("ok", lambda: "ok")
+        dag.add("dependent", lambda broken: broken, ["broken"])
+        dag.add("after", lambda dependent: dependent, ["dependent"])
+        dag.add(
+            "summary",
+            lambda ok, broken: [ok, broken],
+            ["ok", "broken"],
+            optional=["broken"],
+        )
+        results, errors = dag.run()
+
+        self.assertEqual(results, {"ok": "ok", "summary": ["ok", None]})
+        self.assertEqual(set(errors), {"broken", "dependent", "after"})
+        self.assertIs(errors["after"], errors["broken"])
+
+        with self.assertRaises(ValueError):
+            dag.add("ok", lambda: None)
+
+        cyclic = ReportDAG()
+        cyclic.add("a", lambda b: b, ["b"])
+        cyclic.add("b", lambda a: a, ["a"])
+        with self.assertRaises(ValueError):
+            cyclic.run()
+
+        unknown = ReportDAG()
+        unknown.add("a", lambda data: data, ["data"])
+        with self.assertRaises(ValueError):
+            unknown.run()
+
+
+if __name__ == "__main__":
+    unittest.main()
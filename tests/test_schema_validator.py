@@ -0,0 +1,103 @@
+"""
+Testes unitários para o validador de esquemas.
+
+Este módulo verifica que o esquema resultado.schema.json é compilado uma vez e
+que todas as violações de um documento são reportadas com o caminho JSON.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics.schema_validator import (
+    SchemaValidator,
+    get_validator,
+    validate_directory,
+)
+
+
+class TestSchemaValidator(unittest.TestCase):
+    """Testes para o SchemaValidator"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.resultado = {
+            "success": True,
+            "status_code": 200,
+            "data": {
+                "conceito_ciclo_filho_descricao": "Bom",
+                "direcionadores": [
+                    {
+                        "direcionador": "Colaboração",
+                        "pergunta_final": False,
+                        "comportamentos": [
+                            {
+                                "comportamento": "Compartilha conhecimento",
+                                "pergunta_final": False,
+                                "avaliacoes_grupo": [
+                                    {
+                                        "avaliador": "gestor",
+                                        "frequencia_colaborador": [0, 1, 2, 1, 0, 0],
+                                        "frequencia_grupo": [0, 1, 1, 1, 1, 0],
+                                    }
+                                ],
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_valid_document(self):
+        """Testa se um documento válido não gera violações"""
+        self.assertEqual(get_validator("resultado").validate(self.resultado), [])
+
+    def test_reports_every_violation_with_path(self):
+        """Testa se todas as violações são reportadas com o caminho JSON"""
+        del self.resultado["status_code"]
+        comportamento = self.resultado["data"]["direcionadores"][0]["comportamentos"][0]
+        avaliacao = comportamento["avaliacoes_grupo"][0]
+        avaliacao["frequencia_grupo"] = [0, 1, 1, 1, 1, 0, 2]
+        avaliacao["frequencia_colaborador"][1] = "1"
+
+        errors = get_validator("resultado").validate(self.resultado)
+        prefix = "$.data.direcionadores[0].comportamentos[0].avaliacoes_grupo[0]"
+
+        self.assertEqual(
+            [error.path for error in errors],
+            [
+                "$",
+                f"{prefix}.frequencia_colaborador[1]",
+                f"{prefix}.frequencia_grupo",
+            ],
+        )
+
+    def test_validate_directory_in_parallel(self):
+        """Testa a validação em lote de um diretório"""
+        for pessoa, resultado in [("pessoa1", self.resultado), ("pessoa2", {})]:
+            directory = Path(self.temp_dir) / pessoa / "2023"
+            directory.mkdir(parents=True)
+            with open(directory / "resultado.json", "w", encoding="utf-8") as f:
+                json.dump(resultado, f)
+
+        invalid = validate_directory(self.temp_dir, workers=2)
+        invalid_file = str(Path(self.temp_dir) / "pessoa2" / "2023" / "resultado.json")
+
+        self.assertEqual(list(invalid), [invalid_file])
+        self.assertEqual(len(invalid[invalid_file]), 3)
+
+    def test_unsupported_keyword_is_rejected(self):
+        """Testa se palavras-chave não suportadas falham na compilação"""
+        with self.assertRaises(ValueError):
+            SchemaValidator({"type": "string", "pattern": "^a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
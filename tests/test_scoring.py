@@ -0,0 +1,124 @@
+"""
+Testes para o cálculo de scores em lote.
+
+Este módulo verifica se calculate_scores produz exatamente os mesmos valores
+de calculate_score e testa o motor de scores. O benchmark das duas versões só
+roda quando PEOPLEANALYTICS_BENCH_VECTORS define o número de vetores; os
+tempos são registrados no log (pytest --log-cli-level=INFO).
+"""
+
+import logging
+import os
+import time
+import unittest
+
+import numpy as np
+
+from peopleanalytics.constants import (
+    calculate_score,
+    calculate_scores,
+    stack_frequencies,
+)
+from peopleanalytics.domain.json_processor import JsonProcessor
+from peopleanalytics.scoring_engine import ScoringEngine
+
+BENCH_VECTORS = os.environ.get("PEOPLEANALYTICS_BENCH_VECTORS")
+
+logger = logging.getLogger(__name__)
+
+
+def _random_vectors(count, seed=0):
+    """Cria vetores de frequência aleatórios, incluindo vetores zerados"""
+    rng = np.random.default_rng(seed)
+    vectors = rng.integers(0, 12, size=(count, 6))
+    vectors[rng.random(count) < 0.1, 1:] = 0
+    return vectors.tolist()
+
+
+class TestCalculateScores(unittest.TestCase):
+    """Testes para calculate_scores"""
+
+    def test_matches_scalar_scores(self):
+        """Testa se os scores em lote são idênticos aos escalares"""
+        vectors = _random_vectors(5000) + [[0.5, 1.25, 3.3, 0.1, 2.7, 9.9]]
+        matrix, valid = stack_frequencies(vectors)
+        self.assertTrue(valid.all())
+
+        for model, use_nps_model in (("nps", True), ("traditional", False)):
+            for normalize in (False, True):
+                expected = [
+                    calculate_score(vector, use_nps_model, normalize)
+                    for vector in vectors
+                ]
+                self.assertEqual(
+                    calculate_scores(matrix, model, normalize).tolist(), expected
+                )
+
+    def test_invalid_input(self):
+        """Testa a rejeição de matrizes e vetores inválidos"""
+        with self.assertRaises(ValueError):
+            calculate_scores(np.zeros((3, 5)))
+        with self.assertRaises(ValueError):
+            calculate_scores(np.zeros((3, 6)), model="linear")
+        self.assertEqual(calculate_scores(np.zeros((0, 6))).shape, (0,))
+
+        _, valid = stack_frequencies([[0, 1, 2, 3, 4, 5], [1, 2], None, ["a"] * 6])
+        self.assertEqual(valid.tolist(), [True, False, False, False])
+
+    @unittest.skipUnless(BENCH_VECTORS, "defina PEOPLEANALYTICS_BENCH_VECTORS")
+    def test_benchmark(self):
+        """Mede o tempo da versão escalar e da versão em lote"""
+        vectors = _random_vectors(int(BENCH_VECTORS), seed=1)
+
+        start = time.perf_counter()
+        expected = [calculate_score(vector, False) for vector in vectors]
+        scalar_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        matrix, _ = stack_frequencies(vectors)
+        scores = calculate_scores(matrix, "traditional")
+        batch_time = time.perf_counter() - start
+
+        logger.info(
+            "%d vetores: escalar %.3fs, lote %.3fs",
+            len(vectors),
+            scalar_time,
+            batch_time,
+        )
+        self.assertEqual(scores.tolist(), expected)
+
+
+class TestScoringEngine(unittest.TestCase):
+    """Testes para o motor de scores unificado"""
+
+    def test_models_of_a_vector(self):
+        """Testa os modelos calculados para um único vetor"""
+        engine = ScoringEngine()
+        vector = [0, 1, 2, 1, 0, 0]
+
+        self.assertEqual(engine.score(vector, "traditional"), 3.375)
+        self.assertEqual(engine.score(vector, "nps"), calculate_score(vector))
+        self.assertEqual(engine.score(vector, "global"), 4.0)
+        self.assertEqual(engine.score(vector, "normalized"), 85.0)
+        self.assertEqual(engine.score(vector, "index_mean"), 2.0)
+        self.assertEqual(engine.score([0] * 6, "global"), 0.0)
+
+        with self.assertRaises(ValueError):
+            engine.score([0, 1, 2], "global")
+        with self.assertRaises(ValueError):
+            engine.score(vector, "linear")
+
+        scores = engine.score_matrix(np.array([vector, [0] * 6]), ["normalized"])
+        self.assertEqual(list(scores), ["normalized"])
+        self.assertEqual(scores["normalized"].tolist(), [85.0, 0.0])
+
+    def test_global_scores_accept_short_vectors(self):
+        """Testa se calculate_global_scores aceita vetores com menos de 6 valores"""
+        scores = JsonProcessor().calculate_global_scores([0, 1, 2], [0, 1, 2, 1])
+
+        self.assertEqual(scores["colab_score"], 1 / 3 * 5 + 2 / 3 * 4)
+        self.assertEqual(scores["group_score"], 1 / 4 * 5 + 2 / 4 * 4 + 1 / 4 * 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Testes para as análises estatísticas em lote.
+
+Este módulo verifica se as versões em lote do StatisticalAnalyzer produzem os
+mesmos resultados das versões que analisam um comportamento por vez.
+"""
+
+import unittest
+import warnings
+
+import numpy as np
+from scipy import stats
+
+from peopleanalytics.domain.statistical_analyzer import StatisticalAnalyzer
+
+
+def _pairs(count, seed=0):
+    """Cria pares de distribuições aleatórias, incluindo casos extremos"""
+    rng = np.random.default_rng(seed)
+    individual = rng.integers(0, 40, size=(count, 6)).tolist()
+    group = rng.integers(0, 40, size=(count, 6)).tolist()
+    individual += [[0] * 6, [5] * 6, [0.5, 1.2, 3.3, 0, 0, 1]]
+    group += [[0] * 6, [5] * 6, [1.5, 0.2, 3.3, 9, 0, 1]]
+    return individual, group
+
+
+class TestStatisticalAnalyzerBatch(unittest.TestCase):
+    """Testes para as análises em lote"""
+
+    def setUp(self):
+        self.analyzer = StatisticalAnalyzer()
+        self.individual, self.group = _pairs(500)
+
+    def assertSameAnalysis(self, batch, scalar, path="analysis"):
+        """Compara duas análises, tolerando arredondamento nos p-valores"""
+        if isinstance(scalar, dict):
+            self.assertEqual(batch.keys(), scalar.keys(), path)
+            for key in scalar:
+                self.assertSameAnalysis(batch[key], scalar[key], f"{path}.{key}")
+        elif isinstance(scalar, (list, str)) or scalar is None:
+            self.assertEqual(batch, scalar, path)
+        elif np.isnan(scalar):
+            self.assertTrue(np.isnan(batch), path)
+        elif path.endswith("p_value"):
+            self.assertAlmostEqual(batch, scalar, places=12, msg=path)
+        else:
+            self.assertEqual(batch, scalar, path)
+
+    def test_analyze_distributions_batch(self):
+        """Testa se a análise em lote é igual à análise por comportamento"""
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            expected = [
+                self.analyzer.analyze_distributions(individual, group)
+                for individual, group in zip(self.individual, self.group)
+            ]
+            results = self.analyzer.analyze_distributions_batch(
+                self.individual, self.group
+            )
+
+        self.assertEqual(len(results), len(expected))
+        for batch, scalar in zip(results, expected):
+            self.assertSameAnalysis(batch, scalar)
+        self.assertEqual(self.analyzer.analyze_distributions_batch([], []), [])
+
+    def test_z_scores_batch(self):
+        """Testa os z-scores em lote, com zero quando o grupo não varia"""
+        z_scores = self.analyzer.calculate_z_scores_batch(self.individual, self.group)
+
+        self.assertEqual(z_scores.shape, (len(self.individual), 6))
+        for row, individual, group in zip(z_scores, self.individual, self.group):
+            expected = self.analyzer.calculate_z_scores(individual, group)
+            self.assertEqual(row.tolist(), list(expected.values()))
+
+    def test_adjust_p_values(self):
+        """Testa a correção de Benjamini-Hochberg dos p-valores"""
+        p_values = [0.01, 0.04, 0.03, 0.2, 0.005]
+        adjusted = self.analyzer.adjust_p_values(p_values)
+        np.testing.assert_allclose(
+            adjusted, stats.false_discovery_control(p_values), rtol=1e-12
+        )
+        self.assertTrue((adjusted >= np.array(p_values)).all())
+
+        # P-valores NaN não contam como testes
+        adjusted = self.analyzer.adjust_p_values([0.01, np.nan, 0.04])
+        self.assertTrue(np.isnan(adjusted[1]))
+        self.assertEqual(adjusted[[0, 2]].tolist(), [0.02, 0.04])
+        self.assertEqual(self.analyzer.adjust_p_values([]).shape, (0,))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            results = self.analyzer.run_significance_test_batch(
+                self.individual, self.group, correct=True
+            )
+        self.assertEqual(
+            results["is_significant"].tolist(),
+            (results["p_value_adjusted"] < 0.05).tolist(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -234,6 +234,31 @@ class TestDataSync(unittest.TestCase):
         self.assertEqual(len(valid_dirs), 1)
         self.assertEqual(valid_dirs[0], self.data_dir / "pessoa1" / "2022")
 
+    def test_discover_work_items_with_patterns(self):
+        """Testa a descoberta em uma única passada com padrões de inclusão/exclusão"""
+        work_items = self.sync._discover_work_items()
+
+        self.assertIsInstance(work_items, tuple)
+        pessoa2 = [item for item in work_items if item.pessoa == "pessoa2"][0]
+        self.assertEqual(
+            [entry.path.name for entry in pessoa2.files],
+            ["resultado.json", "resultado.yaml"],
+        )
+        self.assertEqual(
+            pessoa2.files[0].size,
+            (self.data_dir / "pessoa2" / "2023" / "resultado.json").stat().st_size,
+        )
+
+        # Excluir arquivos YAML e todo o diretório pessoa1/2022
+        self.sync.exclude_patterns = ["*.yaml", "pessoa1/2022/*"]
+        work_items = self.sync._discover_work_items()
+
+        self.assertEqual(
+            [(item.pessoa, item.ano) for item in work_items],
+            [("pessoa1", "2023"), ("pessoa2", "2023")],
+        )
+        self.assertEqual(len(work_items[1].files), 1)
+
     def test_format_filtering(self):
         """Testa o filtro de formatos de arquivo"""
         # Configurar filtro de formato para apenas JSON
@@ -402,6 +427,10 @@ class TestDataSync(unittest.TestCase):
         args.ano = None
         args.export_excel = True
         args.verbose = True
+        args.watch = False
+        args.shard = None
+        args.merge = None
+        args.io_concurrency = 0
 
         # Criar e executar o comando
         command = SyncCommand()
@@ -0,0 +1,118 @@
+"""
+Testes unitários para o manifesto de sincronização incremental.
+
+Este módulo verifica a detecção de diretórios pessoa/ano alterados e o
+reaproveitamento das saídas em cache pelo SyncManifest.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics.cli_commands.sync_commands import DataSync
+from peopleanalytics.sync_manifest import SyncManifest
+
+
+class TestSyncManifest(unittest.TestCase):
+    """Testes para o SyncManifest"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.directory = Path(self.temp_dir) / "data" / "pessoa1" / "2023"
+        self.directory.mkdir(parents=True)
+        self.resultado = self.directory / "resultado.json"
+        self.resultado.write_text(json.dumps({"data": {"valor": 1}}))
+        (self.directory / "perfil.json").write_text(json.dumps({"cargo": "Dev"}))
+        self.manifest_dir = Path(self.temp_dir) / ".sync"
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def _record(self, output):
+        """Registra o diretório no manifesto e o salva em disco"""
+        manifest = SyncManifest(self.manifest_dir)
+        files = SyncManifest.tracked_files(self.directory, [self.resultado])
+        manifest.record("pessoa1", "2023", self.directory, files, output)
+        manifest.save()
+
+    def _is_unchanged(self):
+        """Verifica o diretório com um manifesto recarregado do disco"""
+        manifest = SyncManifest(self.manifest_dir)
+        files = SyncManifest.tracked_files(self.directory, [self.resultado])
+        return manifest.is_unchanged("pessoa1", "2023", files)
+
+    def test_unchanged_directory_is_skipped(self):
+        """Testa que um diretório sem alterações reaproveita a saída em cache"""
+        self._record({"pessoa": "pessoa1"})
+
+        self.assertTrue(self._is_unchanged())
+        manifest = SyncManifest(self.manifest_dir)
+        self.assertEqual(manifest.load_output("pessoa1", "2023"), {"pessoa": "pessoa1"})
+
+    def test_touched_file_with_same_content_is_unchanged(self):
+        """Testa que alterar apenas o mtime não força reprocessamento"""
+        self._record({})
+        stat = self.resultado.stat()
+        os.utime(self.resultado, (stat.st_atime, stat.st_mtime + 10))
+
+        self.assertTrue(self._is_unchanged())
+
+    def test_modified_profile_is_detected(self):
+        """Testa que alterações no perfil.json invalidam o diretório"""
+        self._record({})
+        (self.directory / "perfil.json").write_text(json.dumps({"cargo": "Lead"}))
+
+        self.assertFalse(self._is_unchanged())
+
+    def test_new_result_file_is_detected(self):
+        """Testa que um novo arquivo resultado.* invalida o diretório"""
+        self._record({})
+        extra = self.directory / "resultado.csv"
+        extra.write_text("a,b\n1,2\n")
+
+        manifest = SyncManifest(self.manifest_dir)
+        files = SyncManifest.tracked_files(self.directory, [self.resultado, extra])
+        self.assertFalse(manifest.is_unchanged("pessoa1", "2023", files))
+
+    def test_forget_missing_removes_cached_output(self):
+        """Testa que diretórios removidos saem do manifesto"""
+        self._record({})
+        manifest = SyncManifest(self.manifest_dir)
+
+        self.assertEqual(manifest.forget_missing([]), 1)
+        self.assertIsNone(manifest.load_output("pessoa1", "2023"))
+
+    def test_batched_sync_keeps_only_summaries(self):
+        """Testa que o processamento em lotes grava as saídas e mantém resumos"""
+        self.resultado.write_text(
+            json.dumps({"success": True, "data": {"direcionadores": []}})
+        )
+        output_dir = Path(self.temp_dir) / "output"
+        sync = DataSync(
+            data_dir=Path(self.temp_dir) / "data",
+            output_dir=output_dir,
+            batch_size=1,
+            use_parallel=False,
+            incremental=False,
+            generate_visualizations=False,
+            generate_dashboard=False,
+            generate_zip=False,
+            generate_excel=False,
+        )
+        sync.sync()
+
+        summary = sync.processed_data["pessoa1"]["2023"]
+        self.assertEqual(summary["evaluation"]["direcionadores"], 0)
+        self.assertNotIn("data", summary)
+        manifest = SyncManifest(output_dir / ".sync")
+        self.assertIn("data", manifest.load_output("pessoa1", "2023"))
+        self.assertEqual(manifest.load_summary("pessoa1", "2023"), summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
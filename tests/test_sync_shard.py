@@ -0,0 +1,80 @@
+"""
+Testes unitários para o sync particionado.
+
+Este módulo verifica a atribuição estável de pessoas a partições e a
+combinação dos artefatos das partições pelo passo de merge.
+"""
+
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from peopleanalytics.cli_commands.sync_commands import DataSync
+from peopleanalytics.sync_shard import parse_shard, shard_of
+
+
+class TestSyncShard(unittest.TestCase):
+    """Testes para o sync com --shard e --merge"""
+
+    def setUp(self):
+        """Configura um diretório de dados com várias pessoas"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.data_dir = self.temp_dir / "data"
+        self.output_dir = self.temp_dir / "output"
+        for index in range(6):
+            directory = self.data_dir / f"pessoa{index}" / "2023"
+            directory.mkdir(parents=True)
+            (directory / "resultado.json").write_text(
+                json.dumps({"data": {"indice": index}})
+            )
+
+    def tearDown(self):
+        """Remove os arquivos temporários"""
+        shutil.rmtree(self.temp_dir)
+
+    def _data_sync(self, **kwargs):
+        """Cria um DataSync sem relatórios agregados"""
+        return DataSync(
+            data_dir=self.data_dir,
+            output_dir=self.output_dir,
+            use_parallel=False,
+            generate_9box=False,
+            generate_career_sim=False,
+            generate_network=False,
+            **kwargs,
+        )
+
+    def test_parse_shard(self):
+        """Testa a leitura e validação da especificação i/N"""
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for spec in ("0/4", "5/4", "1", "a/b"):
+            with self.assertRaises(ValueError):
+                parse_shard(spec)
+        self.assertEqual(shard_of("pessoa0", 3), shard_of("pessoa0", 3))
+
+    def test_merge_matches_unsharded_sync(self):
+        """Testa que o merge das partições equivale a um sync sem partições"""
+        full = self._data_sync(incremental=False)
+        full.sync()
+
+        # Partições executadas fora de ordem
+        for index in (3, 1, 2):
+            self._data_sync(shard=f"{index}/3").sync()
+
+        merged = self._data_sync()
+        self.assertTrue(merged.merge_shards())
+        self.assertEqual(merged.processed_data, full.processed_data)
+        self.assertEqual(list(merged.processed_data), sorted(full.processed_data))
+
+    def test_merge_requires_every_shard(self):
+        """Testa que o merge falha quando falta o artefato de uma partição"""
+        self._data_sync(shard="1/2").sync()
+
+        with self.assertRaises(FileNotFoundError):
+            self._data_sync().merge_shards()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Testes unitários para o modo de observação do sync.
+
+Este módulo verifica a detecção de diretórios pessoa/ano alterados ou removidos
+e o agrupamento de rajadas de escrita pelo SyncWatcher.
+"""
+
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+from peopleanalytics.cli_commands.sync_commands import DataSync
+from peopleanalytics.sync_discovery import SyncFile, WorkItem
+from peopleanalytics.sync_watch import SyncWatcher, diff_snapshots, snapshot
+
+
+def _item(pessoa, mtime):
+    """Cria um WorkItem com um único resultado.json"""
+    path = Path("data") / pessoa / "2023"
+    return WorkItem(
+        pessoa, "2023", str(path), (SyncFile(path / "resultado.json", 10, mtime),)
+    )
+
+
+class TestSyncWatch(unittest.TestCase):
+    """Testes para o SyncWatcher"""
+
+    def test_diff_snapshots(self):
+        """Testa a detecção de diretórios novos, alterados e removidos"""
+        previous = snapshot([_item("ana", 1.0), _item("bia", 1.0)])
+        current = snapshot([_item("ana", 2.0), _item("caio", 1.0)])
+
+        changed, removed = diff_snapshots(previous, current)
+
+        self.assertEqual([item.pessoa for item in changed], ["ana", "caio"])
+        self.assertEqual(removed, [("bia", "2023")])
+
+    def test_burst_of_writes_is_debounced(self):
+        """Testa que várias escritas seguidas geram uma única ressincronização"""
+        states = [
+            [_item("ana", 2.0)],
+            [_item("ana", 3.0)],
+            [_item("ana", 4.0)],
+        ]
+        calls = []
+
+        def discover():
+            return states.pop(0) if len(states) > 1 else states[0]
+
+        watcher = SyncWatcher(
+            discover,
+            lambda items, changed, removed: calls.append(changed),
+            interval=0.01,
+            debounce=0.05,
+            use_inotify=False,
+        )
+        watcher.run(baseline=[_item("ana", 1.0)], max_cycles=30)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0][0].files[0].mtime, 4.0)
+
+    def test_watch_starting_on_empty_tree(self):
+        """Testa que um diretório criado após iniciar a observação é sincronizado"""
+        temp_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, temp_dir)
+        data_dir = temp_dir / "data"
+        data_dir.mkdir()
+        sync = DataSync(
+            data_dir=data_dir,
+            output_dir=temp_dir / "output",
+            use_parallel=False,
+            generate_visualizations=False,
+            generate_dashboard=False,
+            generate_zip=False,
+            generate_excel=False,
+            generate_9box=False,
+            generate_career_sim=False,
+            generate_network=False,
+        )
+
+        def add_directory():
+            time.sleep(0.2)
+            directory = data_dir / "ana" / "2023"
+            directory.mkdir(parents=True)
+            (directory / "resultado.json").write_text(json.dumps({"data": {}}))
+
+        writer = threading.Thread(target=add_directory)
+        writer.start()
+        sync.watch(interval=0.05, debounce=0.1, max_cycles=40)
+        writer.join()
+
+        self.assertEqual(sync.processed_data, {"ana": {"2023": {"data": {}}}})
+        self.assertEqual(sync.errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
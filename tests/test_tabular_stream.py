@@ -0,0 +1,67 @@
+"""
+Testes unitários para a leitura em streaming de arquivos tabulares.
+
+Este módulo verifica que a leitura em blocos de CSV e Excel produz os mesmos
+dados do pandas, com tipos de coluna compactos.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from peopleanalytics import tabular_stream
+
+
+class TestTabularStream(unittest.TestCase):
+    """Testes para o tabular_stream"""
+
+    def setUp(self):
+        """Configuração inicial para cada teste"""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.df = pd.DataFrame(
+            {
+                "pessoa": ["ana", "bia", "caio", "ana", "bia"] * 20,
+                "ano": [2022, 2023] * 50,
+                "nota": [0.5, 1.5, 2.5, 3.5] * 25,
+            }
+        )
+
+    def tearDown(self):
+        """Limpeza após cada teste"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_csv_chunks_match_pandas(self):
+        """Testa se a leitura em blocos do CSV preserva os dados"""
+        csv_file = self.temp_dir / "resultado.csv"
+        self.df.to_csv(csv_file, index=False)
+
+        result = tabular_stream.read_csv(csv_file, chunk_rows=7)
+
+        pd.testing.assert_frame_equal(
+            result, pd.read_csv(csv_file), check_dtype=False, check_categorical=False
+        )
+        self.assertIsInstance(result["pessoa"].dtype, pd.CategoricalDtype)
+        self.assertEqual(result["ano"].dtype, "int16")
+
+    def test_excel_read_only_matches_pandas(self):
+        """Testa se a leitura do Excel em modo somente leitura preserva as planilhas"""
+        excel_file = self.temp_dir / "resultado.xlsx"
+        with pd.ExcelWriter(excel_file) as writer:
+            self.df.to_excel(writer, sheet_name="Competências", index=False)
+            self.df.head(3).to_excel(writer, sheet_name="Pontuação", index=False)
+
+        result = tabular_stream.read_excel(excel_file, chunk_rows=7)
+        expected = pd.read_excel(excel_file, sheet_name=None)
+
+        self.assertEqual(list(result), list(expected))
+        for sheet_name, df in expected.items():
+            pd.testing.assert_frame_equal(
+                result[sheet_name], df, check_dtype=False, check_categorical=False
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+Testes de memória para os registros de desenvolvimento de talentos.
+
+Este arquivo verifica que os registros não têm __dict__ por instância. A
+comparação de memória com dataclasses equivalentes com __dict__ só roda quando
+PEOPLEANALYTICS_BENCH_RECORDS define o número de relações de influência; os
+tamanhos são registrados no log (pytest --log-cli-level=INFO).
+"""
+
+import dataclasses
+import datetime
+import logging
+import os
+import pickle
+import tracemalloc
+import unittest
+
+from peopleanalytics.talent_development.feedback_cycle.integrated_cycle import (
+    CompetencyAssessment,
+    FeedbackItem,
+)
+from peopleanalytics.talent_development.influence_network.impact_multiplier import (
+    TeamOutcome,
+)
+from peopleanalytics.talent_development.influence_network.knowledge_diffusion import (
+    KnowledgeTransfer,
+)
+from peopleanalytics.talent_development.influence_network.network_analyzer import (
+    InfluenceRelation,
+)
+from peopleanalytics.talent_development.influence_network.social_capital import (
+    Collaboration,
+)
+from peopleanalytics.talent_development.matrix_9box.dynamic_matrix import (
+    MatrixPosition,
+)
+from peopleanalytics.talent_development.predictive.performance_predictor import (
+    PerformanceMetric,
+)
+
+RECORD_TYPES = (
+    FeedbackItem,
+    CompetencyAssessment,
+    MatrixPosition,
+    InfluenceRelation,
+    PerformanceMetric,
+    TeamOutcome,
+    Collaboration,
+    KnowledgeTransfer,
+)
+
+BENCH_RECORDS = os.environ.get("PEOPLEANALYTICS_BENCH_RECORDS")
+
+logger = logging.getLogger(__name__)
+
+
+def _dict_twin(record_type):
+    """Cria uma dataclass comum com os mesmos campos do registro"""
+    return dataclasses.make_dataclass(
+        record_type.__name__,
+        [field.name for field in dataclasses.fields(record_type)],
+    )
+
+
+def _bytes_per_instance(record_type, count):
+    """Mede a memória alocada por instância ao criar count registros"""
+    # Valores compartilhados, para medir só o custo das instâncias
+    values = [index for index, _ in enumerate(dataclasses.fields(record_type))]
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        records = [record_type(*values) for _ in range(count)]
+        allocated = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del records
+    return allocated / count
+
+
+class TestTalentRecords(unittest.TestCase):
+    """Testes para os registros compactos de desenvolvimento de talentos"""
+
+    def test_records_have_no_instance_dict(self):
+        """Testa se os registros mantêm os campos sem __dict__ por instância"""
+        relation = InfluenceRelation(
+            "ana", "bia", 0.8, "mentor", ["conhecimento"], datetime.datetime.now(), {}
+        )
+
+        self.assertFalse(hasattr(relation, "__dict__"))
+        self.assertEqual(relation.weight, 0.8)
+        self.assertEqual(pickle.loads(pickle.dumps(relation)), relation)
+        with self.assertRaises(AttributeError):
+            relation.extra = True
+
+    @unittest.skipUnless(BENCH_RECORDS, "defina PEOPLEANALYTICS_BENCH_RECORDS")
+    def test_per_instance_memory(self):
+        """Compara a memória por instância antes e depois de __slots__"""
+        records = int(BENCH_RECORDS)
+        for record_type in RECORD_TYPES:
+            count = records if record_type is InfluenceRelation else 20_000
+            count = min(count, records)
+            before = _bytes_per_instance(_dict_twin(record_type), count)
+            after = _bytes_per_instance(record_type, count)
+            logger.info(
+                "%s: %.1f B -> %.1f B por instância em %d registros",
+                record_type.__name__,
+                before,
+                after,
+                count,
+            )
+            self.assertLess(after, before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Testes unitários para o vocabulário de rótulos.
+
+Este módulo verifica o compartilhamento dos rótulos entre documentos e a
+codificação das colunas de rótulos como categóricas.
+"""
+
+import json
+import unittest
+
+import pandas as pd
+
+from peopleanalytics.domain.json_processor import JsonProcessor
+from peopleanalytics.vocabulary import categorize_labels, intern_document
+
+
+def _document(direcionador="Entregar resultados", avaliador="Gestor"):
+    """Cria um documento resultado.json com um comportamento"""
+    return {
+        "data": {
+            "conceito_ciclo_filho_descricao": "Supera as expectativas",
+            "direcionadores": [
+                {
+                    "direcionador": direcionador,
+                    "comportamentos": [
+                        {
+                            "comportamento": "Prioriza o que gera mais valor",
+                            "avaliacoes_grupo": [
+                                {
+                                    "avaliador": avaliador,
+                                    "frequencia_colaborador": [0, 1, 2, 3, 4, 5],
+                                    "frequencia_grupo": [1, 1, 1, 1, 1, 1],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+    }
+
+
+class TestVocabulary(unittest.TestCase):
+    """Testes para o vocabulário de rótulos"""
+
+    def test_documents_share_labels(self):
+        """Testa se documentos carregados separadamente compartilham os rótulos"""
+        first = intern_document(json.loads(json.dumps(_document())))
+        second = intern_document(json.loads(json.dumps(_document())))
+
+        first_direcionador = first["data"]["direcionadores"][0]
+        second_direcionador = second["data"]["direcionadores"][0]
+        self.assertIs(
+            first_direcionador["direcionador"], second_direcionador["direcionador"]
+        )
+        self.assertIs(
+            first_direcionador["comportamentos"][0]["avaliacoes_grupo"][0]["avaliador"],
+            second_direcionador["comportamentos"][0]["avaliacoes_grupo"][0][
+                "avaliador"
+            ],
+        )
+
+        extracted = JsonProcessor().extract_evaluation_data(
+            json.loads(json.dumps(_document()))
+        )
+        self.assertIs(
+            extracted["conceito"], first["data"]["conceito_ciclo_filho_descricao"]
+        )
+
+    def test_categorize_labels(self):
+        """Testa se as colunas de rótulos viram categóricas sem mudar os valores"""
+        values = ["Pessoas", "Entregar resultados", None, "Cliente"] * 1000
+        df = pd.DataFrame({"direcionador": values, "nota": range(len(values))}).astype(
+            {"direcionador": object}
+        )
+        before = df.memory_usage(deep=True)["direcionador"]
+
+        categorize_labels(df)
+
+        self.assertIsInstance(df["direcionador"].dtype, pd.CategoricalDtype)
+        self.assertEqual(
+            df["direcionador"]
+            .astype(object)
+            .where(df["direcionador"].notna(), None)
+            .tolist(),
+            values,
+        )
+        self.assertLess(df.memory_usage(deep=True)["direcionador"], before / 4)
+
+        # A ordenação e os grupos seguem a ordem alfabética dos rótulos
+        grouped = df.groupby("direcionador", observed=True)["nota"].count()
+        self.assertEqual(
+            grouped.index.tolist(), ["Cliente", "Entregar resultados", "Pessoas"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()